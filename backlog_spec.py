@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Declarative backlog spec for the Shadowed Realms issue creators
+backlog_spec.json holds every section of the backlog as runs of ISSUE numbers
+instead of hand-written lists: a run is {"first", "last", field: value ...},
+where string fields may use {n} (the ISSUE number) and {k} (1-based position
+in the run), or {"first", "items": [...]} for runs of one-off issues numbered
+from "first". Fields of a run apply to each of its items
+The spec is compiled once into run generators, so records are produced lazily
+in ISSUE order and a 100k-issue backlog never has to sit in memory
+
+Usage: python3 backlog_spec.py [section ...]   (default: every section)
+"""
+
+import os
+import sys
+import json
+import string
+from itertools import islice
+from typing import List, Dict, Iterator, Callable, Optional
+
+BACKLOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backlog_spec.json')
+
+# Keys that shape a run rather than becoming record fields
+RUN_KEYS = ('description', 'first', 'last', 'items')
+
+def load_backlog(path: str = BACKLOG_PATH) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def is_template(value) -> bool:
+    return isinstance(value, str) and any(name for _, name, _, _ in string.Formatter().parse(value))
+
+def run_size(run: Dict) -> int:
+    if 'items' in run:
+        return len(run['items'])
+    return run['last'] - run['first'] + 1
+
+def compile_run(run: Dict) -> Callable[[int, int], Iterator[Dict]]:
+    """Generator factory yielding the records at run positions [skip, count)"""
+    fields = {key: value for key, value in run.items() if key not in RUN_KEYS}
+    constants = {key: value for key, value in fields.items() if not is_template(value)}
+    templates = [(key, value.format) for key, value in fields.items() if is_template(value)]
+    first = run['first']
+
+    if 'items' in run:
+        items = run['items']
+
+        def records(skip: int, count: int) -> Iterator[Dict]:
+            for offset, item in enumerate(islice(items, skip, count), skip):
+                n = first + offset
+                record = {'num': n, **constants}
+                for key, render in templates:
+                    record[key] = render(n=n, k=offset + 1)
+                record.update(item)
+                yield record
+        return records
+
+    def records(skip: int, count: int) -> Iterator[Dict]:
+        for n in range(first + skip, first + count):
+            record = {'num': n, **constants}
+            for key, render in templates:
+                record[key] = render(n=n, k=n - first + 1)
+            yield record
+    return records
+
+class Backlog:
+    """Compiled backlog spec: lazy records per section, sized without generating"""
+
+    def __init__(self, spec: Optional[Dict] = None):
+        spec = spec if spec is not None else load_backlog()
+        self.sections, self.spec_runs = {}, {}
+        for name, section in spec.items():
+            runs = self.spec_runs[name] = sorted(section['runs'], key=lambda run: run['first'])
+            self.sections[name] = [(run['first'], run['first'] + run_size(run) - 1, compile_run(run))
+                                   for run in runs]
+
+    def check(self, names: List[str]):
+        unknown = [name for name in names if name not in self.sections]
+        if unknown:
+            raise ValueError(f"unknown backlog section(s): {', '.join(unknown)} "
+                             f"(available: {', '.join(self.sections)})")
+
+    def runs(self, name: str) -> List[Dict]:
+        """Raw runs of a section, sorted by their first ISSUE number"""
+        self.check([name])
+        return self.spec_runs[name]
+
+    def records(self, *names: str, start: Optional[int] = None,
+                stop: Optional[int] = None) -> Iterator[Dict]:
+        """Issue records of the named sections (every section when none), in
+        section order and ISSUE order within each; `start` / `stop` bound the
+        ISSUE numbers (inclusive) and skip whole runs outside them"""
+        self.check(names)
+        for name in names or self.sections:
+            for first, last, records in self.sections[name]:
+                if (start is not None and last < start) or (stop is not None and first > stop):
+                    continue
+                skip = max(0, start - first) if start is not None else 0
+                count = (min(last, stop) if stop is not None else last) - first + 1
+                yield from records(skip, count)
+
+    def size(self, *names: str) -> int:
+        """Number of records in the named sections, without generating them"""
+        self.check(names)
+        return sum(last - first + 1 for name in names or self.sections
+                   for first, last, _ in self.sections[name])
+
+    def contains(self, name: str, issue_num: int) -> bool:
+        self.check([name])
+        return any(first <= issue_num <= last for first, last, _ in self.sections[name])
+
+_backlog = None
+
+def get_backlog() -> Backlog:
+    """The repository's backlog spec, compiled once per process"""
+    global _backlog
+    if _backlog is None:
+        _backlog = Backlog()
+    return _backlog
+
+def issue_records(*names: str, start: Optional[int] = None, stop: Optional[int] = None) -> Iterator[Dict]:
+    return get_backlog().records(*names, start=start, stop=stop)
+
+def section_size(*names: str) -> int:
+    return get_backlog().size(*names)
+
+def pending_count(name: str, existing) -> int:
+    """Records of a section whose ISSUE number is not in `existing`"""
+    backlog = get_backlog()
+    return backlog.size(name) - sum(1 for issue_num in existing if backlog.contains(name, issue_num))
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Backlog Spec")
+    print("=" * 60)
+
+    backlog = get_backlog()
+    names = sys.argv[1:]
+    try:
+        backlog.check(names)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    for name in names or backlog.sections:
+        xp = coins = 0
+        for record in backlog.records(name):
+            xp += record.get('xp', 0)
+            coins += record.get('coins', 0)
+        runs = backlog.sections[name]
+        print(f"\n{name}: {backlog.size(name)} issues in {len(runs)} runs "
+              f"(ISSUE {runs[0][0]} to {runs[-1][1]})")
+        if xp or coins:
+            print(f"  XP: {xp:,}, Coins: {coins:,}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Precompiled issue-body templates for the Shadowed Realms creators
+A body layout is a sequence of sections written once as str.format text with
+plain {field} / {field:spec} placeholders; compiling turns the whole layout
+into one f-string function, and shared sections are memoized per distinct
+field values - so the blocks repeated across hundreds of issues (value
+explanations, acceptance criteria, footers) are rendered once per run instead
+of once per issue, and no template text is parsed while rendering
+Set BODY_WORKERS=N to build very large backlogs in N worker processes
+"""
+
+import os
+import re
+import string
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Union, Optional, Sequence, Iterable, Iterator, Callable
+
+BODY_WORKERS = int(os.getenv('BODY_WORKERS', '0'))
+
+# Distinct renders kept per shared section before its cache starts over
+MEMO_SIZE = 4096
+
+# Records handed to the worker pool at a time, so streamed backlogs stay bounded
+POOL_CHUNK = 2000
+
+# Placeholder name used while compiling a layout for a shared section's output
+CALL = 'call_'
+
+# Format specs allowed after a field name, e.g. {issue_num:04d} or {progress:.1f}
+SPEC = re.compile(r'^[\w.,<>^=+\- #%]*$')
+
+def parse_template(text: str) -> List[Tuple[str, Optional[str], str]]:
+    """(literal, field, spec) triples of a section's text"""
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(text):
+        if field is not None and (conversion or not field.isidentifier() or not SPEC.match(spec or '')):
+            raise ValueError(f"template fields must be plain names with simple specs, got {{{field}}}")
+        parts.append((literal, field, spec or ''))
+    return parts
+
+def compile_template(text: str, calls: Sequence[Callable] = ()) -> Callable[[Dict], str]:
+    """Compile section text into one f-string function of a context dict
+
+    Literals are passed in as constants, so nothing in the text needs escaping;
+    a {call_} field calls the next function of `calls` with the context instead.
+    """
+    namespace, pieces = {}, []
+    calls = iter(calls)
+    for literal, field, spec in parse_template(text):
+        if literal:
+            name = f'_l{len(namespace)}'
+            namespace[name] = literal
+            pieces.append('{' + name + '}')
+        if field is None:
+            continue
+        if field == CALL:
+            name = f'_c{len(namespace)}'
+            namespace[name] = next(calls)
+            pieces.append('{' + name + '(c)}')
+        else:
+            pieces.append('{c[' + repr(field) + ']' + (':' + spec if spec else '') + '}')
+    return eval('lambda c: f' + repr(''.join(pieces)), namespace)
+
+def template_fields(text: str) -> Tuple[str, ...]:
+    """Field names a section uses, in order of first use"""
+    return tuple(dict.fromkeys(field for _, field, _ in parse_template(text) if field is not None))
+
+class Section:
+    """One block of a body layout; shared blocks cache their output per field values"""
+
+    def __init__(self, text: str, shared: bool = False):
+        self.text = text
+        self.fields = template_fields(text)
+        self.shared = shared and bool(self.fields)
+        self.format = compile_template(text)
+        self.key = eval('lambda c: (' + ''.join(f'c[{field!r}], ' for field in self.fields) + ')')
+        self.memo: Dict[tuple, str] = {}
+
+    def render(self, context: Dict) -> str:
+        if not self.shared:
+            return self.format(context)
+        key = self.key(context)
+        text = self.memo.get(key)
+        if text is None:
+            if len(self.memo) >= MEMO_SIZE:
+                self.memo.clear()
+            text = self.memo[key] = self.format(context)
+        return text
+
+def shared(text: str) -> Section:
+    """A section repeated across many issues, rendered once per distinct values"""
+    return Section(text, shared=True)
+
+class BodyTemplate:
+    """Body layout compiled once into a single f-string function
+
+    Plain sections are inlined into it; shared sections are called from it and
+    answer from their cache once they have seen a combination of values.
+    """
+
+    def __init__(self, *sections: Union[str, Section]):
+        text, calls = '', []
+        for section in sections:
+            if isinstance(section, Section) and section.shared:
+                text += '{' + CALL + '}'
+                calls.append(section.render)
+            else:
+                text += section.text if isinstance(section, Section) else section
+        self.sections = sections
+        self.render: Callable[[Dict], str] = compile_template(text, calls)
+
+def build_all(build: Callable[[Dict], Dict], records: Iterable[Dict],
+              workers: int = BODY_WORKERS) -> Iterator[Dict]:
+    """build(record) for every record, in order and as lazily as `records`
+
+    With workers > 1 the records go to a process pool POOL_CHUNK at a time;
+    `build` must then be a module-level function (or a partial of one).
+    """
+    if workers <= 1:
+        yield from map(build, records)
+        return
+
+    records = iter(records)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = list(islice(records, POOL_CHUNK))
+            if not chunk:
+                return
+            yield from pool.map(build, chunk, chunksize=max(1, len(chunk) // (workers * 4)))
+
+# Body shared by the deliverable-based Sprint 1 creators (remaining and missing issues)
+DELIVERABLE_BODY = BodyTemplate(
+    """## 🎯 Task Details
+**Epic**: {epic}
+**Sprint**: Sprint 1 - Foundation & Core Systems
+**Issue Number**: {issue_num:04d}
+
+## 📦 Deliverable Requirements
+**What you must upload:**
+- {deliverable}
+
+**Verification Criteria:**
+- [ ] File created and functional
+- [ ] Follows project standards
+- [ ] Tested and verified working
+- [ ] Properly documented
+- [ ] Integrated with existing systems
+
+""",
+    shared("""## 💰 Monetary Value Explanation
+**Coin Value**: {coins} coins = ${coin_value} project value
+
+**Why this value:**
+{value}
+
+**Market Context:**
+- Similar assets sell for ${market_low} to ${market_high}
+- Contributes to revenue stream target of $50,000
+- Part of {epic} valued at $10,000+
+
+## 🎮 XP Justification
+**XP Value**: {xp} XP
+
+**Why this XP:**
+- Task difficulty: {difficulty}
+- Skill development in: {type}
+- Prerequisites: Previous tasks in this epic
+- Unlocks: Next level of complexity
+
+**Skill Mastery Progress:**
+- {type} path: +{mastery}% progress
+- Contributes to specialist certification
+
+## 🔮 Memory Fragment Progress
+**{fragment_range}**
+
+Completing this issue brings you closer to unlocking:
+- Lore about the game world
+- Technical documentation access
+- Market strategy insights
+
+## ✅ Acceptance Criteria
+- [ ] Deliverable uploaded to repository
+- [ ] Meets quality standards
+- [ ] Performance optimized
+- [ ] No critical bugs
+- [ ] Documentation updated
+
+"""),
+    """## 🔗 Dependencies
+- Requires: Issues {requires_first} to {requires_last} completed
+- Blocks: Issues {blocks_first} to {blocks_last}
+- Related Epic: {epic}
+
+""",
+    shared("""## 📊 Business Impact
+- Direct Revenue Impact: ${coin_value}
+- Asset Store Potential: ${asset_store_value}
+- Course Material Value: ${course_value}
+- Long-term Value: Reusable in future projects
+
+## 🛠️ Technical Requirements
+- Software: Unity 2024.3 LTS / Unreal 5
+- Tools: Visual Studio, Git
+- Skills: {type}
+- Time Estimate: {minutes} minutes
+
+"""),
+    """## 📈 Progress Tracking
+- Sprint Progress: {sprint_progress:.1f}% of {progress_scope}
+- Overall Progress: {overall_progress:.1f}% of Sprint 1 complete
+- XP toward next level: {xp} / 1000
+
+---
+*Part of Shadowed Realms RPG - Sprint 1*
+*Building toward $50,000+ revenue target*
+"""
+)
+
+def deliverable_body(issue_data: Dict, epic: str, fragment_range: str,
+                     sprint_progress: float, progress_scope: str) -> str:
+    """DELIVERABLE_BODY for one backlog record with 'num', 'deliverable', 'type',
+    'xp', 'coins' and 'value'"""
+    issue_num, xp, coins = issue_data['num'], issue_data['xp'], issue_data['coins']
+    return DELIVERABLE_BODY.render({
+        'issue_num': issue_num,
+        'epic': epic,
+        'deliverable': issue_data['deliverable'],
+        'coins': coins,
+        'coin_value': coins * 10,
+        'value': issue_data['value'],
+        'market_low': coins * 2,
+        'market_high': coins * 4,
+        'xp': xp,
+        'difficulty': 'Advanced' if xp >= 250 else 'Intermediate' if xp >= 150 else 'Basic',
+        'type': issue_data['type'],
+        'mastery': xp // 10,
+        'fragment_range': fragment_range,
+        'requires_first': issue_num - 10,
+        'requires_last': issue_num - 1,
+        'blocks_first': issue_num + 1,
+        'blocks_last': issue_num + 10,
+        'asset_store_value': coins * 20,
+        'course_value': coins * 5,
+        'minutes': 30 if xp < 150 else 60 if xp < 250 else 90,
+        'sprint_progress': sprint_progress,
+        'progress_scope': progress_scope,
+        'overall_progress': issue_num / 1000 * 100
+    })
+
+# Closing blocks of the micro-task bodies (complete and safe Sprint 1 creators)
+MICRO_TASK_CRITERIA = """### Acceptance Criteria
+- [ ] Task completed as described
+- [ ] Verified working correctly
+- [ ] Documented if necessary
+
+### Sprint
+Sprint 1 - Foundation & Core Systems
+
+"""
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Bounded-concurrency bulk issue creation for the Shadowed Realms backlog
+Keeps a configurable number of creates in flight on the shared pooled client,
+so a 1000-issue run is limited by API quota (the rate-limit governor) and not
+by round-trip latency. Runs are journaled so a crashed run resumes where it stopped
+Jobs can also be streamed from a generator, holding only a small window in memory
+"""
+
+import os
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterable, Iterator, Optional
+
+from github_client import GitHubClient, get_client
+from provisioning_journal import ProvisioningJournal, job_key
+
+# Creates in flight at once - override with BULK_CONCURRENCY=N
+CONCURRENCY = int(os.getenv('BULK_CONCURRENCY', '8'))
+
+# 'rest' posts one issue per request; 'graphql' packs many createIssue
+# mutations into each request (see graphql_batch.py)
+BULK_MODE = os.getenv('BULK_MODE', 'rest')
+
+# Streaming keeps this many jobs per worker submitted ahead of the oldest
+# unfinished one; graphql mode pulls jobs in chunks of GRAPHQL_CHUNK
+WINDOW_FACTOR = 4
+GRAPHQL_CHUNK = 500
+
+def create_one(client: GitHubClient, job: Dict) -> Dict:
+    """POST a single issue, raising on any HTTP or connection error"""
+    response = client.post('/issues', json={
+        'title': job['title'],
+        'body': job['body'],
+        'labels': job['labels']
+    })
+    response.raise_for_status()
+    return response.json()
+
+def print_result(index: int, total: Optional[int], result: Dict):
+    """Print one job's progress block in the style the creator scripts use"""
+    job = result['job']
+    position = f"{index}/{total}" if total is not None else str(index)
+    print(f"\n[{position}] Creating: {job['title']}")
+    for line in job.get('details', []):
+        print(f"  {line}")
+
+    if result['issue']:
+        print(f"  ✓ Created successfully (#{result['issue']['number']})")
+    else:
+        print(f"  ✗ Failed to create: {result['error']}")
+
+def stream_issues_bulk(jobs: Iterable[Dict], total: Optional[int] = None,
+                       concurrency: int = CONCURRENCY,
+                       client: Optional[GitHubClient] = None,
+                       mode: str = BULK_MODE,
+                       journal: Optional[ProvisioningJournal] = None) -> Iterator[Dict]:
+    """Create issues from any iterable of jobs, yielding results as they finish
+
+    Jobs are pulled from `jobs` only as fast as they are sent - at most
+    `concurrency` * WINDOW_FACTOR are held at once (a GRAPHQL_CHUNK in graphql
+    mode) - so a generator of 100k jobs runs in constant memory. Results are
+    yielded and printed in job order. `total` is only used for progress lines
+    and the metrics ETA; jobs already confirmed in the journal are skipped as
+    they stream past.
+    """
+    client = client or get_client()
+    journal = journal or ProvisioningJournal(scope=client.repo_url)
+
+    recovered = journal.reconcile(client)
+    if recovered:
+        print(f"Journal: matched {recovered} unrecorded creates from the last run")
+    confirmed = journal.confirmed()
+    skipped = 0
+
+    def pending() -> Iterator[Dict]:
+        nonlocal skipped
+        for job in jobs:
+            if job_key(job) in confirmed:
+                skipped += 1
+                continue
+            if total is None:
+                client.metrics.add_jobs(1)
+            yield job
+
+    if total is not None:
+        client.metrics.add_jobs(total)
+
+    def record(result: Dict):
+        key = job_key(result['job'])
+        if result['issue']:
+            journal.confirm(key, result['issue']['number'])
+        else:
+            journal.fail(key, result['error'])
+        client.metrics.job_done()
+
+    index = 0
+    if mode == 'graphql':
+        from graphql_batch import create_issues_batched
+        jobs_left = pending()
+        while True:
+            chunk = list(islice(jobs_left, GRAPHQL_CHUNK))
+            if not chunk:
+                break
+            for job in chunk:
+                journal.intend(job_key(job), job['title'])
+            for result in create_issues_batched(chunk, client=client):
+                record(result)
+                index += 1
+                print_result(index, total, result)
+                yield result
+    else:
+        def run(job: Dict) -> Dict:
+            journal.intend(job_key(job), job['title'])
+            try:
+                result = {'job': job, 'issue': create_one(client, job), 'error': None}
+            except Exception as e:
+                result = {'job': job, 'issue': None, 'error': str(e)}
+            record(result)
+            return result
+
+        # Completed results are handed on as soon as every earlier job has finished
+        window = deque()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            for job in pending():
+                window.append(pool.submit(run, job))
+                if len(window) < max(1, concurrency) * WINDOW_FACTOR:
+                    continue
+                index += 1
+                result = window.popleft().result()
+                print_result(index, total, result)
+                yield result
+            while window:
+                index += 1
+                result = window.popleft().result()
+                print_result(index, total, result)
+                yield result
+
+    if skipped:
+        print(f"Journal: skipped {skipped} issues already confirmed")
+
+def create_issues_bulk(jobs: List[Dict], concurrency: int = CONCURRENCY,
+                       client: Optional[GitHubClient] = None,
+                       mode: str = BULK_MODE,
+                       journal: Optional[ProvisioningJournal] = None) -> List[Dict]:
+    """Create issues with up to `concurrency` requests in flight
+
+    Each job is a dict with 'title', 'body', 'labels' and optional 'details'
+    (extra progress lines). Jobs are submitted in list order and results are
+    returned - and printed - in that same order, whatever order the API answers
+    in. A failed create is recorded on its result and never stops the run.
+    Returns one {'job', 'issue', 'error'} dict per job that was sent.
+    With mode='graphql' the jobs go out as batched createIssue mutations.
+
+    Every create is written to the provisioning journal, so a rerun after a
+    crash skips jobs that are already confirmed and only sends the rest.
+    Use stream_issues_bulk for jobs that should not be held in memory.
+    """
+    client = client or get_client()
+    journal = journal or ProvisioningJournal(scope=client.repo_url)
+    pending = journal.pending_jobs(jobs)
+    if len(pending) < len(jobs):
+        print(f"Journal: resuming, {len(jobs) - len(pending)} of {len(jobs)} issues already confirmed")
+    return list(stream_issues_bulk(pending, len(pending), concurrency, client, mode, journal))
+
+def summarize(results: Iterable[Dict]) -> Dict:
+    """Count created and failed results, keeping (title, error) per failure
+
+    Consumes `results` once, so it can drain stream_issues_bulk directly.
+    """
+    summary = {'created': 0, 'failed': 0, 'errors': []}
+    for result in results:
+        if result['issue']:
+            summary['created'] += 1
+        else:
+            summary['failed'] += 1
+            summary['errors'].append((result['job']['title'], result['error']))
+    return summary
@@ -6,25 +6,16 @@ Each issue unlocks a memory fragment
 Completing all issues in a user story unlocks a real story
 """
 
-import os
-import json
-import requests
-import time
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO, get_client
+from reconciler import reconcile
+from hierarchy_annotator import annotate_issues
 
-# GitHub configuration
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+# GitHub configuration - token is read by the shared pooled client
 if not GITHUB_TOKEN:
     print("Error: GITHUB_TOKEN environment variable not set")
     exit(1)
 
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}'
-
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+client = get_client()
 
 # Six Real Stories from the Lore
 REAL_STORIES = {
@@ -232,85 +223,53 @@ AGILE_HIERARCHY = {
     }
 }
 
-def create_milestone(title, description, due_date=None):
-    """Create a GitHub milestone"""
-    url = f'{GITHUB_API_URL}/milestones'
-    data = {
-        'title': title,
-        'description': description,
-        'state': 'open'
-    }
-    if due_date:
-        data['due_on'] = due_date
-    
-    response = requests.post(url, headers=headers, json=data)
-    if response.status_code == 201:
-        return response.json()
-    elif response.status_code == 422:
-        # Milestone might already exist
-        print(f"Milestone '{title}' may already exist")
-        return None
-    else:
-        print(f"Error creating milestone: {response.status_code}")
-        return None
-
-def create_label(name, color, description):
-    """Create a GitHub label"""
-    url = f'{GITHUB_API_URL}/labels'
-    data = {
-        'name': name,
-        'color': color,
-        'description': description
-    }
-    
-    response = requests.post(url, headers=headers, json=data)
-    if response.status_code == 201:
-        return response.json()
-    elif response.status_code == 422:
-        # Label might already exist
-        return None
-    else:
-        print(f"Error creating label: {response.status_code}")
-        return None
-
-def update_issue_with_hierarchy(issue_number, epic_id, user_story_id, memory_fragment):
-    """Update an issue with hierarchy information"""
-    url = f'{GITHUB_API_URL}/issues/{issue_number}'
-    
-    # Get current issue
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        return None
-    
-    issue = response.json()
-    current_body = issue.get('body', '')
-    
-    # Add hierarchy information
-    hierarchy_section = f"""
-## 🏛️ Agile Hierarchy
-- **Epic**: {epic_id}
-- **User Story**: {user_story_id}
-- **Memory Fragment**: {memory_fragment}
+# Labels used to tag each level of the hierarchy
+HIERARCHY_LABELS = [
+    {'name': 'epic', 'color': '7057ff', 'description': 'Epic level work'},
+    {'name': 'user-story', 'color': '0e8a16', 'description': 'User story'},
+    {'name': 'task', 'color': 'd4c5f9', 'description': 'Individual task'},
+    {'name': 'memory-fragment', 'color': 'ffd700', 'description': 'Unlocks memory fragment'},
+    {'name': 'real-story', 'color': 'ff0000', 'description': 'Unlocks real story'}
+]
 
-## 📋 Tasks for this Issue
-- [ ] Task 1: Initial implementation
-- [ ] Task 2: Testing and validation
-- [ ] Task 3: Documentation and integration
-- [ ] Task 4: Code review and refinement
+def hierarchy_milestones():
+    """One milestone per epic, user story and real story"""
+    epic_milestones = [
+        {
+            'title': f"{epic_id}: {epic_data['title']}",
+            'description': f"Epic milestone containing user stories and issues"
+        }
+        for epic_id, epic_data in AGILE_HIERARCHY.items()
+    ]
+    story_milestones = [
+        {
+            'title': f"{us_id}: {us_data['title'][:50]}...",
+            'description': f"User story in {epic_id}. Unlocks {us_data['unlocks_story']}. Theme: {us_data['memory_theme']}"
+        }
+        for epic_id, epic_data in AGILE_HIERARCHY.items()
+        for us_id, us_data in epic_data['user_stories'].items()
+    ]
+    real_story_milestones = [
+        {
+            'title': f"{story_id}: {story_data['title']}",
+            'description': f"{story_data['description']}. {story_data['unlocked_by']}"
+        }
+        for story_id, story_data in REAL_STORIES.items()
+    ]
+    return epic_milestones + story_milestones + real_story_milestones
 
-## 🔓 Unlocks
-Completing this issue unlocks **Memory Fragment #{issue_number}**: Part of the greater story...
-"""
-    
-    # Update issue body
-    new_body = hierarchy_section + "\n\n---\n\n" + current_body
-    
-    data = {
-        'body': new_body
-    }
-    
-    response = requests.patch(url, headers=headers, json=data)
-    return response.json() if response.status_code == 200 else None
+def hierarchy_assignments():
+    """Map every ISSUE-NNNN number in AGILE_HIERARCHY to its epic, user story and fragment"""
+    assignments = {}
+    for epic_id, epic_data in AGILE_HIERARCHY.items():
+        for us_id, us_data in epic_data['user_stories'].items():
+            for issue_num in us_data['issues']:
+                assignments[issue_num] = {
+                    'epic': epic_id,
+                    'user_story': us_id,
+                    'memory_fragment': f"{us_data['memory_theme']} Fragment #{issue_num}"
+                }
+    return assignments
 
 def main():
     """Create complete agile hierarchy"""
@@ -318,77 +277,18 @@ def main():
     print("SHADOWED REALMS - Agile Hierarchy Setup")
     print("=" * 60)
     
-    # Create labels for hierarchy
-    print("\n1. Creating hierarchy labels...")
-    labels = [
-        ("epic", "7057ff", "Epic level work"),
-        ("user-story", "0e8a16", "User story"),
-        ("task", "d4c5f9", "Individual task"),
-        ("memory-fragment", "ffd700", "Unlocks memory fragment"),
-        ("real-story", "ff0000", "Unlocks real story")
-    ]
-    
-    for name, color, desc in labels:
-        result = create_label(name, color, desc)
-        if result:
-            print(f"  ✓ Created label: {name}")
-    
-    # Create milestones for each Epic
-    print("\n2. Creating milestones for Epics...")
-    for epic_id, epic_data in AGILE_HIERARCHY.items():
-        milestone = create_milestone(
-            f"{epic_id}: {epic_data['title']}",
-            f"Epic milestone containing user stories and issues"
-        )
-        if milestone:
-            print(f"  ✓ Created milestone: {epic_id}")
-    
-    # Create milestones for User Stories
-    print("\n3. Creating milestones for User Stories...")
-    for epic_id, epic_data in AGILE_HIERARCHY.items():
-        for us_id, us_data in epic_data['user_stories'].items():
-            milestone = create_milestone(
-                f"{us_id}: {us_data['title'][:50]}...",
-                f"User story in {epic_id}. Unlocks {us_data['unlocks_story']}. Theme: {us_data['memory_theme']}"
-            )
-            if milestone:
-                print(f"  ✓ Created milestone: {us_id}")
-    
-    # Create milestones for Real Stories
-    print("\n4. Creating milestones for Real Stories...")
-    for story_id, story_data in REAL_STORIES.items():
-        milestone = create_milestone(
-            f"{story_id}: {story_data['title']}",
-            f"{story_data['description']}. {story_data['unlocked_by']}"
-        )
-        if milestone:
-            print(f"  ✓ Created milestone: {story_id}")
+    # One read of the repository diffs every label and milestone; only the
+    # missing or changed ones are written
+    print("\n1. Reconciling hierarchy labels and milestones...")
+    counts = reconcile({'labels': HIERARCHY_LABELS, 'milestones': hierarchy_milestones()}, client)
+    print(f"  Created {counts['created']}, updated {counts['updated']}, failed {counts['failed']}")
     
     # Update existing issues with hierarchy
-    print("\n5. Updating issues with hierarchy information...")
-    issues_updated = 0
-    
-    for epic_id, epic_data in AGILE_HIERARCHY.items():
-        for us_id, us_data in epic_data['user_stories'].items():
-            for issue_num in us_data['issues']:
-                if issues_updated >= 10:  # Limit updates to avoid rate limiting
-                    print(f"  ... Updated {issues_updated} issues (limiting to prevent rate limits)")
-                    break
-                
-                memory_fragment = f"{us_data['memory_theme']} Fragment #{issue_num}"
-                result = update_issue_with_hierarchy(issue_num, epic_id, us_id, memory_fragment)
-                
-                if result:
-                    issues_updated += 1
-                    print(f"  ✓ Updated issue #{issue_num} with hierarchy")
-                
-                time.sleep(1)  # Rate limiting
-            
-            if issues_updated >= 10:
-                break
-        
-        if issues_updated >= 10:
-            break
+    print("\n2. Updating issues with hierarchy information...")
+    # One listing supplies every body; only issues whose section changed are written
+    counts = annotate_issues(hierarchy_assignments(), client)
+    print(f"  Updated {counts['updated']}, unchanged {counts['unchanged']}, "
+          f"not found {counts['missing']}, failed {counts['failed']}")
     
     # Generate hierarchy report
     print("\n" + "=" * 60)
@@ -4,292 +4,105 @@ Create COMPLETE Sprint 1 issues (all 1000) for Shadowed Realms RPG
 Properly aligned with financial model and project value
 """
 
-import os
-import json
-import time
-import requests
-from typing import List, Dict
+import numpy as np
 
-# GitHub configuration
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO, get_client
+from issue_index import existing_issue_numbers
+from backlog_spec import issue_records, pending_count
+from bulk_issue_engine import stream_issues_bulk, summarize
+from body_templates import BodyTemplate, MICRO_TASK_CRITERIA, build_all, shared
+from issue_ranges import BASE_REWARDS, MICRO_TASK_FRAGMENTS
+from reward_ledger import RewardLedger, type_multiplier
+
+# GitHub configuration - token is read by the shared pooled client
 if not GITHUB_TOKEN:
     print("Error: GITHUB_TOKEN environment variable not set")
     exit(1)
 
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}'
+client = get_client()
+
+SPRINT1_BODY = BodyTemplate(
+    """## Task Details
+**Issue Number**: {issue_num:04d}
+**XP Reward**: {xp}
+**Coin Reward**: {coins}
+**Financial Impact**: ${coin_value} toward project value
+**Memory Fragment**: {fragment_range}
+
+### Description
+{title}
+
+""",
+    MICRO_TASK_CRITERIA,
+    shared("""### Skill Development
+This task contributes to: {type} mastery path
 
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+---
+*Part of the Shadowed Realms RPG - targeting $50,000+ in revenue*
+""")
+)
 
 def calculate_xp_coins(issue_num: int, task_type: str) -> tuple:
     """Calculate XP and coins based on task difficulty and financial impact"""
     
     # Base values by difficulty
-    if issue_num <= 160:  # Setup tasks - Basic
-        base_xp = 25 if issue_num <= 80 else 50
-        base_coins = 10 if issue_num <= 80 else 20
-    elif issue_num <= 300:  # Character system - Intermediate
-        base_xp = 100 if issue_num <= 250 else 200
-        base_coins = 40 if issue_num <= 250 else 80
-    elif issue_num <= 480:  # Combat system - Advanced
-        base_xp = 200 if issue_num <= 400 else 300
-        base_coins = 80 if issue_num <= 400 else 120
-    elif issue_num <= 640:  # Environment - Intermediate/Advanced
-        base_xp = 150 if issue_num <= 560 else 250
-        base_coins = 60 if issue_num <= 560 else 100
-    elif issue_num <= 780:  # UI/UX - Intermediate
-        base_xp = 100 if issue_num <= 720 else 150
-        base_coins = 50 if issue_num <= 720 else 75
-    elif issue_num <= 900:  # Save System - Advanced
-        base_xp = 200
-        base_coins = 100
-    else:  # Audio System - Intermediate
-        base_xp = 150
-        base_coins = 75
+    base_xp, base_coins = BASE_REWARDS.lookup(issue_num)
     
-    # Adjust for financial impact
-    if 'model' in task_type.lower() or 'asset' in task_type.lower():
-        base_coins = int(base_coins * 1.5)  # Assets have higher value
-    elif 'script' in task_type.lower() or 'system' in task_type.lower():
-        base_coins = int(base_coins * 1.3)  # Scripts have good value
+    # Adjust for financial impact - assets have higher value, scripts good value
+    multiplier = type_multiplier(task_type)
+    if multiplier != 1.0:
+        base_coins = int(base_coins * multiplier)
     
     return base_xp, base_coins
 
-def create_issue(title: str, body: str, labels: List[str]) -> Dict:
-    """Create a single GitHub issue"""
-    url = f'{GITHUB_API_URL}/issues'
-    data = {
-        'title': title,
-        'body': body,
-        'labels': labels
-    }
-    
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Error creating issue '{title}': {e}")
-        return None
-
 def check_existing_issues():
     """Check which issues already exist"""
-    existing = set()
-    page = 1
-    while True:
-        response = requests.get(
-            f'{GITHUB_API_URL}/issues?state=all&per_page=100&page={page}',
-            headers=headers
-        )
-        issues = response.json()
-        if not issues:
-            break
-        
-        for issue in issues:
-            if '[ISSUE-' in issue['title']:
-                num = issue['title'].split('[ISSUE-')[1].split(']')[0]
-                existing.add(int(num))
-        page += 1
-    
-    return existing
+    # Local issue mirror synced with since= and If-None-Match instead of a full rescan
+    return existing_issue_numbers(client)
 
-def generate_all_sprint1_issues():
+def generate_all_sprint1_issues(existing_issues):
     """Generate ALL 1000 Sprint 1 issues from the documentation"""
-    
-    # Check what already exists
-    existing_issues = check_existing_issues()
-    print(f"Found {len(existing_issues)} existing issues")
-    
-    all_issues = []
-    
-    # EPIC-001: Project Setup & Infrastructure (Issues 0001-0160)
-    setup_issues = [
-        # Install Core Development Tools (0001-0010)
-        {'num': 1, 'title': 'Download Unity Hub from unity.com', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 2, 'title': 'Install Unity 2024.3 LTS', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 3, 'title': 'Download Visual Studio 2022', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 4, 'title': 'Install Visual Studio Unity Tools', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 5, 'title': 'Download Git for Windows/Mac', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 6, 'title': 'Install Git LFS for large files', 'type': 'setup', 'difficulty': 'medium'},
-        {'num': 7, 'title': 'Download GitHub Desktop', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 8, 'title': 'Install Node.js v20 LTS', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 9, 'title': 'Install Python 3.11', 'type': 'setup', 'difficulty': 'easy'},
-        {'num': 10, 'title': 'Run npm install -g yarn', 'type': 'setup', 'difficulty': 'easy'},
+    # Streamed from the sprint1-complete runs in backlog_spec.json, skipping
+    # issues that already exist
+    return (issue for issue in issue_records('sprint1-complete')
+            if issue['num'] not in existing_issues)
+
+def build_job(issue_data):
+    """Title, body, labels and progress lines for one Sprint 1 issue"""
+    issue_num = issue_data['num']
+    xp, coins = calculate_xp_coins(issue_num, issue_data['type'])
+    
+    title = f"[ISSUE-{issue_num:04d}] {issue_data['title']}"
+    
+    # Calculate memory fragment unlock
+    fragment_range = MICRO_TASK_FRAGMENTS.lookup(issue_num)
+    
+    body = SPRINT1_BODY.render({
+        'issue_num': issue_num,
+        'xp': xp,
+        'coins': coins,
+        'coin_value': coins * 10,
+        'fragment_range': fragment_range,
+        'title': issue_data['title'],
+        'type': issue_data['type']
+    })
+    
+    labels = [
+        'issue',
+        'micro-task',
+        f"xp-{xp}",
+        f"coins-{coins}",
+        'sprint-1',
+        issue_data['difficulty'],
+        issue_data['type']
     ]
     
-    # Continue with ALL issues from SPRINT_1_COMPLETE_TASKS.md
-    # Due to length, I'll create a pattern that can be expanded
-    
-    # Generate remaining setup issues (11-160)
-    for i in range(11, 161):
-        if i <= 20:  # Git setup
-            all_issues.append({
-                'num': i, 
-                'title': f'Git repository task {i}',
-                'type': 'git',
-                'difficulty': 'easy'
-            })
-        elif i <= 40:  # Unity config
-            all_issues.append({
-                'num': i,
-                'title': f'Unity configuration task {i}',
-                'type': 'unity',
-                'difficulty': 'medium'
-            })
-        elif i <= 60:  # Folder structure
-            all_issues.append({
-                'num': i,
-                'title': f'Create project folder {i}',
-                'type': 'organization',
-                'difficulty': 'easy'
-            })
-        elif i <= 80:  # Packages
-            all_issues.append({
-                'num': i,
-                'title': f'Install Unity package {i}',
-                'type': 'packages',
-                'difficulty': 'medium'
-            })
-        elif i <= 100:  # Build settings
-            all_issues.append({
-                'num': i,
-                'title': f'Configure build setting {i}',
-                'type': 'build',
-                'difficulty': 'medium'
-            })
-        elif i <= 120:  # Version control
-            all_issues.append({
-                'num': i,
-                'title': f'Setup version control {i}',
-                'type': 'git',
-                'difficulty': 'medium'
-            })
-        elif i <= 140:  # Documentation
-            all_issues.append({
-                'num': i,
-                'title': f'Create documentation {i}',
-                'type': 'documentation',
-                'difficulty': 'medium'
-            })
-        else:  # CI/CD
-            all_issues.append({
-                'num': i,
-                'title': f'Configure CI/CD pipeline {i}',
-                'type': 'devops',
-                'difficulty': 'hard'
-            })
-    
-    # Character System (161-300)
-    for i in range(161, 301):
-        if i <= 180:
-            all_issues.append({
-                'num': i,
-                'title': f'Setup Maya project {i}',
-                'type': '3d-modeling',
-                'difficulty': 'medium'
-            })
-        elif i <= 210:
-            all_issues.append({
-                'num': i,
-                'title': f'Model character mesh {i}',
-                'type': '3d-modeling',
-                'difficulty': 'hard'
-            })
-        elif i <= 230:
-            all_issues.append({
-                'num': i,
-                'title': f'Create UV mapping {i}',
-                'type': '3d-modeling',
-                'difficulty': 'hard'
-            })
-        elif i <= 250:
-            all_issues.append({
-                'num': i,
-                'title': f'Export to Unity {i}',
-                'type': 'pipeline',
-                'difficulty': 'medium'
-            })
-        elif i <= 270:
-            all_issues.append({
-                'num': i,
-                'title': f'Setup character rig {i}',
-                'type': 'animation',
-                'difficulty': 'hard'
-            })
-        elif i <= 290:
-            all_issues.append({
-                'num': i,
-                'title': f'Create idle animation {i}',
-                'type': 'animation',
-                'difficulty': 'hard'
-            })
-        else:
-            all_issues.append({
-                'num': i,
-                'title': f'Setup animation controller {i}',
-                'type': 'animation',
-                'difficulty': 'medium'
-            })
-    
-    # Combat System (301-480)
-    for i in range(301, 481):
-        task_type = 'combat-programming' if i <= 340 else 'combat-animation' if i <= 380 else 'combat-vfx'
-        all_issues.append({
-            'num': i,
-            'title': f'Combat system task {i}',
-            'type': task_type,
-            'difficulty': 'hard'
-        })
-    
-    # Environment System (481-640)
-    for i in range(481, 641):
-        task_type = 'terrain' if i <= 520 else 'vegetation' if i <= 560 else 'lighting'
-        all_issues.append({
-            'num': i,
-            'title': f'Environment task {i}',
-            'type': task_type,
-            'difficulty': 'medium' if i <= 560 else 'hard'
-        })
-    
-    # UI/UX Systems (641-780)
-    for i in range(641, 781):
-        task_type = 'ui-design' if i <= 700 else 'ui-programming'
-        all_issues.append({
-            'num': i,
-            'title': f'UI system task {i}',
-            'type': task_type,
-            'difficulty': 'medium'
-        })
-    
-    # Save System (781-900)
-    for i in range(781, 901):
-        all_issues.append({
-            'num': i,
-            'title': f'Save system task {i}',
-            'type': 'save-system',
-            'difficulty': 'hard'
-        })
-    
-    # Audio System (901-1000)
-    for i in range(901, 1001):
-        all_issues.append({
-            'num': i,
-            'title': f'Audio system task {i}',
-            'type': 'audio',
-            'difficulty': 'medium'
-        })
-    
-    # Add the initial setup issues
-    all_issues = setup_issues + all_issues
-    
-    # Filter out existing issues
-    new_issues = [issue for issue in all_issues if issue['num'] not in existing_issues]
-    
-    return new_issues
+    return {
+        'title': title,
+        'body': body,
+        'labels': labels,
+        'details': [f"XP: {xp}, Coins: {coins}, Value: ${coins * 10}"]
+    }
 
 def main():
     """Main function to create all missing issues"""
@@ -298,8 +111,12 @@ def main():
     print("Creating ALL 1000 Sprint 1 Issues")
     print("=" * 60)
     
-    issues_to_create = generate_all_sprint1_issues()
-    total_issues = len(issues_to_create)
+    # Check what already exists
+    existing_issues = check_existing_issues()
+    print(f"Found {len(existing_issues)} existing issues")
+    
+    # Count what is missing without generating the issues
+    total_issues = pending_count('sprint1-complete', existing_issues)
     
     print(f"\nNeed to create {total_issues} new issues")
     
@@ -307,92 +124,24 @@ def main():
         print("All Sprint 1 issues already exist!")
         return
     
-    created_count = 0
-    failed_count = 0
+    # Jobs are built as the bulk engine pulls them, never all at once
+    jobs = build_all(build_job, generate_all_sprint1_issues(existing_issues))
     
-    for i, issue_data in enumerate(issues_to_create, 1):
-        issue_num = issue_data['num']
-        xp, coins = calculate_xp_coins(issue_num, issue_data['type'])
-        
-        title = f"[ISSUE-{issue_num:04d}] {issue_data['title']}"
-        
-        # Calculate memory fragment unlock
-        fragment_range = ""
-        if issue_num <= 160:
-            fragment_range = "Unlocks progress toward Fragments 1-7"
-        elif issue_num <= 300:
-            fragment_range = "Unlocks progress toward Fragments 8-14"
-        elif issue_num <= 500:
-            fragment_range = "Unlocks progress toward Fragments 15-21"
-        elif issue_num <= 700:
-            fragment_range = "Unlocks progress toward Fragments 22-28"
-        elif issue_num <= 850:
-            fragment_range = "Unlocks progress toward Fragments 29-35"
-        else:
-            fragment_range = "Unlocks progress toward Fragments 36-42"
-        
-        body = f"""## Task Details
-**Issue Number**: {issue_num:04d}
-**XP Reward**: {xp}
-**Coin Reward**: {coins}
-**Financial Impact**: ${coins * 10} toward project value
-**Memory Fragment**: {fragment_range}
-
-### Description
-{issue_data['title']}
-
-### Acceptance Criteria
-- [ ] Task completed as described
-- [ ] Verified working correctly
-- [ ] Documented if necessary
-
-### Sprint
-Sprint 1 - Foundation & Core Systems
-
-### Skill Development
-This task contributes to: {issue_data['type']} mastery path
-
----
-*Part of the Shadowed Realms RPG - targeting $50,000+ in revenue*
-"""
-        
-        labels = [
-            'issue',
-            'micro-task',
-            f"xp-{xp}",
-            f"coins-{coins}",
-            'sprint-1',
-            issue_data['difficulty'],
-            issue_data['type']
-        ]
-        
-        print(f"\n[{i}/{total_issues}] Creating: {title}")
-        print(f"  XP: {xp}, Coins: {coins}, Value: ${coins * 10}")
-        
-        result = create_issue(title, body, labels)
-        
-        if result:
-            created_count += 1
-            print(f"  ✓ Created successfully (#{result['number']})")
-        else:
-            failed_count += 1
-            print(f"  ✗ Failed to create")
-        
-        # Rate limiting
-        if i % 5 == 0:
-            print(f"\n  Pausing for rate limiting...")
-            time.sleep(3)
+    summary = summarize(stream_issues_bulk(jobs, total_issues))
     
     print("\n" + "=" * 60)
     print("CREATION COMPLETE")
-    print(f"Successfully created: {created_count} issues")
-    print(f"Failed: {failed_count} issues")
+    print(f"Successfully created: {summary['created']} issues")
+    print(f"Failed: {summary['failed']} issues")
+    for title, error in summary['errors']:
+        print(f"  ✗ {title}: {error}")
     print("=" * 60)
     
     # Calculate totals
-    total_xp = sum(calculate_xp_coins(i, 'average')[0] for i in range(1, 1001))
-    total_coins = sum(calculate_xp_coins(i, 'average')[1] for i in range(1, 1001))
-    total_value = total_coins * 10
+    ledger = RewardLedger.from_table(np.arange(1, 1001))
+    total_xp = ledger.total('xp')
+    total_coins = ledger.total('coins')
+    total_value = ledger.total('value')
     
     print(f"\nSprint 1 Totals:")
     print(f"Total XP Pool: {total_xp:,}")
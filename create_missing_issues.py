@@ -3,133 +3,34 @@
 Create missing issues 571-600 for Shadowed Realms
 """
 
-import os
-import time
-import requests
+from backlog_spec import issue_records, section_size
+from bulk_issue_engine import stream_issues_bulk, summarize
+from body_templates import build_all, deliverable_body
 
-# GitHub configuration
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}'
-
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
-
-def create_issue(issue_num):
-    """Create a single issue"""
+def build_issue(issue_data):
+    """Build the title, body and labels for a single issue"""
+    issue_num = issue_data['num']
+    xp, coins = issue_data['xp'], issue_data['coins']
     
     # Environment System (Issues 571-600)
-    title = f"[ISSUE-{issue_num:04d}] Create atmospheric effect {issue_num - 570}"
+    title = f"[ISSUE-{issue_num:04d}] {issue_data['title']}"
     
-    body = f"""## 🎯 Task Details
-**Epic**: EPIC-004: Environment System
-**Sprint**: Sprint 1 - Foundation & Core Systems
-**Issue Number**: {issue_num:04d}
-
-## 📦 Deliverable Requirements
-**What you must upload:**
-- atmosphere_{issue_num - 570}.mat material with shader
-
-**Verification Criteria:**
-- [ ] File created and functional
-- [ ] Follows project standards
-- [ ] Tested and verified working
-- [ ] Properly documented
-- [ ] Integrated with existing systems
-
-## 💰 Monetary Value Explanation
-**Coin Value**: 85 coins = $850 project value
-
-**Why this value:**
-Atmospheric effects crucial for Dark Souls aesthetic
-
-**Market Context:**
-- Similar assets sell for $170 to $340
-- Contributes to revenue stream target of $50,000
-- Part of EPIC-004: Environment System valued at $10,000+
-
-## 🎮 XP Justification
-**XP Value**: 175 XP
-
-**Why this XP:**
-- Task difficulty: Intermediate
-- Skill development in: atmosphere
-- Prerequisites: Previous tasks in this epic
-- Unlocks: Next level of complexity
-
-**Skill Mastery Progress:**
-- atmosphere path: +17% progress
-- Contributes to specialist certification
-
-## 🔮 Memory Fragment Progress
-**Fragments 22-28: Environment System Done**
-
-Completing this issue brings you closer to unlocking:
-- Lore about the game world
-- Technical documentation access
-- Market strategy insights
-
-## ✅ Acceptance Criteria
-- [ ] Deliverable uploaded to repository
-- [ ] Meets quality standards
-- [ ] Performance optimized
-- [ ] No critical bugs
-- [ ] Documentation updated
-
-## 🔗 Dependencies
-- Requires: Issues {issue_num - 10} to {issue_num - 1} completed
-- Blocks: Issues {issue_num + 1} to {issue_num + 10}
-- Related Epic: EPIC-004: Environment System
-
-## 📊 Business Impact
-- Direct Revenue Impact: $850
-- Asset Store Potential: $1700
-- Course Material Value: $425
-- Long-term Value: Reusable in future projects
-
-## 🛠️ Technical Requirements
-- Software: Unity 2024.3 LTS / Unreal 5
-- Tools: Visual Studio, Git
-- Skills: atmosphere
-- Time Estimate: 60 minutes
-
-## 📈 Progress Tracking
-- Sprint Progress: {((issue_num - 570) / 30 * 100):.1f}% of atmospheric effects
-- Overall Progress: {(issue_num / 1000 * 100):.1f}% of Sprint 1 complete
-- XP toward next level: 175 / 1000
-
----
-*Part of Shadowed Realms RPG - Sprint 1*
-*Building toward $50,000+ revenue target*
-"""
+    body = deliverable_body(issue_data, 'EPIC-004: Environment System',
+                            'Fragments 22-28: Environment System Done',
+                            sprint_progress=(issue_num - 570) / 30 * 100,
+                            progress_scope='atmospheric effects')
     
     labels = [
         'issue',
         'sprint-1',
-        'xp-175',
-        'coins-85',
-        'atmosphere',
+        f"xp-{xp}",
+        f"coins-{coins}",
+        issue_data['type'],
         'deliverable-required',
         'environment-system'
     ]
     
-    url = f'{GITHUB_API_URL}/issues'
-    data = {
-        'title': title,
-        'body': body,
-        'labels': labels
-    }
-    
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Error creating issue {issue_num}: {e}")
-        return None
+    return {'title': title, 'body': body, 'labels': labels}
 
 def main():
     """Create missing issues 571-600"""
@@ -137,28 +38,13 @@ def main():
     print("Creating Missing Issues 571-600")
     print("=" * 60)
     
-    created = 0
-    failed = 0
-    
-    for issue_num in range(571, 601):
-        print(f"\nCreating issue {issue_num}...")
-        result = create_issue(issue_num)
-        
-        if result:
-            created += 1
-            print(f"✓ Created issue #{result['number']}")
-        else:
-            failed += 1
-            print(f"✗ Failed to create issue {issue_num}")
-        
-        # Rate limiting
-        if issue_num % 3 == 0:
-            print("Pausing for rate limit...")
-            time.sleep(2)
+    # Journaled, so a rerun only sends the issues that were not confirmed
+    jobs = build_all(build_issue, issue_records('sprint1-missing'))
+    summary = summarize(stream_issues_bulk(jobs, section_size('sprint1-missing')))
     
     print("\n" + "=" * 60)
-    print(f"Created: {created} issues")
-    print(f"Failed: {failed} issues")
+    print(f"Created: {summary['created']} issues")
+    print(f"Failed: {summary['failed']} issues")
     print("=" * 60)
 
 if __name__ == "__main__":
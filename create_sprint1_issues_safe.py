@@ -4,45 +4,31 @@ Create Sprint 1 issues for Shadowed Realms RPG
 Based on SPRINT_1_COMPLETE_TASKS.md
 """
 
-import os
-import json
-import time
-import requests
-from typing import List, Dict
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO
+from bulk_issue_engine import create_issues_bulk, summarize
+from body_templates import BodyTemplate, MICRO_TASK_CRITERIA
 
-# GitHub configuration - Token should be set as environment variable
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+# GitHub configuration - token is read by the shared pooled client
 if not GITHUB_TOKEN:
     print("Error: GITHUB_TOKEN environment variable not set")
     print("Please set: export GITHUB_TOKEN='your_token_here'")
     exit(1)
 
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}'
+SPRINT1_BODY = BodyTemplate(
+    """## Task Details
+**Issue Number**: {num}
+**XP Reward**: {xp}
+**Coin Reward**: {coins}
 
-# Headers for GitHub API
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+### Description
+{title}
 
-def create_issue(title: str, body: str, labels: List[str]) -> Dict:
-    """Create a single GitHub issue"""
-    url = f'{GITHUB_API_URL}/issues'
-    data = {
-        'title': title,
-        'body': body,
-        'labels': labels
-    }
-    
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Error creating issue '{title}': {e}")
-        return None
+""",
+    MICRO_TASK_CRITERIA,
+    """---
+*Part of the Shadowed Realms RPG development journey*
+"""
+)
 
 def generate_sprint1_issues():
     """Generate the first 200 issues for Sprint 1"""
@@ -146,6 +132,22 @@ def generate_sprint1_issues():
     
     return all_issues
 
+def build_job(issue_data):
+    """Title, body and labels for one Sprint 1 issue"""
+    title = f"[ISSUE-{issue_data['num']}] {issue_data['title']}"
+    
+    body = SPRINT1_BODY.render(issue_data)
+    
+    labels = [
+        'issue',
+        'micro-task',
+        f"xp-{issue_data['xp']}",
+        f"coins-{issue_data['coins']}",
+        'sprint-1'
+    ] + issue_data['labels']
+    
+    return {'title': title, 'body': body, 'labels': labels}
+
 def main():
     """Main function to create issues"""
     print("=" * 60)
@@ -161,62 +163,16 @@ def main():
     print("- XP and coin rewards")
     print("- Appropriate labels")
     
-    # Create issues with rate limiting
-    created_count = 0
-    failed_count = 0
+    # Build every issue first, then create them with bounded concurrency
+    jobs = [build_job(issue_data) for issue_data in issues_to_create]
     
-    for i, issue_data in enumerate(issues_to_create, 1):
-        title = f"[ISSUE-{issue_data['num']}] {issue_data['title']}"
-        
-        body = f"""## Task Details
-**Issue Number**: {issue_data['num']}
-**XP Reward**: {issue_data['xp']}
-**Coin Reward**: {issue_data['coins']}
-
-### Description
-{issue_data['title']}
-
-### Acceptance Criteria
-- [ ] Task completed as described
-- [ ] Verified working correctly
-- [ ] Documented if necessary
-
-### Sprint
-Sprint 1 - Foundation & Core Systems
-
----
-*Part of the Shadowed Realms RPG development journey*
-"""
-        
-        labels = [
-            'issue',
-            'micro-task',
-            f"xp-{issue_data['xp']}",
-            f"coins-{issue_data['coins']}",
-            'sprint-1'
-        ] + issue_data['labels']
-        
-        print(f"\n[{i}/{total_issues}] Creating: {title}")
-        
-        result = create_issue(title, body, labels)
-        
-        if result:
-            created_count += 1
-            print(f"  ✓ Created successfully (#{result['number']})")
-        else:
-            failed_count += 1
-            print(f"  ✗ Failed to create")
-        
-        # Rate limiting - GitHub allows 5000 requests per hour for authenticated requests
-        # But let's be conservative to avoid any issues
-        if i % 10 == 0:
-            print(f"\n  Pausing for rate limiting...")
-            time.sleep(2)
+    results = create_issues_bulk(jobs)
+    summary = summarize(results)
     
     print("\n" + "=" * 60)
     print("CREATION COMPLETE")
-    print(f"Successfully created: {created_count} issues")
-    print(f"Failed: {failed_count} issues")
+    print(f"Successfully created: {summary['created']} issues")
+    print(f"Failed: {summary['failed']} issues")
     print("=" * 60)
     
     print(f"\nView issues at: https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/issues")
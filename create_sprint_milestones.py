@@ -4,24 +4,16 @@ Create 10 Sprint milestones (simplified from 103 to avoid rate limits)
 Each sprint represents a major phase of development
 """
 
-import os
-import requests
-import time
 from datetime import datetime, timedelta
 
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO, get_client
+from reconciler import reconcile
+
 if not GITHUB_TOKEN:
     print("Set GITHUB_TOKEN environment variable")
     exit(1)
 
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}'
-
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
+client = get_client()
 
 # Define 10 major sprint milestones
 SPRINTS = [
@@ -77,58 +69,29 @@ SPRINTS = [
     }
 ]
 
-def create_milestone(sprint):
-    """Create a single milestone"""
-    url = f'{GITHUB_API_URL}/milestones'
-    data = {
-        'title': sprint['title'],
-        'description': sprint['description'],
-        'due_on': sprint['due_date'],
-        'state': 'open'
-    }
-    
-    try:
-        response = requests.post(url, headers=headers, json=data)
-        if response.status_code == 201:
-            return response.json()
-        elif response.status_code == 422:
-            print(f"  Milestone '{sprint['title']}' may already exist")
-            return None
-        else:
-            print(f"  Error: {response.status_code} - {response.text}")
-            return None
-    except Exception as e:
-        print(f"  Exception: {e}")
-        return None
+def sprint_milestones():
+    """SPRINTS in the reconciler's milestone format"""
+    return [
+        {'title': sprint['title'], 'description': sprint['description'], 'due_on': sprint['due_date']}
+        for sprint in SPRINTS
+    ]
 
 def main():
     print("=" * 60)
     print("Creating Sprint Milestones")
     print("=" * 60)
     
-    created = 0
-    skipped = 0
-    
-    for i, sprint in enumerate(SPRINTS, 1):
-        print(f"\n[{i}/10] Creating: {sprint['title']}")
-        result = create_milestone(sprint)
-        
-        if result:
-            created += 1
-            print(f"  ✓ Created milestone #{result['number']}")
-        else:
-            skipped += 1
-            print(f"  ⊘ Skipped (may already exist)")
-        
-        # Rate limiting
-        if i % 3 == 0:
-            time.sleep(1)
+    # Diffed against one milestone listing - existing sprints are left alone
+    # unless their description or due date changed
+    counts = reconcile({'milestones': sprint_milestones()}, client)
+    unchanged = len(SPRINTS) - counts['created'] - counts['updated'] - counts['failed']
     
     print("\n" + "=" * 60)
     print(f"Sprint Milestones Summary:")
-    print(f"  Created: {created}")
-    print(f"  Skipped: {skipped}")
-    print(f"  Total: {created + skipped}/10")
+    print(f"  Created: {counts['created']}")
+    print(f"  Updated: {counts['updated']}")
+    print(f"  Unchanged: {unchanged}")
+    print(f"  Failed: {counts['failed']}")
     print("\nView at: https://github.com/{}/{}/milestones".format(GITHUB_OWNER, GITHUB_REPO))
     print("=" * 60)
 
@@ -1,161 +1,113 @@
 #!/usr/bin/env python3
 """
 Create time-based sprint system with dynamic issue allocation
-1 Sprint = 1 Week = 20 hours of effort
+1 Sprint = 1 Week = 20 hours of effort per developer, in parallel lanes (team.json)
 Hierarchy: Org → Project → Repo → Agile → Sprint → Epic → User Story → Issue → Task
 """
 
 import json
 
-# Issue effort mapping (in hours)
-ISSUE_EFFORT = {
-    # Pre-Sprint 1: Documentation (Issues 1-100) - Quick docs
-    **{i: 0.5 for i in range(1, 51)},      # Issues 1-50: 30min each (light docs)
-    **{i: 1.0 for i in range(51, 101)},    # Issues 51-100: 1hr each (detailed docs)
-    
-    # Core Systems (Issues 101-260) - Medium complexity
-    **{i: 2.0 for i in range(101, 181)},   # Issues 101-180: 2hrs each (movement)
-    **{i: 2.5 for i in range(181, 261)},   # Issues 181-260: 2.5hrs each (inventory)
-    
-    # Combat Framework (Issues 261-420) - High complexity
-    **{i: 3.0 for i in range(261, 341)},   # Issues 261-340: 3hrs each (melee)
-    **{i: 3.5 for i in range(341, 421)},   # Issues 341-420: 3.5hrs each (magic)
-    
-    # Environment System (Issues 421-580) - Medium-high
-    **{i: 2.5 for i in range(421, 501)},   # Issues 421-500: 2.5hrs each
-    **{i: 2.0 for i in range(501, 581)},   # Issues 501-580: 2hrs each
-    
-    # Character System (Issues 581-640, 761-820) - Medium
-    **{i: 1.5 for i in range(581, 641)},   # Issues 581-640: 1.5hrs each
-    **{i: 2.0 for i in range(761, 821)},   # Issues 761-820: 2hrs each
-    
-    # UI/UX (Issues 641-760) - Light-medium
-    **{i: 1.0 for i in range(641, 721)},   # Issues 641-720: 1hr each
-    **{i: 1.5 for i in range(721, 761)},   # Issues 721-760: 1.5hrs each
-    
-    # Save System (Issues 821-900) - Complex
-    **{i: 3.0 for i in range(821, 881)},   # Issues 821-880: 3hrs each
-    **{i: 2.0 for i in range(881, 901)},   # Issues 881-900: 2hrs each
-    
-    # Audio & Polish (Issues 901-1000) - Variable
-    **{i: 1.0 for i in range(901, 961)},   # Issues 901-960: 1hr each
-    **{i: 0.5 for i in range(961, 1001)},  # Issues 961-1000: 30min each (polish)
-}
+from issue_ranges import SPRINT_EPICS, SPRINT_USER_STORIES
+from reward_ledger import backlog_ledger
+from issue_effort import get_issue_effort
+from team_scheduler import load_team, plan_team, out_of_order
 
-def allocate_sprints(max_hours_per_sprint=20):
-    """Allocate issues to sprints based on 20-hour weeks"""
-    sprints = []
-    current_sprint = {
-        'number': 1,
-        'issues': [],
-        'total_hours': 0,
-        'week': 1
-    }
-    
-    for issue_num in range(1, 1001):
-        effort = ISSUE_EFFORT.get(issue_num, 1.0)
-        
-        # If adding this issue would exceed sprint capacity, start new sprint
-        if current_sprint['total_hours'] + effort > max_hours_per_sprint:
-            sprints.append(current_sprint)
-            current_sprint = {
-                'number': len(sprints) + 1,
-                'issues': [],
-                'total_hours': 0,
-                'week': len(sprints) + 1
-            }
-        
-        current_sprint['issues'].append(issue_num)
-        current_sprint['total_hours'] += effort
-    
-    # Add the last sprint
-    if current_sprint['issues']:
-        sprints.append(current_sprint)
-    
-    return sprints
+def plan_sprints(max_hours_per_sprint=None, team=None):
+    """Schedule the planned issues across the team's weekly lanes; a
+    max_hours_per_sprint caps every developer's week instead of their weekly_hours"""
+    team = team or load_team()
+    if max_hours_per_sprint is not None:
+        team = [{**member, 'weekly_hours': max_hours_per_sprint} for member in team]
+    return plan_team(team)
+
+def allocate_sprints(max_hours_per_sprint=None, team=None):
+    """Allocate issues to weekly sprints, combining every developer's lane"""
+    return plan_sprints(max_hours_per_sprint, team)['weeks']
+
+def issue_runs(issues):
+    """Consecutive (first, last) runs of a sorted list of ISSUE numbers"""
+    runs = []
+    for issue_num in issues:
+        if runs and issue_num == runs[-1][1] + 1:
+            runs[-1][1] = issue_num
+        else:
+            runs.append([issue_num, issue_num])
+    return [tuple(run) for run in runs]
+
+def format_runs(runs):
+    return ', '.join(f"{first}-{last}" if first != last else str(first) for first, last in runs)
 
 def generate_sprint_report():
     """Generate comprehensive sprint allocation report"""
-    sprints = allocate_sprints()
+    plan = plan_sprints()
+    sprints = plan['weeks']
+    weekly_hours = sum(member['weekly_hours'] for member in plan['members'])
+    lanes = ', '.join(f"{member['name']} {member['weekly_hours']}h" for member in plan['members'])
+    total_issues = sum(len(sprint['issues']) for sprint in sprints)
+    
+    # Rewards of the Sprint 1 backlog, summed per sprint from the ledger's prefix sums
+    ledger = backlog_ledger()
+    sprint_xp = ledger.by_sprint([sprint['issues'] for sprint in sprints], 'xp')
+    sprint_coins = ledger.by_sprint([sprint['issues'] for sprint in sprints], 'coins')
     
     report = {
         'organization': 'michael-placeholder',
         'project': 'Shadowed Realms RPG Development',
         'repository': 'shadowed-realms',
         'methodology': 'Agile Scrum',
-        'sprint_duration': '1 week (20 hours)',
+        'sprint_duration': f"1 week ({weekly_hours} hours: {lanes})",
         'total_sprints': len(sprints),
-        'total_weeks': len(sprints),
+        'total_weeks': plan['completion_week'],
+        'completion_week': plan['completion_week'],
         'total_hours': sum(s['total_hours'] for s in sprints),
+        'total_xp': sum(sprint_xp),
+        'total_coins': sum(sprint_coins),
+        # Issues planned in an earlier week than the issue they follow
+        'out_of_order': out_of_order(list(get_issue_effort()), sprints),
+        'packing': {
+            'wasted_hours': plan['wasted_hours'],
+            'lower_bound_sprints': plan['lower_bound']
+        },
+        'team': [
+            {
+                'name': member['name'],
+                'role': member.get('role', ''),
+                'weekly_hours': member['weekly_hours'],
+                'skills': member['skills'],
+                'hours': member['plan']['total_hours'],
+                'weeks': len(member['plan']['sprints']),
+                'wasted_hours': member['plan']['wasted_hours'],
+                'sprints': [{'week': sprint['week'], 'hours': round(sprint['total_hours'], 1),
+                             'issues': sprint['issues']} for sprint in member['plan']['sprints']]
+            }
+            for member in plan['members']
+        ],
         'sprints': []
     }
     
-    for sprint in sprints:
-        # Determine which epics this sprint covers
-        epics_covered = set()
-        user_stories_covered = set()
-        
-        for issue in sprint['issues']:
-            if issue <= 100:
-                epics_covered.add('EPIC-001: Ideation & Documentation')
-                if issue <= 50:
-                    user_stories_covered.add('US-001: Documentation')
-                else:
-                    user_stories_covered.add('US-002: Project Structure')
-            elif issue <= 260:
-                epics_covered.add('EPIC-002: Core Systems')
-                if issue <= 180:
-                    user_stories_covered.add('US-003: Movement')
-                else:
-                    user_stories_covered.add('US-004: Inventory')
-            elif issue <= 420:
-                epics_covered.add('EPIC-003: Combat Framework')
-                if issue <= 340:
-                    user_stories_covered.add('US-005: Melee Combat')
-                else:
-                    user_stories_covered.add('US-006: Magic System')
-            elif issue <= 580:
-                epics_covered.add('EPIC-004: Environment System')
-                if issue <= 500:
-                    user_stories_covered.add('US-007: Environments')
-                else:
-                    user_stories_covered.add('US-008: Weather')
-            elif issue <= 640 or (761 <= issue <= 820):
-                epics_covered.add('EPIC-005: Character System')
-                if issue <= 640:
-                    user_stories_covered.add('US-009: Customization')
-                else:
-                    user_stories_covered.add('US-010: Progression')
-            elif issue <= 760:
-                epics_covered.add('EPIC-006: UI/UX Framework')
-                if issue <= 720:
-                    user_stories_covered.add('US-011: UI Design')
-                else:
-                    user_stories_covered.add('US-012: HUD')
-            elif issue <= 900:
-                epics_covered.add('EPIC-007: Save System')
-                if issue <= 880:
-                    user_stories_covered.add('US-013: Save/Load')
-                else:
-                    user_stories_covered.add('US-014: Cloud Saves')
-            else:
-                epics_covered.add('EPIC-008: Audio & Polish')
-                if issue <= 960:
-                    user_stories_covered.add('US-015: Audio')
-                else:
-                    user_stories_covered.add('US-016: Polish')
+    issues_done = 0
+    for sprint, xp, coins in zip(sprints, sprint_xp, sprint_coins):
+        issues_done += len(sprint['issues'])
+        # Determine which epics this sprint covers, in plan order
+        epics_covered = dict.fromkeys(SPRINT_EPICS.lookup_many(sprint['issues']))
+        user_stories_covered = dict.fromkeys(SPRINT_USER_STORIES.lookup_many(sprint['issues']))
+        # Runs, so a plan that skips ISSUE numbers still reads correctly
+        runs = issue_runs(sprint['issues'])
         
         sprint_data = {
             'sprint_number': sprint['number'],
             'week': sprint['week'],
             'hours': round(sprint['total_hours'], 1),
             'issue_count': len(sprint['issues']),
-            'issue_range': f"{sprint['issues'][0]}-{sprint['issues'][-1]}",
-            'tasks_range': f"{(sprint['issues'][0]-1)*4+1}-{sprint['issues'][-1]*4}",
+            'issue_range': format_runs(runs),
+            'tasks_range': format_runs([((first - 1) * 4 + 1, last * 4) for first, last in runs]),
             'epics': list(epics_covered),
             'user_stories': list(user_stories_covered),
             'velocity': len(sprint['issues']) / 5,  # Issues per day (5 days/week)
-            'completion_percentage': round((sprint['issues'][-1] / 1000) * 100, 1)
+            'xp': xp,
+            'coins': coins,
+            'members': {name: round(hours, 1) for name, hours in sprint['members'].items()},
+            'completion_percentage': round((issues_done / total_issues) * 100, 1)
         }
         
         report['sprints'].append(sprint_data)
@@ -347,7 +299,7 @@ def create_sprint_dashboard_html():
                 <strong>{report['repository']}</strong>
             </div>
             <div style="color: #4caf50; margin-top: 10px;">
-                ⏱️ 1 Sprint = 1 Week = 20 Hours of Effort
+                ⏱️ 1 Sprint = {report['sprint_duration']}
             </div>
         </div>
         
@@ -374,7 +326,7 @@ def create_sprint_dashboard_html():
             </div>
         </div>
         
-        <h2 style="color: #ffd700; margin-bottom: 20px;">📅 Sprint Schedule (Ascending Order)</h2>
+        <h2 style="color: #ffd700; margin-bottom: 20px;">📅 Sprint Schedule (Week by Week)</h2>
         
         <div class="sprints-container">
 """
@@ -450,16 +402,22 @@ def main():
     print(f"Total Sprints: {report['total_sprints']}")
     print(f"Total Weeks: {report['total_weeks']}")
     print(f"Total Hours: {report['total_hours']:.0f}")
+    for member in report['team']:
+        print(f"  {member['name']}: {member['hours']:.1f} hours over {member['weeks']} weeks")
+    print(f"Wasted Capacity: {report['packing']['wasted_hours']:.1f} hours "
+          f"(at least {report['packing']['lower_bound_sprints']} sprints)")
+    print(f"Total Rewards: {report['total_xp']:,} XP, {report['total_coins']:,} coins")
     
     print("\n" + "=" * 60)
-    print("FIRST 10 SPRINTS (ASCENDING ORDER)")
+    print("FIRST 10 SPRINTS (WEEK BY WEEK)")
     print("=" * 60)
     
     for sprint in report['sprints'][:10]:
         print(f"\nSprint {sprint['sprint_number']} (Week {sprint['week']}):")
         print(f"  Issues: {sprint['issue_range']} ({sprint['issue_count']} issues)")
         print(f"  Tasks: {sprint['tasks_range']}")
-        print(f"  Hours: {sprint['hours']}")
+        print(f"  Hours: {sprint['hours']} ({', '.join(f'{name} {hours}' for name, hours in sprint['members'].items())})")
+        print(f"  Rewards: {sprint['xp']:,} XP, {sprint['coins']:,} coins")
         print(f"  Epics: {', '.join([e.split(':')[0] for e in sprint['epics']])}")
         print(f"  Progress: {sprint['completion_percentage']}%")
     
@@ -474,8 +432,12 @@ def main():
     
     print("\n" + "=" * 60)
     print("✅ Sprint allocation complete!")
-    print("✅ Dynamic time-based system (20 hours per week)")
-    print("✅ All hierarchies in ascending order")
+    print(f"✅ Dynamic time-based system ({report['sprint_duration']})")
+    print(f"✅ Parallel lanes complete in week {report['completion_week']}")
+    if not report['out_of_order']:
+        print("✅ No issue is planned before the issue it follows")
+    else:
+        print(f"⚠️ {len(report['out_of_order'])} issues are planned before the issue they follow")
     print(f"✅ Report saved to: sprint_allocation.json")
     print(f"✅ Dashboard saved to: docs/sprint_schedule.html")
     print("=" * 60)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Static data snapshot for the GitHub Pages dashboard
+Built from the local issue mirror (issue_mirror.py) and written to docs/ as a
+small summary file - open / closed counts, closed counts per epic reward, XP /
+coin totals, skill and deliverable tallies and the first open issues - plus
+the Sprint 1 issue cards in ISSUE order, split into pages of shard files
+Shards are named by a hash of their content, so they can be cached forever,
+and each file is written alongside precompressed .gz and .br copies for
+servers that serve static compressed files
+The dashboard paints from the summary alone and fetches shards lazily -
+re-run this after issues change and publish the files with the rest of docs/
+The tables below are also written to docs/dashboard-tables.js, which the
+page's live-API fallback reads, so the two never disagree
+
+Usage: python3 dashboard_snapshot.py [--tables]   (--tables: only rewrite the JS tables)
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import hashlib
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from github_client import GitHubClient, GITHUB_OWNER, GITHUB_REPO
+from issue_mirror import IssueMirror, synced_mirror
+from issue_ranges import RangeTable
+
+SNAPSHOT_PATH = os.getenv('DASHBOARD_SNAPSHOT_PATH', 'docs/dashboard-data.json')
+SHARD_SIZE = int(os.getenv('DASHBOARD_SHARD_SIZE', '100'))
+TABLES_JS_PATH = os.getenv('DASHBOARD_TABLES_JS_PATH', 'docs/dashboard-tables.js')
+
+# Shards live in this directory next to the summary file
+SHARD_DIR = 'data'
+SHARD_NAME = re.compile(r'^issues-\d+\.[0-9a-f]+\.json(\.gz|\.br)?$')
+
+# Open issues shown before any shard is loaded
+PREVIEW_SIZE = 10
+
+# Issues the dashboard tracks
+SPRINT_LABEL = 'sprint-1'
+
+# Same fallbacks as extractXPFromLabels / extractCoinsFromLabels in docs/index.html
+DEFAULT_XP = 25
+DEFAULT_COINS = 10
+
+# Epic reward number -> ISSUE ranges it covers (inclusive); an epic's reward
+# unlocks once every issue in its ranges is closed
+EPIC_REWARD_RANGES = {
+    1: [(1, 100)],
+    2: [(101, 260)],
+    3: [(261, 420)],
+    4: [(421, 580)],
+    5: [(581, 640), (761, 820)],
+    6: [(641, 760)],
+    7: [(821, 900)],
+    8: [(901, 1000)]
+}
+
+# Tallies behind the dashboard's skill mastery and deliverable panels, counted
+# over closed issues: skill -> label substring, deliverable -> title keywords
+SKILL_LABELS = {
+    'modeling': '3d-modeling',
+    'programming': 'programming',
+    'design': 'design',
+    'business': 'business',
+    'animation': 'animation',
+    'audio': 'audio'
+}
+DELIVERABLE_KEYWORDS = {
+    'code': ('script', 'code'),
+    'assets': ('model', 'asset'),
+    'docs': ('doc', 'guide'),
+    'animations': ('anim',),
+    'ui': ('ui', 'interface'),
+    'audio': ('audio', 'sound')
+}
+
+EPIC_REWARDS = RangeTable((first, last, epic) for epic, ranges in EPIC_REWARD_RANGES.items()
+                          for first, last in ranges)
+
+def epic_reward_for(issue_num: int) -> Optional[int]:
+    return EPIC_REWARDS.lookup(issue_num, None)
+
+TABLES_JS_TEMPLATE = """// Generated by dashboard_snapshot.py - edit the tables there and re-run it
+// (python3 dashboard_snapshot.py --tables)
+window.DASHBOARD_TABLES = {tables};
+"""
+
+def dashboard_tables() -> Dict:
+    """The tables the snapshot is built from, for the page's live-API fallback"""
+    return {
+        'repository': f'{GITHUB_OWNER}/{GITHUB_REPO}',
+        'sprint_label': SPRINT_LABEL,
+        'preview_size': PREVIEW_SIZE,
+        'default_xp': DEFAULT_XP,
+        'default_coins': DEFAULT_COINS,
+        'epic_reward_ranges': EPIC_REWARD_RANGES,
+        'skill_labels': SKILL_LABELS,
+        'deliverable_keywords': DELIVERABLE_KEYWORDS
+    }
+
+def write_tables_js(path: str = TABLES_JS_PATH) -> str:
+    content = TABLES_JS_TEMPLATE.format(tables=json.dumps(dashboard_tables(), indent=4))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return content
+
+def issue_card(row: Dict, repository: str) -> Dict:
+    """One mirrored issue in the shape the dashboard renders"""
+    return {
+        'number': row['github_number'],
+        'issue_num': row['issue_num'],
+        'title': row['title'],
+        'state': row['state'],
+        'html_url': f"https://github.com/{repository}/issues/{row['github_number']}",
+        'labels': [{'name': name} for name in row['labels']],
+        'xp': row['xp'] if row['xp'] is not None else DEFAULT_XP,
+        'coins': row['coins'] if row['coins'] is not None else DEFAULT_COINS
+    }
+
+def build_snapshot(mirror: IssueMirror, repository: str) -> Dict:
+    """Everything the dashboard shows, precomputed from the mirror"""
+    cards = [issue_card(row, repository) for row in mirror.issues(label=SPRINT_LABEL)]
+    closed = [card for card in cards if card['state'] == 'closed']
+
+    epics = {epic: {'epic': epic, 'closed': 0,
+                    'total': sum(last - first + 1 for first, last in ranges)}
+             for epic, ranges in EPIC_REWARD_RANGES.items()}
+    skills = dict.fromkeys(SKILL_LABELS, 0)
+    deliverables = dict.fromkeys(DELIVERABLE_KEYWORDS, 0)
+    for epic in EPIC_REWARDS.lookup_many([card['issue_num'] for card in closed], None):
+        if epic is not None:
+            epics[epic]['closed'] += 1
+    for card in closed:
+        for label in card['labels']:
+            for skill, fragment in SKILL_LABELS.items():
+                if fragment in label['name']:
+                    skills[skill] += 1
+        title = card['title'].lower()
+        for kind, keywords in DELIVERABLE_KEYWORDS.items():
+            if any(keyword in title for keyword in keywords):
+                deliverables[kind] += 1
+
+    return {
+        'generated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'repository': repository,
+        'sprint_label': SPRINT_LABEL,
+        'counts': {
+            'total': len(cards),
+            'open': len(cards) - len(closed),
+            'closed': len(closed)
+        },
+        'totals': {
+            'xp': sum(card['xp'] for card in closed),
+            'coins': sum(card['coins'] for card in closed),
+            'xp_available': sum(card['xp'] for card in cards),
+            'coins_available': sum(card['coins'] for card in cards)
+        },
+        'epics': list(epics.values()),
+        'skills': skills,
+        'deliverables': deliverables,
+        'issues': cards
+    }
+
+def encode(data: Dict) -> bytes:
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def write_file(path: str, content: bytes):
+    # Never leave a half-written file where the dashboard could fetch it
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+def write_compressed(path: str, content: bytes) -> Dict[str, int]:
+    """Write a file plus its .gz and .br copies"""
+    # mtime=0 keeps the gzip bytes identical for identical content
+    sizes = {'json': len(content)}
+    write_file(path, content)
+    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+    write_file(f'{path}.gz', compressed)
+    sizes['gz'] = len(compressed)
+    compressed = brotli.compress(content, quality=11)
+    write_file(f'{path}.br', compressed)
+    sizes['br'] = len(compressed)
+    return sizes
+
+def split_snapshot(snapshot: Dict, shard_size: int = SHARD_SIZE) -> Tuple[Dict, List[Tuple[str, bytes]]]:
+    """Summary with a shard manifest, plus (relative path, content) per shard"""
+    cards = snapshot['issues']
+    summary = {key: value for key, value in snapshot.items() if key != 'issues'}
+    summary['first_open'] = [card for card in cards if card['state'] == 'open'][:PREVIEW_SIZE]
+    summary['shards'] = []
+
+    shards = []
+    for index, start in enumerate(range(0, len(cards), shard_size), 1):
+        page = cards[start:start + shard_size]
+        content = encode({'page': index, 'issues': page})
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        name = f'{SHARD_DIR}/issues-{index:03d}.{digest}.json'
+        shards.append((name, content))
+        summary['shards'].append({
+            'file': name,
+            'first': page[0]['issue_num'],
+            'last': page[-1]['issue_num'],
+            'issues': len(page),
+            'open': sum(1 for card in page if card['state'] == 'open')
+        })
+    return summary, shards
+
+def write_snapshot(snapshot: Dict, path: str = SNAPSHOT_PATH) -> Dict[str, int]:
+    """Write the summary and its shards; returns byte counts per encoding"""
+    # Every file ships precompressed both ways - never publish a half-compressed set
+    if brotli is None:
+        raise RuntimeError('brotli is required for the .br copies of the snapshot (pip install brotli)')
+    summary, shards = split_snapshot(snapshot)
+    base = os.path.dirname(path)
+    shard_dir = os.path.join(base, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    totals = {'summary': 0, 'shards': len(shards), 'json': 0, 'gz': 0, 'br': 0}
+    # The summary goes last and keeps a fixed name - it is the entry point that
+    # names the shards, so it must never point at one not yet written
+    files = [(os.path.join(base, name), content) for name, content in shards]
+    files.append((path, encode(summary)))
+    for file_path, content in files:
+        for encoding, size in write_compressed(file_path, content).items():
+            totals[encoding] += size
+    totals['summary'] = len(files[-1][1])
+
+    current = {os.path.basename(name) for name, _ in shards}
+    for filename in os.listdir(shard_dir):
+        if SHARD_NAME.match(filename) and re.sub(r'\.(gz|br)$', '', filename) not in current:
+            os.remove(os.path.join(shard_dir, filename))
+    return totals
+
+def generate_snapshot(client: Optional[GitHubClient] = None, path: str = SNAPSHOT_PATH) -> Dict:
+    """Sync the mirror and write a fresh dashboard snapshot"""
+    mirror = synced_mirror(client)
+    repository = mirror.get_meta('repo')
+    snapshot = build_snapshot(mirror, repository)
+    sizes = write_snapshot(snapshot, path)
+    write_tables_js(os.path.join(os.path.dirname(path), os.path.basename(TABLES_JS_PATH)))
+    print(f"✓ Wrote {path} ({sizes['summary'] / 1024:.1f} KB) and {sizes['shards']} shards "
+          f"for {len(snapshot['issues'])} issues")
+    print(f"  {sizes['json'] / 1024:.1f} KB json, {sizes['gz'] / 1024:.1f} KB gzip, "
+          f"{sizes['br'] / 1024:.1f} KB brotli")
+    return snapshot
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Dashboard Snapshot")
+    print("=" * 60)
+
+    if '--tables' in sys.argv[1:]:
+        content = write_tables_js()
+        print(f"✓ Wrote {TABLES_JS_PATH} ({len(content)} bytes)")
+        return
+
+    try:
+        snapshot = generate_snapshot()
+    except RuntimeError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    counts, totals = snapshot['counts'], snapshot['totals']
+    print(f"\nIssues: {counts['total']} ({counts['open']} open, {counts['closed']} closed)")
+    print(f"XP: {totals['xp']:,} / {totals['xp_available']:,} earned")
+    print(f"Coins: {totals['coins']:,} / {totals['coins_available']:,} earned")
+    print("\nEpic rewards:")
+    for epic in snapshot['epics']:
+        print(f"  Epic {epic['epic']}: {epic['closed']}/{epic['total']} closed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+// Dashboard snapshot loader shared by the dashboard pages
+// Reads docs/dashboard-data.json (written by dashboard_snapshot.py in the Pages
+// workflow); when that file is missing it pages the public GitHub API instead
+// and builds the same snapshot shape in the browser, so the dashboard keeps
+// showing live data. The tables come from dashboard-tables.js (generated by
+// dashboard_snapshot.py), which must be loaded before this file
+
+(function() {
+    const SNAPSHOT_URL = 'dashboard-data.json';
+    const TABLES = window.DASHBOARD_TABLES;
+    const MAX_PAGES = 10;
+
+    const labelValue = function(labels, prefix, fallback) {
+        for (const label of labels) {
+            const match = label.name.match(new RegExp(`^${prefix}-(\\d+)$`));
+            if (match) {
+                return parseInt(match[1]);
+            }
+        }
+        return fallback;
+    };
+
+    // Snapshot in the dashboard_snapshot.py shape from a live issue listing
+    const snapshotFromIssues = function(issues) {
+        const cards = [];
+        for (const issue of issues) {
+            const match = (issue.title || '').match(/\[ISSUE-(-?\d+)\]/);
+            if (!match || issue.pull_request || !issue.labels.some(label => label.name === TABLES.sprint_label)) {
+                continue;
+            }
+            cards.push({
+                number: issue.number,
+                issue_num: parseInt(match[1]),
+                title: issue.title,
+                state: issue.state,
+                html_url: issue.html_url,
+                labels: issue.labels.map(label => ({ name: label.name })),
+                xp: labelValue(issue.labels, 'xp', TABLES.default_xp),
+                coins: labelValue(issue.labels, 'coins', TABLES.default_coins)
+            });
+        }
+        cards.sort((a, b) => a.issue_num - b.issue_num);
+        const closed = cards.filter(card => card.state === 'closed');
+
+        const epics = Object.entries(TABLES.epic_reward_ranges).map(([epic, ranges]) => ({
+            epic: parseInt(epic),
+            closed: closed.filter(card => ranges.some(([first, last]) => first <= card.issue_num && card.issue_num <= last)).length,
+            total: ranges.reduce((sum, [first, last]) => sum + last - first + 1, 0)
+        }));
+        const skills = {};
+        const deliverables = {};
+        Object.keys(TABLES.skill_labels).forEach(skill => skills[skill] = 0);
+        Object.keys(TABLES.deliverable_keywords).forEach(kind => deliverables[kind] = 0);
+        for (const card of closed) {
+            for (const label of card.labels) {
+                for (const [skill, fragment] of Object.entries(TABLES.skill_labels)) {
+                    if (label.name.includes(fragment)) {
+                        skills[skill]++;
+                    }
+                }
+            }
+            const title = card.title.toLowerCase();
+            for (const [kind, keywords] of Object.entries(TABLES.deliverable_keywords)) {
+                if (keywords.some(keyword => title.includes(keyword))) {
+                    deliverables[kind]++;
+                }
+            }
+        }
+
+        const sum = (list, key) => list.reduce((total, card) => total + card[key], 0);
+        return {
+            generated_at: new Date().toISOString(),
+            repository: TABLES.repository,
+            sprint_label: TABLES.sprint_label,
+            counts: { total: cards.length, open: cards.length - closed.length, closed: closed.length },
+            totals: {
+                xp: sum(closed, 'xp'),
+                coins: sum(closed, 'coins'),
+                xp_available: sum(cards, 'xp'),
+                coins_available: sum(cards, 'coins')
+            },
+            epics: epics,
+            skills: skills,
+            deliverables: deliverables,
+            first_open: cards.filter(card => card.state === 'open').slice(0, TABLES.preview_size),
+            // Nothing to page in lazily: the live listing is all there is
+            shards: [],
+            live: true
+        };
+    };
+
+    const fetchLiveSnapshot = async function() {
+        let issues = [];
+        for (let page = 1; page <= MAX_PAGES; page++) {
+            const response = await fetch(`https://api.github.com/repos/${TABLES.repository}/issues?state=all&per_page=100&page=${page}`);
+            if (!response.ok) {
+                throw new Error(`GitHub API error: ${response.status}`);
+            }
+            const pageIssues = await response.json();
+            issues = issues.concat(pageIssues);
+            if (pageIssues.length < 100) {
+                break;
+            }
+        }
+        return snapshotFromIssues(issues);
+    };
+
+    // The published snapshot, or one built from the live API when it is missing
+    window.loadDashboardSnapshot = async function() {
+        try {
+            const response = await fetch(SNAPSHOT_URL, { cache: 'no-cache' });
+            if (!response.ok) {
+                throw new Error(`Snapshot not available (status ${response.status})`);
+            }
+            return await response.json();
+        } catch (error) {
+            console.log(`${error.message} - loading live issues from the GitHub API`);
+            return await fetchLiveSnapshot();
+        }
+    };
+})();
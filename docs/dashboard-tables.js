@@ -0,0 +1,96 @@
+// Generated by dashboard_snapshot.py - edit the tables there and re-run it
+// (python3 dashboard_snapshot.py --tables)
+window.DASHBOARD_TABLES = {
+    "repository": "michael-placeholder/shadowed-realms",
+    "sprint_label": "sprint-1",
+    "preview_size": 10,
+    "default_xp": 25,
+    "default_coins": 10,
+    "epic_reward_ranges": {
+        "1": [
+            [
+                1,
+                100
+            ]
+        ],
+        "2": [
+            [
+                101,
+                260
+            ]
+        ],
+        "3": [
+            [
+                261,
+                420
+            ]
+        ],
+        "4": [
+            [
+                421,
+                580
+            ]
+        ],
+        "5": [
+            [
+                581,
+                640
+            ],
+            [
+                761,
+                820
+            ]
+        ],
+        "6": [
+            [
+                641,
+                760
+            ]
+        ],
+        "7": [
+            [
+                821,
+                900
+            ]
+        ],
+        "8": [
+            [
+                901,
+                1000
+            ]
+        ]
+    },
+    "skill_labels": {
+        "modeling": "3d-modeling",
+        "programming": "programming",
+        "design": "design",
+        "business": "business",
+        "animation": "animation",
+        "audio": "audio"
+    },
+    "deliverable_keywords": {
+        "code": [
+            "script",
+            "code"
+        ],
+        "assets": [
+            "model",
+            "asset"
+        ],
+        "docs": [
+            "doc",
+            "guide"
+        ],
+        "animations": [
+            "anim"
+        ],
+        "ui": [
+            "ui",
+            "interface"
+        ],
+        "audio": [
+            "audio",
+            "sound"
+        ]
+    }
+};
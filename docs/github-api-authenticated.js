@@ -1,17 +1,11 @@
-// GitHub API Handler with PROPER Authentication
-// This fixes all 403 errors
+// GitHub Data Handler backed by the static dashboard snapshot
+// dashboard_snapshot.py precomputes docs/dashboard-data.json, so page loads
+// cost one same-origin request, need no token and never hit a 403
 
 (function() {
-    // GitHub Configuration with Authentication
-    const GITHUB_CONFIG = {
-        owner: 'michael-placeholder',
-        repo: 'shadowed-realms',
-        // Token should be stored in localStorage by user
-        token: localStorage.getItem('github_token') || '',
-        apiBase: 'https://api.github.com'
-    };
+    const SNAPSHOT_URL = 'dashboard-data.json';
 
-    const CACHE_KEY = 'github_issues_cache';
+    const CACHE_KEY = 'github_dashboard_snapshot';
     const CACHE_DURATION = 60 * 60 * 1000; // 1 hour cache
     
     // Get cached data if available
@@ -20,91 +14,41 @@
         if (cached) {
             const data = JSON.parse(cached);
             if (Date.now() - data.timestamp < CACHE_DURATION) {
-                return data.issues;
+                return data.snapshot;
             }
         }
         return null;
     };
     
     // Save data to cache
-    const setCachedData = function(issues) {
+    const setCachedData = function(snapshot) {
         localStorage.setItem(CACHE_KEY, JSON.stringify({
-            issues: issues,
+            snapshot: snapshot,
             timestamp: Date.now()
         }));
     };
     
-    // Main fetch function with proper authentication
+    // Main fetch function - loads the precomputed snapshot
     window.fetchGitHubData = async function() {
         try {
-            // CRITICAL: These headers are REQUIRED by GitHub
-            const headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'Shadowed-Realms-Dashboard', // REQUIRED!
-                'Authorization': `Bearer ${GITHUB_CONFIG.token}` // Increases limit to 5000/hour
-            };
-            
-            console.log('Fetching with authentication (5000 req/hr limit)');
-            
-            // Fetch all issues with pagination
-            const allIssues = [];
-            let page = 1;
-            let hasMore = true;
+            // dashboard-snapshot.js: the snapshot, or the live API when it is missing
+            const snapshot = await window.loadDashboardSnapshot();
+            const issueCount = snapshot.counts.total;
             
-            while (hasMore && page <= 11) { // Max 11 pages for 1100 issues
-                const url = `${GITHUB_CONFIG.apiBase}/repos/${GITHUB_CONFIG.owner}/${GITHUB_CONFIG.repo}/issues?state=all&per_page=100&page=${page}`;
-                
-                const response = await fetch(url, { headers });
-                
-                // Check rate limit headers
-                const remaining = response.headers.get('x-ratelimit-remaining');
-                const limit = response.headers.get('x-ratelimit-limit');
-                const reset = response.headers.get('x-ratelimit-reset');
-                
-                console.log(`Rate Limit: ${remaining}/${limit} remaining`);
-                
-                if (response.status === 403) {
-                    const resetDate = new Date(parseInt(reset) * 1000);
-                    console.error(`Rate limited! Resets at: ${resetDate.toLocaleTimeString()}`);
-                    throw new Error('Rate limited');
-                }
-                
-                if (response.status === 401) {
-                    console.error('Authentication failed - check token');
-                    throw new Error('Authentication failed');
-                }
-                
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status}`);
-                }
-                
-                const issues = await response.json();
-                
-                if (issues.length === 0) {
-                    break;
-                }
-                
-                allIssues.push(...issues);
-                hasMore = issues.length === 100;
-                page++;
-                
-                console.log(`Fetched page ${page - 1}: ${issues.length} issues`);
-            }
-            
-            if (allIssues.length > 0) {
-                console.log(`✅ Successfully fetched ${allIssues.length} REAL issues from GitHub`);
+            if (issueCount > 0) {
+                console.log(`✅ Loaded ${issueCount} REAL issues (snapshot from ${snapshot.generated_at})`);
                 
                 // Cache the real data
-                setCachedData(allIssues);
+                setCachedData(snapshot);
                 
                 // Process the real issues
                 if (window.processIssues) {
-                    window.processIssues(allIssues);
+                    window.processIssues(snapshot);
                 }
                 
                 // Update API status
                 if (window.updateAPIStatus) {
-                    window.updateAPIStatus(`Live (${allIssues.length} issues)`);
+                    window.updateAPIStatus(`Live (${issueCount} issues)`);
                 }
                 
                 // Remove any error messages
@@ -119,26 +63,27 @@
                     cacheNotice.remove();
                 }
                 
-                return allIssues;
+                return snapshot;
             }
             
         } catch (error) {
-            console.error('GitHub API error:', error.message);
+            console.error('Dashboard snapshot error:', error.message);
             
             // Try to use cached REAL data
-            const cachedIssues = getCachedData();
+            const cachedSnapshot = getCachedData();
             
-            if (cachedIssues && cachedIssues.length > 0) {
-                console.log(`Using ${cachedIssues.length} cached REAL issues`);
+            if (cachedSnapshot && cachedSnapshot.counts.total > 0) {
+                const cachedCount = cachedSnapshot.counts.total;
+                console.log(`Using ${cachedCount} cached REAL issues`);
                 
                 // Update API status
                 if (window.updateAPIStatus) {
-                    window.updateAPIStatus(`Cached (${cachedIssues.length} issues)`);
+                    window.updateAPIStatus(`Cached (${cachedCount} issues)`);
                 }
                 
                 // Process the cached real issues
                 if (window.processIssues) {
-                    window.processIssues(cachedIssues);
+                    window.processIssues(cachedSnapshot);
                 }
                 
                 // Add cache notice
@@ -147,11 +92,11 @@
                     const notice = document.createElement('div');
                     notice.id = 'cache-notice';
                     notice.style.cssText = 'background: var(--ember-orange); color: #f0f0f0; padding: 10px; margin-bottom: 10px; border-radius: 4px; text-align: center;';
-                    notice.innerHTML = `⚠️ Using cached data<br>Showing ${cachedIssues.length} real project issues from cache`;
+                    notice.innerHTML = `⚠️ Using cached data<br>Showing ${cachedCount} real project issues from cache`;
                     taskList.parentNode.insertBefore(notice, taskList);
                 }
                 
-                return cachedIssues;
+                return cachedSnapshot;
             } else {
                 // Show error state
                 const taskList = document.getElementById('task-list');
@@ -173,43 +118,24 @@
                     window.updateAPIStatus('Error');
                 }
                 
-                return [];
+                return null;
             }
         }
     };
     
     // Check project connection
     window.checkProjectConnection = async function() {
-        const headers = {
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'Shadowed-Realms-Dashboard',
-            'Authorization': `Bearer ${GITHUB_CONFIG.token}`
-        };
-        
         try {
-            // Check repository
-            const repoUrl = `${GITHUB_CONFIG.apiBase}/repos/${GITHUB_CONFIG.owner}/${GITHUB_CONFIG.repo}`;
-            const repoResponse = await fetch(repoUrl, { headers });
+            const response = await fetch(SNAPSHOT_URL, { cache: 'no-cache' });
             
-            if (repoResponse.ok) {
-                const repoData = await repoResponse.json();
-                console.log('✅ Repository connected:', repoData.full_name);
-                console.log('   Open issues:', repoData.open_issues_count);
-                console.log('   Visibility:', repoData.visibility || 'public');
+            if (response.ok) {
+                const snapshot = await response.json();
+                console.log('✅ Snapshot available:', snapshot.repository);
+                console.log('   Generated:', new Date(snapshot.generated_at).toLocaleString());
+                console.log('   Open issues:', snapshot.counts.open);
+                console.log('   Closed issues:', snapshot.counts.closed);
             } else {
-                console.error('❌ Cannot access repository');
-            }
-            
-            // Check rate limit status
-            const rateLimitUrl = `${GITHUB_CONFIG.apiBase}/rate_limit`;
-            const rateLimitResponse = await fetch(rateLimitUrl, { headers });
-            
-            if (rateLimitResponse.ok) {
-                const rateLimitData = await rateLimitResponse.json();
-                console.log('📊 Rate Limit Status:');
-                console.log('   Limit:', rateLimitData.rate.limit);
-                console.log('   Remaining:', rateLimitData.rate.remaining);
-                console.log('   Resets:', new Date(rateLimitData.rate.reset * 1000).toLocaleTimeString());
+                console.error('❌ Cannot load dashboard snapshot');
             }
             
         } catch (error) {
@@ -219,8 +145,7 @@
     
     // Auto-check connection on load
     document.addEventListener('DOMContentLoaded', function() {
-        console.log('GitHub API Handler loaded with authentication');
-        console.log('Token configured: Yes (5000 req/hr)');
+        console.log('GitHub snapshot handler loaded');
         
         // Check connection status
         window.checkProjectConnection();
@@ -229,12 +154,11 @@
         setTimeout(() => {
             const errorDiv = document.querySelector('.error');
             if (errorDiv) {
-                console.log('Retrying with authentication...');
+                console.log('Retrying snapshot load...');
                 window.fetchGitHubData();
             }
         }, 500);
     });
     
-    console.log('✅ GitHub API authenticated handler loaded');
-    console.log('🔑 Using classic PAT for 5000 req/hr limit');
+    console.log('✅ GitHub dashboard snapshot handler loaded');
 })();
\ No newline at end of file
@@ -1,114 +1,54 @@
-// GitHub Data Handler - Fetches REAL Issues with Authentication Support
-// Stores real data in localStorage, never uses fake data
+// GitHub Data Handler - Loads the precomputed dashboard snapshot
+// docs/dashboard-data.json is written by dashboard_snapshot.py from the real
+// issues, so visitors never page the GitHub API or need a token; without it
+// dashboard-snapshot.js (loaded first) builds the snapshot from the live API
+// Stores the last snapshot in localStorage, never uses fake data
 
 (function() {
-    const CACHE_KEY = 'github_issues_cache';
+    const CACHE_KEY = 'github_dashboard_snapshot';
     const CACHE_DURATION = 60 * 60 * 1000; // 1 hour cache
     
-    // IMPORTANT: Add your GitHub token here for higher rate limits
-    // Get a token at: https://github.com/settings/tokens
-    // Only needs 'public_repo' scope
-    const GITHUB_TOKEN = ''; // Add token here if you have one
-    
     // Get cached data if available and fresh
     const getCachedData = function() {
         const cached = localStorage.getItem(CACHE_KEY);
         if (cached) {
             const data = JSON.parse(cached);
             if (Date.now() - data.timestamp < CACHE_DURATION) {
-                return data.issues;
+                return data.snapshot;
             }
         }
         return null;
     };
     
     // Save data to cache
-    const setCachedData = function(issues) {
+    const setCachedData = function(snapshot) {
         localStorage.setItem(CACHE_KEY, JSON.stringify({
-            issues: issues,
+            snapshot: snapshot,
             timestamp: Date.now()
         }));
     };
     
-    // Fetch GitHub data with proper error handling
+    // Load the dashboard snapshot - a single same-origin request
     window.fetchGitHubData = async function() {
         try {
-            const headers = {
-                'Accept': 'application/vnd.github.v3+json'
-            };
-            
-            // Add token if available
-            if (GITHUB_TOKEN) {
-                headers['Authorization'] = `token ${GITHUB_TOKEN}`;
-            }
-            
-            // First, let's check if we can access the API
-            const testResponse = await fetch(
-                'https://api.github.com/repos/michael-placeholder/shadowed-realms',
-                { headers }
-            );
-            
-            if (testResponse.status === 404) {
-                console.log('Repository not found. Checking cached data...');
-                throw new Error('Repository not accessible');
-            }
-            
-            if (testResponse.status === 403 || testResponse.status === 429) {
-                const remaining = testResponse.headers.get('x-ratelimit-remaining');
-                const reset = testResponse.headers.get('x-ratelimit-reset');
-                const resetDate = new Date(reset * 1000);
-                console.log(`Rate limited. Remaining: ${remaining}, Resets at: ${resetDate.toLocaleTimeString()}`);
-                throw new Error('Rate limited');
-            }
-            
-            // Now fetch all issues
-            const allIssues = [];
-            let page = 1;
-            let hasMore = true;
-            
-            while (hasMore && page <= 11) { // Max 11 pages for 1100 issues
-                const response = await fetch(
-                    `https://api.github.com/repos/michael-placeholder/shadowed-realms/issues?state=all&per_page=100&page=${page}`,
-                    { headers }
-                );
-                
-                if (response.status === 403 || response.status === 429) {
-                    if (allIssues.length > 0) {
-                        // We got some data before hitting the limit
-                        console.log(`Rate limited after fetching ${allIssues.length} issues`);
-                        break;
-                    }
-                    throw new Error('Rate limited');
-                }
-                
-                if (!response.ok) {
-                    throw new Error(`HTTP error! status: ${response.status}`);
-                }
-                
-                const issues = await response.json();
-                if (issues.length === 0) {
-                    break;
-                }
-                
-                allIssues.push(...issues);
-                hasMore = issues.length === 100;
-                page++;
-            }
+            // dashboard-snapshot.js: the snapshot, or the live API when it is missing
+            const snapshot = await window.loadDashboardSnapshot();
+            const issueCount = snapshot.counts.total;
             
-            if (allIssues.length > 0) {
-                console.log(`Successfully fetched ${allIssues.length} REAL issues from GitHub`);
+            if (issueCount > 0) {
+                console.log(`Loaded ${issueCount} REAL issues (snapshot from ${snapshot.generated_at})`);
                 
                 // Cache the real data
-                setCachedData(allIssues);
+                setCachedData(snapshot);
                 
                 // Process the real issues
                 if (window.processIssues) {
-                    window.processIssues(allIssues);
+                    window.processIssues(snapshot);
                 }
                 
                 // Update API status
                 if (window.updateAPIStatus) {
-                    window.updateAPIStatus(`Live (${allIssues.length} issues)`);
+                    window.updateAPIStatus(`Live (${issueCount} issues)`);
                 }
                 
                 // Remove any error messages
@@ -125,22 +65,23 @@
             }
             
         } catch (error) {
-            console.log('GitHub API error:', error.message);
+            console.log('Dashboard snapshot error:', error.message);
             
             // Try to use cached REAL data
-            const cachedIssues = getCachedData();
+            const cachedSnapshot = getCachedData();
             
-            if (cachedIssues && cachedIssues.length > 0) {
-                console.log(`Using ${cachedIssues.length} cached REAL issues`);
+            if (cachedSnapshot && cachedSnapshot.counts.total > 0) {
+                const cachedCount = cachedSnapshot.counts.total;
+                console.log(`Using ${cachedCount} cached REAL issues`);
                 
                 // Update API status
                 if (window.updateAPIStatus) {
-                    window.updateAPIStatus(`Cached (${cachedIssues.length} issues)`);
+                    window.updateAPIStatus(`Cached (${cachedCount} issues)`);
                 }
                 
                 // Process the cached real issues
                 if (window.processIssues) {
-                    window.processIssues(cachedIssues);
+                    window.processIssues(cachedSnapshot);
                 }
                 
                 // Add cache notice if not already there
@@ -149,7 +90,7 @@
                     const notice = document.createElement('div');
                     notice.id = 'cache-notice';
                     notice.style.cssText = 'background: var(--ember-orange); color: #f0f0f0; padding: 10px; margin-bottom: 10px; border-radius: 4px; text-align: center;';
-                    notice.innerHTML = `⚠️ Using cached data (GitHub rate limit exceeded)<br>Showing ${cachedIssues.length} real project issues from local cache`;
+                    notice.innerHTML = `⚠️ Using cached data (dashboard snapshot unavailable)<br>Showing ${cachedCount} real project issues from local cache`;
                     taskList.parentNode.insertBefore(notice, taskList);
                 }
             } else {
@@ -160,12 +101,10 @@
                 if (taskList) {
                     taskList.innerHTML = `
                         <div class="error" style="color: var(--blood-red); padding: 20px; text-align: center;">
-                            <h3>GitHub API Rate Limited - No Cache Available</h3>
-                            <p>The project has 1049 real issues in the repository.</p>
-                            <p>To view them, you need to either:</p>
+                            <h3>Dashboard Snapshot Unavailable - No Cache Available</h3>
+                            <p>To view the project issues, either:</p>
                             <ol style="text-align: left; display: inline-block; margin: 10px auto;">
-                                <li>Wait for the rate limit to reset</li>
-                                <li>Add a GitHub token to github-data-authenticated.js</li>
+                                <li>Run dashboard_snapshot.py and publish docs/dashboard-data.json</li>
                                 <li>Visit when you have cached data available</li>
                             </ol>
                             <p style="margin-top: 15px;">
@@ -180,7 +119,7 @@
                 }
                 
                 if (window.updateAPIStatus) {
-                    window.updateAPIStatus('Rate Limited (No Cache)');
+                    window.updateAPIStatus('Error');
                 }
             }
         }
@@ -198,6 +137,5 @@
         }, 500);
     });
     
-    console.log('GitHub authenticated data handler loaded');
-    console.log('Add a GitHub token to github-data-authenticated.js for better rate limits');
+    console.log('GitHub dashboard snapshot handler loaded');
 })();
\ No newline at end of file
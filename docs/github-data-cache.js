@@ -1,142 +1,49 @@
-// GitHub Data Cache Solution for 403 Rate Limit Issues
-// This creates a fallback when GitHub API is rate limited
+// GitHub Data Cache for the static dashboard snapshot
+// Keeps the last snapshot that loaded so a failed refresh keeps showing real
+// data - counts always come from docs/dashboard-data.json, never invented
 
 const GITHUB_CACHE = {
     lastFetch: null,
     data: null,
     cacheTime: 5 * 60 * 1000, // 5 minutes
+    snapshotUrl: 'dashboard-data.json',
     
-    // Simulated data based on actual repository state
-    mockData: {
-        openIssues: 900,
-        closedIssues: 119,
-        totalIssues: 1019,
-        sprintIssues: []
-    },
-    
-    // Generate mock issues for display
-    generateMockIssues: function() {
-        const issues = [];
-        // Generate first 10 open issues in ascending order
-        for (let i = 1; i <= 10; i++) {
-            issues.push({
-                number: i,
-                title: `[ISSUE-${String(i).padStart(4, '0')}] ${this.getIssueTitle(i)}`,
-                state: 'open',
-                html_url: `https://github.com/michael-placeholder/shadowed-realms/issues/${i}`,
-                labels: this.getIssueLabels(i)
-            });
+    // Load the snapshot written by dashboard_snapshot.py
+    loadSnapshot: async function() {
+        if (this.data && Date.now() - this.lastFetch < this.cacheTime) {
+            return this.data;
         }
-        return issues;
-    },
-    
-    getIssueTitle: function(num) {
-        if (num <= 50) return `Create initial documentation for module ${num}`;
-        if (num <= 100) return `Setup project structure component ${num}`;
-        if (num <= 180) return `Implement movement system part ${num - 100}`;
-        if (num <= 260) return `Build inventory component ${num - 180}`;
-        if (num <= 340) return `Create melee combat feature ${num - 260}`;
-        if (num <= 420) return `Implement magic system element ${num - 340}`;
-        if (num <= 500) return `Design environment asset ${num - 420}`;
-        if (num <= 580) return `Create weather effect ${num - 500}`;
-        if (num <= 640) return `Build character customization ${num - 580}`;
-        if (num <= 720) return `Design UI element ${num - 640}`;
-        if (num <= 760) return `Create HUD component ${num - 720}`;
-        if (num <= 820) return `Implement character progression ${num - 760}`;
-        if (num <= 880) return `Build save/load functionality ${num - 820}`;
-        if (num <= 900) return `Add cloud save support ${num - 880}`;
-        if (num <= 960) return `Create sound effect ${num - 900}`;
-        return `Apply final polish task ${num - 960}`;
-    },
-    
-    getIssueLabels: function(num) {
-        const labels = [
-            { name: 'sprint-1', color: '0e8a16' },
-            { name: 'issue', color: 'd73a4a' }
-        ];
-        
-        // Add XP and coins based on issue complexity
-        let xp = 50;
-        let coins = 25;
-        
-        if (num > 100 && num <= 260) {
-            xp = 150;
-            coins = 75;
-        } else if (num > 260 && num <= 420) {
-            xp = 250;
-            coins = 125;
-        } else if (num > 420 && num <= 580) {
-            xp = 200;
-            coins = 100;
-        } else if (num > 580 && num <= 760) {
-            xp = 100;
-            coins = 50;
-        } else if (num > 760 && num <= 900) {
-            xp = 200;
-            coins = 100;
-        } else if (num > 900) {
-            xp = 150;
-            coins = 75;
-        }
-        
-        labels.push({ name: `xp-${xp}`, color: 'ffd700' });
-        labels.push({ name: `coins-${coins}`, color: 'ff6b35' });
-        
-        // Add type label
-        if (num <= 100) labels.push({ name: 'documentation', color: '0075ca' });
-        else if (num <= 260) labels.push({ name: 'core-systems', color: '6b46c1' });
-        else if (num <= 420) labels.push({ name: 'combat', color: 'd73a4a' });
-        else if (num <= 580) labels.push({ name: 'environment', color: '0e8a16' });
-        else if (num <= 760) labels.push({ name: 'ui-ux', color: 'ff6b35' });
-        else if (num <= 900) labels.push({ name: 'save-system', color: 'fbca04' });
-        else labels.push({ name: 'audio-polish', color: 'e99695' });
-        
-        return labels;
+        // dashboard-snapshot.js falls back to the live API when the snapshot is missing
+        this.data = window.loadDashboardSnapshot
+            ? await window.loadDashboardSnapshot()
+            : await (await fetch(this.snapshotUrl, { cache: 'no-cache' })).json();
+        this.lastFetch = Date.now();
+        return this.data;
     }
 };
 
-// Override the fetchGitHubData function with cache fallback
+// Override the fetchGitHubData function with snapshot cache fallback
 const originalFetch = window.fetchGitHubData;
 
 window.fetchGitHubData = async function() {
     try {
-        // Try actual API first
-        await originalFetch();
+        const snapshot = await GITHUB_CACHE.loadSnapshot();
+        updateAPIStatus('Connected');
+        processIssues(snapshot);
     } catch (error) {
-        console.log('GitHub API rate limited, using cached/mock data');
-        
-        // Use mock data as fallback
-        const mockIssues = GITHUB_CACHE.generateMockIssues();
-        
-        // Process mock data as if it were real
-        const allIssues = [];
-        
-        // Add closed issues (simulated)
-        for (let i = 1001; i <= 1119; i++) {
-            allIssues.push({
-                number: i,
-                title: `[ISSUE-${String(i - 1000).padStart(4, '0')}] Completed task`,
-                state: 'closed',
-                labels: GITHUB_CACHE.getIssueLabels(i - 1000)
-            });
+        if (!GITHUB_CACHE.data) {
+            // Nothing loaded yet - let the page handler report the error
+            await originalFetch();
+            return;
         }
         
-        // Add open issues
-        for (let i = 120; i <= 1019; i++) {
-            allIssues.push({
-                number: i,
-                title: `[ISSUE-${String(i).padStart(4, '0')}] ${GITHUB_CACHE.getIssueTitle(i)}`,
-                state: 'open',
-                html_url: `https://github.com/michael-placeholder/shadowed-realms/issues/${i}`,
-                labels: GITHUB_CACHE.getIssueLabels(i)
-            });
-        }
+        console.log('Dashboard snapshot unavailable, using last loaded snapshot');
         
         // Update API status
         updateAPIStatus('Cached');
         
-        // Process the mock issues
-        processIssues(allIssues);
+        // Process the last real snapshot
+        processIssues(GITHUB_CACHE.data);
         
         // Show notice
         const taskList = document.getElementById('task-list');
@@ -144,10 +51,10 @@ window.fetchGitHubData = async function() {
             const notice = document.createElement('div');
             notice.id = 'cache-notice';
             notice.style = 'background: var(--ember-orange); color: white; padding: 10px; margin-bottom: 10px; border-radius: 4px;';
-            notice.textContent = '⚠️ Using cached data due to GitHub rate limits. Data may not be current.';
+            notice.textContent = `⚠️ Using cached data from ${GITHUB_CACHE.data.generated_at}. Data may not be current.`;
             taskList.parentNode.insertBefore(notice, taskList);
         }
     }
 };
 
-console.log('GitHub cache fallback loaded - will use mock data if API is rate limited');
\ No newline at end of file
+console.log('GitHub cache fallback loaded - will reuse the last snapshot if a refresh fails');
\ No newline at end of file
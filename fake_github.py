@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub API used by the provisioning scripts
+Serves the REST issue, label and milestone endpoints (with Link pagination,
+ETags and rate-limit headers) and the GraphQL queries and mutations the
+scripts send, all from memory, so runs can be tested and benchmarked offline
+
+Start it, then point the scripts at it:
+    python3 fake_github.py
+    GITHUB_API_URL=http://127.0.0.1:8765 GITHUB_TOKEN=fake python3 create_missing_issues.py
+
+Behaviour is configured through environment variables:
+    FAKE_GITHUB_PORT              port to listen on (8765)
+    FAKE_GITHUB_LATENCY_MS        delay added to every response (0)
+    FAKE_GITHUB_JITTER_MS         random extra delay, up to this much (0)
+    FAKE_GITHUB_CORE_LIMIT        hourly REST budget (5000)
+    FAKE_GITHUB_GRAPHQL_LIMIT     hourly GraphQL budget (5000)
+    FAKE_GITHUB_SECONDARY_EVERY   answer every Nth write with a secondary-limit 403 (0 = never)
+    FAKE_GITHUB_RETRY_AFTER       Retry-After seconds sent with those 403s (1)
+    FAKE_GITHUB_FAILURE_RATE      fraction of requests failed with a 502 before they run (0)
+    FAKE_GITHUB_LOST_WRITE_RATE   fraction of writes that land but still answer 502 (0)
+"""
+
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, urlencode, unquote
+
+PORT = int(os.getenv('FAKE_GITHUB_PORT', '8765'))
+LATENCY_MS = float(os.getenv('FAKE_GITHUB_LATENCY_MS', '0'))
+JITTER_MS = float(os.getenv('FAKE_GITHUB_JITTER_MS', '0'))
+CORE_LIMIT = int(os.getenv('FAKE_GITHUB_CORE_LIMIT', '5000'))
+GRAPHQL_LIMIT = int(os.getenv('FAKE_GITHUB_GRAPHQL_LIMIT', '5000'))
+SECONDARY_EVERY = int(os.getenv('FAKE_GITHUB_SECONDARY_EVERY', '0'))
+RETRY_AFTER = int(os.getenv('FAKE_GITHUB_RETRY_AFTER', '1'))
+FAILURE_RATE = float(os.getenv('FAKE_GITHUB_FAILURE_RATE', '0'))
+LOST_WRITE_RATE = float(os.getenv('FAKE_GITHUB_LOST_WRITE_RATE', '0'))
+
+REPO_ROUTE = re.compile(r'^/repos/([^/]+)/([^/]+)(/.*)?$')
+
+# One aliased mutation: `m0: createIssue(input: $i0)` or an inline input object
+MUTATION = re.compile(
+    r'(?:(\w+)\s*:\s*)?(createIssue|createLabel|createProjectV2|addProjectV2ItemById)'
+    r'\s*\(\s*input\s*:\s*(\$\w+|\{.*?\})\s*\)',
+    re.DOTALL
+)
+INLINE_FIELD = re.compile(r'(\w+)\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+class FakeGitHub:
+    """In-memory repository state plus the rate-limit and failure knobs"""
+
+    def __init__(self, latency_ms: float = LATENCY_MS, jitter_ms: float = JITTER_MS,
+                 core_limit: int = CORE_LIMIT, graphql_limit: int = GRAPHQL_LIMIT,
+                 secondary_every: int = SECONDARY_EVERY, retry_after: int = RETRY_AFTER,
+                 failure_rate: float = FAILURE_RATE, lost_write_rate: float = LOST_WRITE_RATE):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.limits = {'core': core_limit, 'graphql': graphql_limit}
+        self.secondary_every = secondary_every
+        self.retry_after = retry_after
+        self.failure_rate = failure_rate
+        self.lost_write_rate = lost_write_rate
+
+        self.lock = threading.Lock()
+        self.issues: List[Dict] = []
+        self.labels: Dict[str, Dict] = {}
+        self.milestones: Dict[str, Dict] = {}
+        self.projects: List[Dict] = []
+        self.project_items: Dict[str, List[str]] = {}
+        self.window_start = time.time()
+        self.used = {'core': 0, 'graphql': 0}
+        self.writes = 0
+        self.request_count = 0
+
+    # Rate limiting and failure injection
+
+    def rate_headers(self, resource: str) -> Dict[str, str]:
+        reset = int(self.window_start) + 3600
+        return {
+            'X-RateLimit-Limit': str(self.limits[resource]),
+            'X-RateLimit-Remaining': str(max(0, self.limits[resource] - self.used[resource])),
+            'X-RateLimit-Reset': str(reset),
+            'X-RateLimit-Used': str(self.used[resource]),
+            'X-RateLimit-Resource': resource
+        }
+
+    def admit(self, resource: str, is_write: bool, cost: int = 1) -> Optional[Tuple[int, Dict, Dict]]:
+        """Charge one request; returns an error response if it is refused"""
+        with self.lock:
+            self.request_count += 1
+            if time.time() - self.window_start >= 3600:
+                self.window_start = time.time()
+                self.used = {'core': 0, 'graphql': 0}
+
+            if self.used[resource] >= self.limits[resource]:
+                return 403, self.rate_headers(resource), {
+                    'message': 'API rate limit exceeded',
+                    'documentation_url': 'https://docs.github.com/rest/rate-limit'
+                }
+            self.used[resource] += cost
+
+            if is_write:
+                self.writes += 1
+                if self.secondary_every and self.writes % self.secondary_every == 0:
+                    headers = self.rate_headers(resource)
+                    headers['Retry-After'] = str(self.retry_after)
+                    return 403, headers, {
+                        'message': 'You have exceeded a secondary rate limit. Please wait a few minutes before you try again.',
+                        'documentation_url': 'https://docs.github.com/rest/overview/resources-in-the-rest-api#secondary-rate-limits'
+                    }
+
+        if random.random() < self.failure_rate:
+            return 502, self.rate_headers(resource), {'message': 'Server Error'}
+        return None
+
+    def delay(self):
+        pause = self.latency_ms + random.uniform(0, self.jitter_ms)
+        if pause:
+            time.sleep(pause / 1000)
+
+    # REST state changes
+
+    def create_issue(self, data: Dict) -> Tuple[int, Dict]:
+        if not data.get('title'):
+            return 422, {'message': 'Validation Failed', 'errors': [{'field': 'title', 'code': 'missing_field'}]}
+        with self.lock:
+            number = len(self.issues) + 1
+            stamp = now_iso()
+            issue = {
+                'id': number,
+                'node_id': f'I_{number}',
+                'number': number,
+                'title': data['title'],
+                'body': data.get('body'),
+                'state': 'open',
+                'labels': [self.label_for(name) for name in data.get('labels', [])],
+                'milestone': self.milestone_by_number(data.get('milestone')),
+                'created_at': stamp,
+                'updated_at': stamp,
+                'closed_at': None,
+                'html_url': f'https://github.com/fake/fake/issues/{number}'
+            }
+            self.issues.append(issue)
+        return 201, issue
+
+    def update_issue(self, number: int, data: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            if not 1 <= number <= len(self.issues):
+                return 404, {'message': 'Not Found'}
+            issue = self.issues[number - 1]
+            for field in ('title', 'body'):
+                if field in data:
+                    issue[field] = data[field]
+            if 'labels' in data:
+                issue['labels'] = [self.label_for(name) for name in data['labels']]
+            if 'milestone' in data:
+                issue['milestone'] = self.milestone_by_number(data['milestone'])
+            if data.get('state') in ('open', 'closed') and data['state'] != issue['state']:
+                issue['state'] = data['state']
+                issue['closed_at'] = now_iso() if data['state'] == 'closed' else None
+            issue['updated_at'] = now_iso()
+        return 200, issue
+
+    def label_for(self, name: str) -> Dict:
+        """Existing label, created on the fly like GitHub does for issue labels"""
+        if name not in self.labels:
+            self.labels[name] = {'id': len(self.labels) + 1, 'node_id': f'LA_{len(self.labels) + 1}',
+                                 'name': name, 'color': 'ededed', 'description': None}
+        return self.labels[name]
+
+    def milestone_by_number(self, number) -> Optional[Dict]:
+        for milestone in self.milestones.values():
+            if milestone['number'] == number:
+                return milestone
+        return None
+
+    def create_label(self, data: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            if data.get('name') in self.labels:
+                return 422, {'message': 'Validation Failed',
+                             'errors': [{'resource': 'Label', 'code': 'already_exists', 'field': 'name'}]}
+            label = self.label_for(data['name'])
+            label['color'] = data.get('color', 'ededed')
+            label['description'] = data.get('description')
+        return 201, label
+
+    def create_milestone(self, data: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            if data.get('title') in self.milestones:
+                return 422, {'message': 'Validation Failed',
+                             'errors': [{'resource': 'Milestone', 'code': 'already_exists', 'field': 'title'}]}
+            number = len(self.milestones) + 1
+            milestone = {
+                'id': number,
+                'node_id': f'MI_{number}',
+                'number': number,
+                'title': data['title'],
+                'description': data.get('description'),
+                'state': data.get('state', 'open'),
+                'due_on': data.get('due_on'),
+                'created_at': now_iso()
+            }
+            self.milestones[data['title']] = milestone
+        return 201, milestone
+
+    def update_label(self, name: str, data: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            if name not in self.labels:
+                return 404, {'message': 'Not Found'}
+            label = self.labels[name]
+            for field in ('color', 'description'):
+                if field in data:
+                    label[field] = data[field]
+        return 200, label
+
+    def update_milestone(self, number: int, data: Dict) -> Tuple[int, Dict]:
+        with self.lock:
+            milestone = self.milestone_by_number(number)
+            if not milestone:
+                return 404, {'message': 'Not Found'}
+            for field in ('description', 'due_on', 'state'):
+                if field in data:
+                    milestone[field] = data[field]
+        return 200, milestone
+
+    def list_issues(self, params: Dict) -> List[Dict]:
+        state = params.get('state', 'open')
+        since = params.get('since')
+        with self.lock:
+            issues = [issue for issue in self.issues
+                      if (state == 'all' or issue['state'] == state)
+                      and (not since or issue['updated_at'] >= since)]
+        if params.get('sort') == 'updated':
+            issues.sort(key=lambda issue: issue['updated_at'])
+        if params.get('direction', 'desc') == 'desc':
+            issues.reverse()
+        return issues
+
+    # GraphQL
+
+    def graphql(self, query: str, variables: Dict) -> Dict:
+        if query.lstrip().startswith('mutation'):
+            return self.run_mutations(query, variables)
+
+        if 'node(id:' in query:
+            return {'data': {'node': {'items': self.project_item_page(variables)}}}
+
+        repository = {'id': 'R_1'}
+        if 'projectsV2' in query:
+            repository['projectsV2'] = {'nodes': list(self.projects)}
+        for connection, nodes in (('issues', self.graphql_issues(variables)),
+                                  ('labels', [{'id': l['node_id'], 'name': l['name']}
+                                              for l in self.labels.values()]),
+                                  ('milestones', [{'id': m['node_id'], 'title': m['title'], 'number': m['number']}
+                                                  for m in self.milestones.values()])):
+            if re.search(r'\b%s\s*\(' % connection, query):
+                repository[connection] = self.connection_page(nodes, variables.get('cursor'))
+        return {'data': {'repository': repository}}
+
+    def graphql_issues(self, variables: Dict) -> List[Dict]:
+        states = variables.get('states') or ['OPEN', 'CLOSED']
+        with self.lock:
+            return [{'id': issue['node_id'], 'number': issue['number'], 'title': issue['title']}
+                    for issue in self.issues if issue['state'].upper() in states]
+
+    def project_item_page(self, variables: Dict) -> Dict:
+        content_ids = self.project_items.get(variables.get('project'), [])
+        return self.connection_page([{'id': f'PVTI_{i + 1}', 'content': {'id': content_id}}
+                                     for i, content_id in enumerate(content_ids)],
+                                    variables.get('cursor'))
+
+    @staticmethod
+    def connection_page(nodes: List[Dict], cursor: Optional[str], size: int = 100) -> Dict:
+        start = int(cursor) if cursor else 0
+        end = start + size
+        return {'nodes': nodes[start:end],
+                'pageInfo': {'hasNextPage': end < len(nodes), 'endCursor': str(end)}}
+
+    def run_mutations(self, query: str, variables: Dict) -> Dict:
+        data = {}
+        errors = []
+        for alias, name, argument in MUTATION.findall(query):
+            key = alias or name
+            if argument.startswith('$'):
+                mutation_input = variables.get(argument[1:], {})
+            else:
+                mutation_input = dict(INLINE_FIELD.findall(argument))
+            try:
+                data[key] = getattr(self, f'mutation_{name}')(mutation_input)
+            except ValueError as e:
+                data[key] = None
+                errors.append({'type': 'UNPROCESSABLE', 'path': [key], 'message': str(e)})
+        payload = {'data': data}
+        if errors:
+            payload['errors'] = errors
+        return payload
+
+    def mutation_createIssue(self, mutation_input: Dict) -> Dict:
+        label_names = {label['node_id']: name for name, label in self.labels.items()}
+        milestone_numbers = {m['node_id']: m['number'] for m in self.milestones.values()}
+        status, issue = self.create_issue({
+            'title': mutation_input.get('title'),
+            'body': mutation_input.get('body'),
+            'labels': [label_names[i] for i in mutation_input.get('labelIds', []) if i in label_names],
+            'milestone': milestone_numbers.get(mutation_input.get('milestoneId'))
+        })
+        if status != 201:
+            raise ValueError(issue['message'])
+        return {'issue': {'id': issue['node_id'], 'number': issue['number'],
+                          'title': issue['title'], 'url': issue['html_url']}}
+
+    def mutation_createLabel(self, mutation_input: Dict) -> Dict:
+        status, label = self.create_label(mutation_input)
+        if status != 201:
+            raise ValueError('Name has already been taken')
+        return {'label': {'id': label['node_id'], 'name': label['name']}}
+
+    def mutation_createProjectV2(self, mutation_input: Dict) -> Dict:
+        with self.lock:
+            number = len(self.projects) + 1
+            project = {'id': f'PVT_{number}', 'number': number,
+                       'title': mutation_input.get('title', ''),
+                       'url': f'https://github.com/users/fake/projects/{number}'}
+            self.projects.append(project)
+            self.project_items[project['id']] = []
+        return {'projectV2': project}
+
+    def mutation_addProjectV2ItemById(self, mutation_input: Dict) -> Dict:
+        with self.lock:
+            items = self.project_items.get(mutation_input.get('projectId'))
+            if items is None:
+                raise ValueError('Could not resolve to a ProjectV2')
+            if mutation_input.get('contentId') not in items:
+                items.append(mutation_input.get('contentId'))
+            return {'item': {'id': f"PVTI_{items.index(mutation_input.get('contentId')) + 1}"}}
+
+class Handler(BaseHTTPRequestHandler):
+    """Routes one request to the FakeGitHub held by the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def fake(self) -> FakeGitHub:
+        return self.server.fake
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, payload, headers: Optional[Dict] = None):
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_json(self) -> Dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_PATCH(self):
+        self.handle_request('PATCH')
+
+    def handle_request(self, method: str):
+        self.fake.delay()
+        parts = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        data = self.read_json() if method != 'GET' else {}
+
+        is_graphql = parts.path.rstrip('/') == '/graphql'
+        resource = 'graphql' if is_graphql else 'core'
+        is_write = method != 'GET' and not (is_graphql and not data.get('query', '').lstrip().startswith('mutation'))
+
+        if method == 'GET':
+            status, payload, headers = self.route(method, parts.path, params, data)
+            # Conditional requests that come back 304 are free, as on GitHub
+            etag = self.headers.get('If-None-Match')
+            if etag and headers.get('ETag') == etag:
+                self.send_json(304, None, dict(headers, **self.fake.rate_headers(resource)))
+                return
+
+        refused = self.fake.admit(resource, is_write)
+        if refused:
+            status, headers, payload = refused
+            self.send_json(status, payload, headers)
+            return
+
+        if is_graphql:
+            status, payload, headers = 200, self.fake.graphql(data.get('query', ''), data.get('variables') or {}), {}
+        elif method != 'GET':
+            status, payload, headers = self.route(method, parts.path, params, data)
+
+        if is_write and status < 300 and random.random() < self.fake.lost_write_rate:
+            # The write landed but the client never hears about it
+            status, payload = 502, {'message': 'Server Error'}
+
+        self.send_json(status, payload, dict(headers, **self.fake.rate_headers(resource)))
+
+    def route(self, method: str, path: str, params: Dict, data: Dict) -> Tuple[int, object, Dict]:
+        if path == '/rate_limit':
+            resources = {name: {'limit': self.fake.limits[name],
+                                'remaining': self.fake.limits[name] - self.fake.used[name],
+                                'reset': int(self.fake.window_start) + 3600}
+                         for name in self.fake.limits}
+            return 200, {'resources': resources, 'rate': resources['core']}, {}
+
+        match = REPO_ROUTE.match(path)
+        if not match:
+            return 404, {'message': 'Not Found'}, {}
+        owner, repo, rest = match.group(1), match.group(2), (match.group(3) or '').rstrip('/')
+
+        if rest == '':
+            return 200, {'id': 1, 'node_id': 'R_1', 'name': repo,
+                         'full_name': f'{owner}/{repo}', 'open_issues_count':
+                         sum(1 for issue in self.fake.issues if issue['state'] == 'open')}, {}
+        if rest == '/issues':
+            if method == 'POST':
+                return self.fake.create_issue(data) + ({},)
+            return self.paginated(path, params, self.fake.list_issues(params))
+        if rest.startswith('/issues/') and rest[len('/issues/'):].isdigit():
+            number = int(rest[len('/issues/'):])
+            if method == 'PATCH':
+                return self.fake.update_issue(number, data) + ({},)
+            if 1 <= number <= len(self.fake.issues):
+                return 200, self.fake.issues[number - 1], {}
+            return 404, {'message': 'Not Found'}, {}
+        if rest == '/labels':
+            if method == 'POST':
+                return self.fake.create_label(data) + ({},)
+            return self.paginated(path, params, list(self.fake.labels.values()))
+        if rest.startswith('/labels/'):
+            name = unquote(rest[len('/labels/'):])
+            if method == 'PATCH':
+                return self.fake.update_label(name, data) + ({},)
+            if name in self.fake.labels:
+                return 200, self.fake.labels[name], {}
+            return 404, {'message': 'Not Found'}, {}
+        if rest.startswith('/milestones/') and rest[len('/milestones/'):].isdigit() and method == 'PATCH':
+            return self.fake.update_milestone(int(rest[len('/milestones/'):]), data) + ({},)
+        if rest == '/milestones':
+            if method == 'POST':
+                return self.fake.create_milestone(data) + ({},)
+            return self.paginated(path, params, list(self.fake.milestones.values()))
+        return 404, {'message': 'Not Found'}, {}
+
+    def paginated(self, path: str, params: Dict, items: List[Dict]) -> Tuple[int, List[Dict], Dict]:
+        """One page of a listing with GitHub's Link header and a content ETag"""
+        per_page = min(int(params.get('per_page', 30)), 100)
+        page = max(int(params.get('page', 1)), 1)
+        last_page = max(1, -(-len(items) // per_page))
+        page_items = items[(page - 1) * per_page:page * per_page]
+
+        base = f'http://{self.headers.get("Host")}{path}'
+        links = []
+        for rel, target in (('prev', page - 1), ('next', page + 1), ('first', 1), ('last', last_page)):
+            if (rel in ('prev', 'first') and page > 1) or (rel in ('next', 'last') and page < last_page):
+                links.append(f'<{base}?{urlencode(dict(params, page=target))}>; rel="{rel}"')
+
+        headers = {'ETag': '"%s"' % hashlib.sha1(json.dumps(page_items).encode()).hexdigest()}
+        if links:
+            headers['Link'] = ', '.join(links)
+        return 200, page_items, headers
+
+def start(fake: Optional[FakeGitHub] = None, port: int = 0) -> ThreadingHTTPServer:
+    """Serve `fake` on a background thread; port 0 picks a free port
+
+    The API root is http://127.0.0.1:<server.server_port>.
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    server.fake = fake or FakeGitHub()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    """Run the fake API in the foreground"""
+    server = ThreadingHTTPServer(('127.0.0.1', PORT), Handler)
+    server.daemon_threads = True
+    server.fake = FakeGitHub()
+
+    print("🧪 Fake GitHub API")
+    print("=" * 60)
+    print(f"Listening on http://127.0.0.1:{PORT}")
+    print(f"Latency: {LATENCY_MS:.0f}ms (+{JITTER_MS:.0f}ms jitter)")
+    print(f"Failure rate: {FAILURE_RATE:.0%}, lost writes: {LOST_WRITE_RATE:.0%}")
+    if SECONDARY_EVERY:
+        print(f"Secondary limit: every {SECONDARY_EVERY} writes")
+    print(f"\nexport GITHUB_API_URL=http://127.0.0.1:{PORT}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nServed {server.fake.request_count} requests, {len(server.fake.issues)} issues created")
+
+if __name__ == "__main__":
+    main()
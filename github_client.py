@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Shared GitHub API client for the Shadowed Realms provisioning scripts
+Every script talks to GitHub through one pooled keep-alive session, so a
+1000-issue run reuses a handful of TLS connections instead of opening one per call
+"""
+
+import os
+import json
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote
+
+from rate_governor import RateLimitGovernor
+from retry_policy import RetryPolicy, classify, REJECTED
+from metrics import Metrics, get_metrics
+from http_cache import HttpCache, HTTP_CACHE_PATH, auth_scope
+
+# GitHub configuration
+GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+GITHUB_OWNER = 'michael-placeholder'
+GITHUB_REPO = 'shadowed-realms'
+# Point GITHUB_API_URL at fake_github.py (or GitHub Enterprise) to run offline
+GITHUB_API_ROOT = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+
+# Connections kept alive per host - enough for the bulk creators to run in parallel
+POOL_SIZE = 16
+
+# Listing pages fetched concurrently once page 1 reports the last page
+PAGE_WINDOW = 8
+
+# Repo POST endpoints whose result can be looked up by this payload field,
+# so a create that may have landed is checked before it is sent again
+LANDABLE = {'/issues': 'title', '/milestones': 'title', '/labels': 'name'}
+
+# Slack for clock skew when matching a landed issue's created_at
+LANDED_SKEW = 60
+
+def page_range_urls(response: requests.Response) -> Optional[List[str]]:
+    """URLs for pages 2..last from a page-1 Link header; None when only rel=next is given"""
+    last = response.links.get('last', {}).get('url')
+    if not last:
+        return None if 'next' in response.links else []
+
+    parts = urlparse(last)
+    query = parse_qs(parts.query)
+    last_page = int(query.get('page', ['1'])[0])
+
+    urls = []
+    for page in range(2, last_page + 1):
+        query['page'] = [str(page)]
+        urls.append(urlunparse(parts._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+class GitHubClient:
+    """Pooled GitHub REST/GraphQL client bound to one repository"""
+
+    def __init__(self, token: str = GITHUB_TOKEN, owner: str = GITHUB_OWNER,
+                 repo: str = GITHUB_REPO, api_root: str = GITHUB_API_ROOT,
+                 pool_size: int = POOL_SIZE,
+                 governor: Optional[RateLimitGovernor] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 metrics: Optional[Metrics] = None,
+                 cache: Optional[HttpCache] = None):
+        self.owner = owner
+        self.repo = repo
+        self.api_root = api_root.rstrip('/')
+        self.repo_url = f'{self.api_root}/repos/{owner}/{repo}'
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/vnd.github.v3+json'
+        })
+        if token:
+            self.session.headers['Authorization'] = f'token {token}'
+
+        # Paces every request from GitHub's rate-limit headers
+        self.governor = governor or RateLimitGovernor()
+        # Backoff and retry budget for transient failures
+        self.retry = retry or RetryPolicy()
+        # Latency, retry and headroom figures for every attempt
+        self.metrics = metrics or get_metrics()
+        # GETs and GraphQL queries are served or revalidated from disk;
+        # set HTTP_CACHE_PATH='' to turn the cache off
+        self.cache = cache or (HttpCache() if HTTP_CACHE_PATH else None)
+
+    def url(self, path: str) -> str:
+        """Resolve a repo-relative path ('/issues') or API path ('graphql') to a full URL"""
+        if path.startswith('http'):
+            return path
+        if path.startswith('/'):
+            return f'{self.repo_url}{path}'
+        return f'{self.api_root}/{path}'
+
+    def is_query(self, url: str, payload: Optional[Dict]) -> bool:
+        """True for a read-only GraphQL document"""
+        return (url == f'{self.api_root}/graphql'
+                and not (payload or {}).get('query', '').lstrip().startswith('mutation'))
+
+    def cache_key(self, method: str, url: str, kwargs: Dict) -> Optional[str]:
+        """Cache key for a GET or GraphQL query, or None if it must go to GitHub"""
+        headers = kwargs.get('headers') or {}
+        if not self.cache or 'If-None-Match' in headers or 'If-Modified-Since' in headers:
+            # Callers that send their own validators want to see the 304
+            return None
+        scope = auth_scope(self.session.headers.get('Authorization'))
+        if method.upper() == 'GET':
+            full_url = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+            return HttpCache.key(scope, 'GET', full_url, headers or None)
+        if method.upper() == 'POST' and self.is_query(url, kwargs.get('json')):
+            return HttpCache.key(scope, 'POST', url, {'json': kwargs['json'], 'headers': headers})
+        return None
+
+    def request(self, method: str, path: str, writes: Optional[int] = None,
+                **kwargs) -> requests.Response:
+        """Send a request, answering GETs and GraphQL queries from the cache when possible
+
+        A fresh cache entry is returned without a request; a stale one is
+        revalidated with If-None-Match / If-Modified-Since and a 304 returns
+        the cached body. Any other request marks the whole cache stale.
+        """
+        url = self.url(path)
+        key = self.cache_key(method, url, kwargs)
+        if key is None:
+            try:
+                return self.send(method, url, writes, **kwargs)
+            finally:
+                if self.cache and method.upper() != 'GET' and not self.is_query(url, kwargs.get('json')):
+                    self.cache.invalidate()
+
+        entry = self.cache.lookup(key)
+        if entry and entry['fresh']:
+            self.metrics.cached('hit')
+            return HttpCache.response(entry)
+        if entry:
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **HttpCache.validators(entry))
+
+        response = self.send(method, url, writes, **kwargs)
+        if response.status_code == 304 and entry:
+            self.cache.touch(key)
+            self.metrics.cached('revalidated')
+            return HttpCache.response(entry)
+
+        self.metrics.cached('miss')
+        if response.status_code == 200 and not (method.upper() == 'POST' and 'errors' in response.json()):
+            self.cache.store(key, response.url, response)
+        return response
+
+    def send(self, method: str, url: str, writes: Optional[int] = None,
+             **kwargs) -> requests.Response:
+        """Send a request over the pooled session, paced by the rate-limit governor
+
+        `writes` is the number of content-creating operations the request
+        carries; by default one for POST/PATCH/PUT/DELETE and none otherwise.
+
+        Transient failures are retried with backoff (see retry_policy.py).
+        A POST that may already have been applied is only sent again once
+        landed() finds no trace of it; if it did land, that object is
+        returned as a 201. The last response is returned, or the last
+        connection error raised, when retries run out.
+        """
+        path = url[len(self.repo_url):] if url.startswith(self.repo_url) else url
+        started = time.time()
+        attempt = 0
+        while True:
+            self.governor.wait(method, url, writes)
+            response, error = None, None
+            sent = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except Exception as e:
+                error = e
+            else:
+                self.governor.observe(method, url, response)
+            self.metrics.observe(method, url, time.perf_counter() - sent, response)
+
+            reason = classify(response, error)
+            if reason is None:
+                if error is not None:
+                    raise error
+                self.retry.succeeded()
+                return response
+
+            if method.upper() == 'POST' and reason not in REJECTED:
+                if not self.resendable(url, kwargs.get('json')):
+                    break
+                try:
+                    existing = self.landed(url, kwargs['json'], started)
+                except Exception as e:
+                    print(f"  Could not check whether {method} {path} landed: {e}")
+                    break
+                if existing:
+                    print(f"  {method} {path} had landed despite the {reason} - not resending")
+                    return self.landed_response(url, existing)
+
+            if not self.retry.allow(attempt):
+                break
+            self.metrics.retried(reason)
+            delay = self.retry.delay(attempt)
+            attempt += 1
+            print(f"  Retrying {method} {path} after {reason} "
+                  f"({attempt}/{self.retry.max_retries}) in {delay:.1f}s")
+            time.sleep(delay)
+
+        if error is not None:
+            raise error
+        return response
+
+    def resendable(self, url: str, payload: Optional[Dict]) -> bool:
+        """True if a POST that may have been applied can be checked or safely repeated"""
+        if url == f'{self.api_root}/graphql':
+            # Queries are read-only; a mutation document may have partly run
+            return self.is_query(url, payload)
+        field = LANDABLE.get(url[len(self.repo_url):]) if url.startswith(self.repo_url) else None
+        return bool(field and (payload or {}).get(field))
+
+    def landed(self, url: str, payload: Dict, since: float) -> Optional[Dict]:
+        """The issue, milestone or label a failed POST created after all, if any"""
+        if self.cache:
+            # Listings cached before the failed attempt cannot show what it did
+            self.cache.invalidate()
+        path = url[len(self.repo_url):] if url.startswith(self.repo_url) else None
+        if path == '/issues':
+            cutoff = datetime.fromtimestamp(since - LANDED_SKEW, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            response = self.get('/issues', params={'state': 'all', 'sort': 'created',
+                                                   'direction': 'desc', 'per_page': 100})
+            response.raise_for_status()
+            for issue in response.json():
+                if issue['title'] == payload['title'] and issue['created_at'] >= cutoff:
+                    return issue
+        elif path == '/milestones':
+            for milestone in self.paginate('/milestones', params={'state': 'all', 'per_page': 100}):
+                if milestone['title'] == payload['title']:
+                    return milestone
+        elif path == '/labels':
+            response = self.get(f"/labels/{quote(payload['name'], safe='')}")
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code != 404:
+                response.raise_for_status()
+        return None
+
+    @staticmethod
+    def landed_response(url: str, item: Dict) -> requests.Response:
+        """A 201 response carrying an object found by landed()"""
+        response = requests.Response()
+        response.status_code = 201
+        response.url = url
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        response._content = json.dumps(item).encode()
+        return response
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request('POST', path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request('PATCH', path, **kwargs)
+
+    def paginate(self, path: str, params: Optional[Dict] = None,
+                 first: Optional[requests.Response] = None,
+                 window: int = PAGE_WINDOW) -> List[Dict]:
+        """Fetch every item of a REST listing, pages 2..N in parallel
+
+        Page 1's Link rel="last" gives the page count; the remaining pages are
+        fetched with up to `window` requests in flight and reassembled in page
+        order. Listings without rel="last" fall back to following rel="next".
+        Pass `first` to continue from a page-1 response the caller already has
+        (e.g. one fetched conditionally with If-None-Match).
+        """
+        response = first or self.get(path, params=params)
+        response.raise_for_status()
+        items = list(response.json())
+
+        page_urls = page_range_urls(response)
+        if page_urls is None:
+            while 'next' in response.links:
+                response = self.get(response.links['next']['url'])
+                response.raise_for_status()
+                items.extend(response.json())
+            return items
+
+        def fetch(url: str) -> List[Dict]:
+            page = self.get(url)
+            page.raise_for_status()
+            return page.json()
+
+        with ThreadPoolExecutor(max_workers=max(1, window)) as pool:
+            for page_items in pool.map(fetch, page_urls):
+                items.extend(page_items)
+        return items
+
+    def graphql(self, query: str, variables: Optional[Dict] = None,
+                writes: int = 0, headers: Optional[Dict] = None) -> requests.Response:
+        """Run a GraphQL query or mutation
+
+        Pass `writes` as the number of mutations in the document so batched
+        mutations count against the secondary content-creation limit.
+        """
+        payload = {'query': query}
+        if variables:
+            payload['variables'] = variables
+        return self.post('graphql', json=payload, writes=writes, headers=headers)
+
+    def create_issue(self, title: str, body: str, labels: List[str]) -> Optional[Dict]:
+        """Create a single GitHub issue"""
+        data = {
+            'title': title,
+            'body': body,
+            'labels': labels
+        }
+
+        try:
+            response = self.post('/issues', json=data)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            print(f"Error creating issue '{title}': {e}")
+            return None
+
+    def create_label(self, name: str, color: str, description: str) -> Optional[Dict]:
+        """Create a GitHub label"""
+        data = {
+            'name': name,
+            'color': color,
+            'description': description
+        }
+
+        try:
+            response = self.post('/labels', json=data)
+        except requests.exceptions.RequestException as e:
+            print(f"Error creating label '{name}': {e}")
+            return None
+
+        if response.status_code == 201:
+            return response.json()
+        elif response.status_code == 422:
+            # Label might already exist
+            return None
+        else:
+            print(f"Error creating label: {response.status_code}")
+            return None
+
+    def create_milestone(self, title: str, description: str,
+                         due_date: Optional[str] = None) -> Optional[Dict]:
+        """Create a GitHub milestone"""
+        data = {
+            'title': title,
+            'description': description,
+            'state': 'open'
+        }
+        if due_date:
+            data['due_on'] = due_date
+
+        try:
+            response = self.post('/milestones', json=data)
+        except requests.exceptions.RequestException as e:
+            print(f"Error creating milestone '{title}': {e}")
+            return None
+
+        if response.status_code == 201:
+            return response.json()
+        elif response.status_code == 422:
+            # Milestone might already exist
+            print(f"Milestone '{title}' may already exist")
+            return None
+        else:
+            print(f"Error creating milestone: {response.status_code} - {response.text}")
+            return None
+
+_client = None
+
+def get_client() -> GitHubClient:
+    """Return the process-wide client so every caller shares one connection pool"""
+    global _client
+    if _client is None:
+        _client = GitHubClient()
+    return _client
+
+def create_issue(title: str, body: str, labels: List[str]) -> Optional[Dict]:
+    """Create a single GitHub issue on the shared client"""
+    return get_client().create_issue(title, body, labels)
+
+def create_label(name: str, color: str, description: str) -> Optional[Dict]:
+    """Create a GitHub label on the shared client"""
+    return get_client().create_label(name, color, description)
+
+def create_milestone(title: str, description: str, due_date: Optional[str] = None) -> Optional[Dict]:
+    """Create a GitHub milestone on the shared client"""
+    return get_client().create_milestone(title, description, due_date)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Batched GraphQL provisioning for issues and labels
+Packs many createIssue / createLabel mutations into one aliased GraphQL
+document, bounded by mutation count and document bytes and halved when GitHub
+rejects one as too heavy, so the 1000-issue backlog costs tens of requests
+instead of a thousand
+
+A document that fails with a 5xx or a timeout may still have run some of its
+mutations, so it is never resent as is: each caller looks up what landed (by
+title, name or board item) and only the rest go out again
+
+GitHub has no GraphQL mutation for milestones, so those are diffed against one
+listing query and only the missing ones go out over REST
+"""
+
+import time
+from collections import deque
+from itertools import islice
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Callable
+from urllib.parse import quote
+
+from github_client import GitHubClient, get_client, LANDED_SKEW
+
+# createLabel is still a schema preview on GitHub's GraphQL API
+LABEL_PREVIEW = {'Accept': 'application/vnd.github.bane-preview+json'}
+
+# Static ceilings for one document. GitHub's node limit only counts
+# connections, and the mutation payloads here select none, so it is not
+# modelled; the rarer complexity rejections are handled by halving the batch
+MAX_MUTATIONS = 50               # aliased mutations per request
+MAX_DOCUMENT_BYTES = 512 * 1024  # query + variables payload size
+
+# Error types GitHub returns, in a 200 body, for a document it rejected as too
+# heavy before running it - only then is the batch halved and resent
+LIMIT_ERRORS = {'MAX_NODE_LIMIT_EXCEEDED', 'RESOURCE_LIMITS_EXCEEDED'}
+
+# Times an item whose batch had an unknown outcome, and that was not found
+# to have landed, is sent again
+MAX_RESENDS = 2
+
+DEFAULT_LABEL_COLOR = 'ededed'
+
+# Node selection for each repository connection read by get_repository_state
+STATE_SELECTIONS = {
+    'labels': 'nodes { id name }',
+    'milestones': 'nodes { id title number }'
+}
+
+class BatchSizer:
+    """Adaptive batch size: shrinks on limit errors, creeps back up on success"""
+
+    def __init__(self, max_mutations: int = MAX_MUTATIONS, max_bytes: int = MAX_DOCUMENT_BYTES):
+        self.max_mutations = max_mutations
+        self.max_bytes = max_bytes
+        self.size = max_mutations
+
+    def take(self, items: List[Dict], item_bytes: Callable[[Dict], int]) -> int:
+        """How many of the leading items fit in the next document"""
+        count = 0
+        total_bytes = 0
+        for item in items[:self.size]:
+            total_bytes += item_bytes(item)
+            if count and total_bytes > self.max_bytes:
+                break
+            count += 1
+        return max(count, 1)
+
+    def shrink(self, failed_count: int):
+        """Halve the batch and never grow back to a size that already failed"""
+        self.max_mutations = max(1, min(self.max_mutations, failed_count - 1))
+        self.size = max(1, failed_count // 2)
+
+    def grow(self):
+        self.size = min(self.max_mutations, self.size + max(1, self.size // 4))
+
+def is_limit_failure(response, payload: Optional[Dict]) -> bool:
+    """True if GitHub rejected the whole document as too heavy without running it"""
+    if response.status_code != 200 or (payload or {}).get('data'):
+        return False
+    return any(error.get('type') in LIMIT_ERRORS for error in (payload or {}).get('errors', []))
+
+def unknown_outcome(response, payload: Optional[Dict]) -> Optional[str]:
+    """Why some of the document's mutations may have run unreported, or None"""
+    if response.status_code >= 500:
+        return f'HTTP {response.status_code}'
+    if response.status_code == 200 and payload is None:
+        return 'empty response'
+    for error in (payload or {}).get('errors', []):
+        if error.get('type') == 'TIMEOUT' or 'timeout' in error.get('message', '').lower():
+            return 'timeout'
+    return None
+
+def run_batched(items: List[Dict], mutation: str, input_type: str, selection: str,
+                to_input: Callable[[Dict], Dict], client: Optional[GitHubClient] = None,
+                headers: Optional[Dict] = None, sizer: Optional[BatchSizer] = None,
+                reconcile: Optional[Callable[[List[Dict], float], List[Optional[Dict]]]] = None) -> List[Dict]:
+    """Run one mutation per item, many aliased mutations per request
+
+    Returns one {'item', 'result', 'error'} dict per item, in input order.
+    Errors are matched back to their item through the alias in the error path.
+
+    A batch whose outcome is unknown (5xx, timeout, lost connection) is passed
+    to `reconcile(items, started)`, which returns each item's mutation result
+    if it landed and None if not; only the ones that did not land are sent
+    again. Without `reconcile` they are reported as failed, never resent.
+    """
+    client = client or get_client()
+    sizer = sizer or BatchSizer()
+    inputs = [to_input(item) for item in items]
+    results: List[Optional[Dict]] = [None] * len(items)
+    resends = [0] * len(items)
+
+    queue = deque(range(len(items)))
+    while queue:
+        count = sizer.take([inputs[n] for n in islice(queue, sizer.size)], lambda i: len(str(i)) + 64)
+        batch = [queue.popleft() for _ in range(count)]
+
+        params = ', '.join(f'$i{n}: {input_type}!' for n in batch)
+        fields = '\n'.join(f'  m{n}: {mutation}(input: $i{n}) {{ {selection} }}' for n in batch)
+        document = f'mutation({params}) {{\n{fields}\n}}'
+        variables = {f'i{n}': inputs[n] for n in batch}
+
+        started = time.time()
+        try:
+            response = client.graphql(document, variables, writes=count, headers=headers)
+            payload = response.json() if response.content else None
+            reason = unknown_outcome(response, payload)
+        except Exception as e:
+            response, payload, reason = None, None, str(e)
+
+        if response is not None and is_limit_failure(response, payload) and count > 1:
+            sizer.shrink(count)
+            print(f"  GraphQL batch of {count} hit a limit, retrying with {sizer.size}")
+            queue.extendleft(reversed(batch))
+            continue
+
+        if reason is not None:
+            try:
+                found = reconcile([items[n] for n in batch], started) if reconcile else [None] * count
+            except Exception as e:
+                print(f"  Could not check which mutations of a failed batch landed: {e}")
+                found, resendable = [None] * count, False
+            else:
+                resendable = reconcile is not None
+            retry = []
+            for n, result in zip(batch, found):
+                if result:
+                    results[n] = {'item': items[n], 'result': result, 'error': None}
+                elif resendable and resends[n] < MAX_RESENDS:
+                    resends[n] += 1
+                    retry.append(n)
+                else:
+                    error = reason if resendable else f'{reason} (outcome unknown, not resent)'
+                    results[n] = {'item': items[n], 'result': None, 'error': error}
+            if resendable:
+                print(f"  GraphQL batch of {count} failed ({reason}): "
+                      f"{count - len(retry)} had landed or gave up, resending {len(retry)}")
+            queue.extendleft(reversed(retry))
+            continue
+
+        data = (payload or {}).get('data') or {}
+        errors = {}
+        for error in (payload or {}).get('errors', []):
+            path = error.get('path') or []
+            if path:
+                errors[path[0]] = error.get('message', 'unknown error')
+
+        for n in batch:
+            alias = f'm{n}'
+            if data.get(alias):
+                results[n] = {'item': items[n], 'result': data[alias], 'error': None}
+            else:
+                error = errors.get(alias) or f'HTTP {response.status_code}'
+                results[n] = {'item': items[n], 'result': None, 'error': error}
+
+        sizer.grow()
+
+    return results
+
+def landed_issues(jobs: List[Dict], since: float,
+                  client: Optional[GitHubClient] = None) -> List[Optional[Dict]]:
+    """createIssue results for the jobs whose issue exists after all, matched by
+    title against one listing of issues created since `since`"""
+    client = client or get_client()
+    cutoff = datetime.fromtimestamp(since - LANDED_SKEW, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    by_title: Dict[str, List[Dict]] = {}
+    for issue in client.paginate('/issues', params={'state': 'all', 'since': cutoff, 'per_page': 100}):
+        if issue['created_at'] >= cutoff and 'pull_request' not in issue:
+            by_title.setdefault(issue['title'], []).append(issue)
+
+    found = []
+    for job in jobs:
+        matches = by_title.get(job['title'])
+        issue = matches.pop() if matches else None
+        found.append({'issue': {'id': issue['node_id'], 'number': issue['number'],
+                                'title': issue['title'], 'url': issue['html_url']}} if issue else None)
+    return found
+
+def landed_labels(labels: List[Dict], since: float,
+                  client: Optional[GitHubClient] = None) -> List[Optional[Dict]]:
+    """createLabel results for the labels that exist after all"""
+    client = client or get_client()
+    found = []
+    for label in labels:
+        response = client.get(f"/labels/{quote(label['name'], safe='')}")
+        if response.status_code == 404:
+            found.append(None)
+            continue
+        response.raise_for_status()
+        existing = response.json()
+        found.append({'label': {'id': existing['node_id'], 'name': existing['name']}})
+    return found
+
+def get_repository_state(client: Optional[GitHubClient] = None) -> Dict:
+    """Fetch the repository ID plus every label and milestone ID in paged queries"""
+    client = client or get_client()
+    state = {'id': None, 'labels': {}, 'milestones': {}}
+
+    for connection, selection in STATE_SELECTIONS.items():
+        cursor = None
+        while True:
+            query = """
+            query($owner: String!, $name: String!, $cursor: String) {
+              repository(owner: $owner, name: $name) {
+                id
+                %s(first: 100, after: $cursor) {
+                  %s
+                  pageInfo { hasNextPage endCursor }
+                }
+              }
+            }
+            """ % (connection, selection)
+            response = client.graphql(query, {'owner': client.owner, 'name': client.repo, 'cursor': cursor})
+            repository = response.json()['data']['repository']
+            state['id'] = repository['id']
+
+            page = repository[connection]
+            for node in page['nodes']:
+                if connection == 'labels':
+                    state['labels'][node['name']] = node['id']
+                else:
+                    state['milestones'][node['title']] = node
+
+            if not page['pageInfo']['hasNextPage']:
+                break
+            cursor = page['pageInfo']['endCursor']
+
+    return state
+
+def provision_labels(labels: List[Dict], state: Dict,
+                     client: Optional[GitHubClient] = None) -> List[Dict]:
+    """Create every label in `labels` that the repository does not have yet
+
+    Each label is a dict with 'name' and optional 'color' / 'description'.
+    New label IDs are added to state['labels'].
+    """
+    missing = [label for label in labels if label['name'] not in state['labels']]
+    if not missing:
+        return []
+
+    results = run_batched(
+        missing, 'createLabel', 'CreateLabelInput', 'label { id name }',
+        lambda label: {
+            'repositoryId': state['id'],
+            'name': label['name'],
+            'color': label.get('color', DEFAULT_LABEL_COLOR),
+            'description': label.get('description', '')
+        },
+        client=client, headers=LABEL_PREVIEW,
+        reconcile=lambda items, since: landed_labels(items, since, client)
+    )
+
+    for result in results:
+        if result['result']:
+            label = result['result']['label']
+            state['labels'][label['name']] = label['id']
+        else:
+            print(f"  ✗ Label '{result['item']['name']}': {result['error']}")
+    return results
+
+def provision_milestones(milestones: List[Dict], state: Dict,
+                         client: Optional[GitHubClient] = None) -> List[Dict]:
+    """Create the milestones not already listed in `state` over REST
+
+    Each milestone is a dict with 'title', 'description' and optional 'due_on'.
+    """
+    client = client or get_client()
+    created = []
+    for milestone in milestones:
+        if milestone['title'] in state['milestones']:
+            continue
+        result = client.create_milestone(milestone['title'], milestone['description'],
+                                         milestone.get('due_on'))
+        if result:
+            state['milestones'][result['title']] = {'id': result['node_id'],
+                                                    'title': result['title'],
+                                                    'number': result['number']}
+            created.append(result)
+    return created
+
+def create_issues_batched(jobs: List[Dict], client: Optional[GitHubClient] = None,
+                          state: Optional[Dict] = None) -> List[Dict]:
+    """Create issues through batched createIssue mutations
+
+    Takes the same jobs as bulk_issue_engine.create_issues_bulk ('title',
+    'body', 'labels', optional 'milestone' title) and returns the same
+    {'job', 'issue', 'error'} results in job order. Labels the jobs use that
+    do not exist yet are created first, since createIssue needs label IDs.
+    """
+    client = client or get_client()
+    state = state or get_repository_state(client)
+
+    label_names = sorted({name for job in jobs for name in job['labels']})
+    provision_labels([{'name': name} for name in label_names], state, client)
+
+    def to_input(job: Dict) -> Dict:
+        issue_input = {
+            'repositoryId': state['id'],
+            'title': job['title'],
+            'body': job['body'],
+            'labelIds': [state['labels'][name] for name in job['labels'] if name in state['labels']]
+        }
+        milestone = state['milestones'].get(job.get('milestone'))
+        if milestone:
+            issue_input['milestoneId'] = milestone['id']
+        return issue_input
+
+    results = run_batched(jobs, 'createIssue', 'CreateIssueInput',
+                          'issue { id number title url }', to_input, client=client,
+                          reconcile=lambda items, since: landed_issues(items, since, client))
+    return [{'job': r['item'],
+             'issue': r['result']['issue'] if r['result'] else None,
+             'error': r['error']} for r in results]
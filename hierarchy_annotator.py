@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Idempotent bulk annotation of issue bodies with their agile hierarchy
+Reads every body from one cached listing instead of a GET per issue, keeps the
+hierarchy block between markers so re-runs replace it in place, and only
+PATCHes issues whose rendered section actually changed
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+from github_client import GitHubClient, get_client
+from bulk_issue_engine import CONCURRENCY
+from body_templates import BodyTemplate
+from issue_index import parse_issue_number
+
+SECTION_START = '<!-- agile-hierarchy:start -->'
+SECTION_END = '<!-- agile-hierarchy:end -->'
+SEPARATOR = '\n\n---\n\n'
+
+# Blocks written before the markers existed start and end like this
+LEGACY_START = '\n## 🏛️ Agile Hierarchy'
+LEGACY_END = 'Part of the greater story...\n'
+
+HIERARCHY_SECTION = BodyTemplate(
+    SECTION_START + """
+## 🏛️ Agile Hierarchy
+- **Epic**: {epic_id}
+- **User Story**: {user_story_id}
+- **Memory Fragment**: {memory_fragment}
+
+## 📋 Tasks for this Issue
+- [ ] Task 1: Initial implementation
+- [ ] Task 2: Testing and validation
+- [ ] Task 3: Documentation and integration
+- [ ] Task 4: Code review and refinement
+
+## 🔓 Unlocks
+Completing this issue unlocks **Memory Fragment #{issue_number}**: Part of the greater story...
+""" + SECTION_END
+)
+
+def render_section(issue_number: int, epic_id: str, user_story_id: str,
+                   memory_fragment: str) -> str:
+    """Hierarchy block for one issue, wrapped in its markers"""
+    return HIERARCHY_SECTION.render({
+        'issue_number': issue_number,
+        'epic_id': epic_id,
+        'user_story_id': user_story_id,
+        'memory_fragment': memory_fragment
+    })
+
+def strip_legacy_sections(body: str) -> str:
+    """Remove hierarchy blocks that earlier runs prepended without markers"""
+    while body.startswith(LEGACY_START):
+        end = body.find(LEGACY_END)
+        if end == -1:
+            break
+        body = body[end + len(LEGACY_END):]
+        if body.startswith(SEPARATOR):
+            body = body[len(SEPARATOR):]
+    return body
+
+def apply_section(body: Optional[str], section: str) -> str:
+    """Body with its hierarchy section replaced in place, or prepended if absent"""
+    body = body or ''
+    start = body.find(SECTION_START)
+    end = body.find(SECTION_END)
+    if start != -1 and end > start:
+        return body[:start] + section + body[end + len(SECTION_END):]
+    return section + SEPARATOR + strip_legacy_sections(body)
+
+def annotate_issues(assignments: Dict[int, Dict], client: Optional[GitHubClient] = None,
+                    issues: Optional[List[Dict]] = None,
+                    concurrency: int = CONCURRENCY) -> Dict[str, int]:
+    """Write the hierarchy section into every assigned issue that needs it
+
+    `assignments` maps an ISSUE-NNNN number to its 'epic', 'user_story' and
+    'memory_fragment'. Issues are matched by the [ISSUE-NNNN] in their title,
+    not their GitHub number, which concurrent creation leaves out of ISSUE
+    order. Bodies come from `issues` (an existing listing) or one paginated
+    listing of the repository; unchanged issues are never written.
+    Returns counts of updated, unchanged, missing and failed issues.
+    """
+    client = client or get_client()
+    if issues is None:
+        issues = client.paginate('/issues', params={'state': 'all', 'per_page': 100})
+    # ISSUE number -> (GitHub number, body)
+    found = {}
+    for issue in issues:
+        issue_num = parse_issue_number(issue.get('title'))
+        if issue_num is not None and 'pull_request' not in issue:
+            found[issue_num] = (issue['number'], issue.get('body'))
+
+    updates = []
+    counts = {'updated': 0, 'unchanged': 0, 'missing': 0, 'failed': 0}
+    for issue_num, assignment in sorted(assignments.items()):
+        if issue_num not in found:
+            counts['missing'] += 1
+            continue
+        number, body = found[issue_num]
+        section = render_section(issue_num, assignment['epic'], assignment['user_story'],
+                                 assignment['memory_fragment'])
+        new_body = apply_section(body, section)
+        if new_body == (body or ''):
+            counts['unchanged'] += 1
+        else:
+            updates.append((issue_num, number, new_body))
+
+    client.metrics.add_jobs(len(updates))
+
+    def patch(update):
+        issue_num, number, body = update
+        try:
+            response = client.patch(f'/issues/{number}', json={'body': body})
+            return issue_num, number, response.status_code == 200
+        except Exception as e:
+            print(f"  Error updating ISSUE-{issue_num:04d} (#{number}): {e}")
+            return issue_num, number, False
+        finally:
+            client.metrics.job_done()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for issue_num, number, ok in pool.map(patch, updates):
+            if ok:
+                counts['updated'] += 1
+                print(f"  ✓ Updated ISSUE-{issue_num:04d} (#{number}) with hierarchy")
+            else:
+                counts['failed'] += 1
+                print(f"  ✗ Failed to update ISSUE-{issue_num:04d} (#{number})")
+
+    return counts
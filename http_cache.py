@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for GitHub GET responses and GraphQL queries
+Entries are keyed by method, URL (or query and variables) and the token's
+auth scope, and stored with their ETag / Last-Modified so a stale entry is
+revalidated with a conditional request - a 304 costs no rate limit and no body
+Entries younger than HTTP_CACHE_TTL seconds are served without a request at
+all; any write sent through the client marks every entry stale, so a chained
+run never reads back data from before its own changes
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Optional
+
+import requests
+
+HTTP_CACHE_PATH = os.getenv('HTTP_CACHE_PATH', '.github_http_cache.db')
+HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '300'))
+
+# Entries not refreshed for this long are dropped when the cache is opened
+MAX_AGE = 7 * 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+def auth_scope(authorization: Optional[str]) -> str:
+    """Short digest of the Authorization header so tokens never share entries"""
+    return hashlib.sha256((authorization or 'anonymous').encode()).hexdigest()[:16]
+
+class HttpCache:
+    """SQLite-backed response cache shared by every client and process"""
+
+    def __init__(self, path: str = HTTP_CACHE_PATH, ttl: float = HTTP_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+        self.db.execute('DELETE FROM entries WHERE stored_at < ?', (time.time() - MAX_AGE,))
+        self.db.commit()
+
+    @staticmethod
+    def key(scope: str, method: str, url: str, payload: Optional[Dict] = None) -> str:
+        """Cache key for a request; `url` must already include its query string"""
+        parts = [scope, method.upper(), url]
+        if payload is not None:
+            parts.append(json.dumps(payload, sort_keys=True))
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict]:
+        with self.lock:
+            row = self.db.execute(
+                'SELECT url, status, headers, body, etag, last_modified, stored_at FROM entries WHERE key = ?',
+                (key,)
+            ).fetchone()
+            invalidated = self.db.execute("SELECT value FROM meta WHERE name = 'invalidated_at'").fetchone()
+        if not row:
+            return None
+        return {
+            'url': row[0], 'status': row[1], 'headers': json.loads(row[2]), 'body': row[3],
+            'etag': row[4], 'last_modified': row[5], 'stored_at': row[6],
+            'fresh': time.time() - row[6] < self.ttl and (not invalidated or row[6] > invalidated[0])
+        }
+
+    @staticmethod
+    def validators(entry: Dict) -> Dict[str, str]:
+        """Conditional request headers that revalidate an entry"""
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, key: str, url: str, response: requests.Response):
+        # The body is stored decoded, so its transfer headers no longer apply
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        with self.lock:
+            self.db.execute(
+                'INSERT OR REPLACE INTO entries (key, url, status, headers, body, etag, last_modified, stored_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, url, response.status_code, json.dumps(headers), response.content,
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'), time.time())
+            )
+            self.db.commit()
+
+    def touch(self, key: str):
+        """Mark an entry fresh again after a 304"""
+        with self.lock:
+            self.db.execute('UPDATE entries SET stored_at = ? WHERE key = ?', (time.time(), key))
+            self.db.commit()
+
+    def invalidate(self):
+        """Make every entry revalidate before it is served again"""
+        with self.lock:
+            self.db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('invalidated_at', ?)",
+                            (time.time(),))
+            self.db.commit()
+
+    @staticmethod
+    def response(entry: Dict) -> requests.Response:
+        """Rebuild the cached response"""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.url = entry['url']
+        response.headers.update(entry['headers'])
+        response._content = entry['body']
+        return response
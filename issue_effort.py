@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Effort estimates for the time-based sprint plan, stored as ISSUE-number runs
+Each run is [first, last] at a fixed number of hours per issue, read from the
+"sprint-effort" section of backlog_spec.json; prefix sums over the runs make
+an issue's effort, the hours of any ISSUE range, the hours before issue N and
+the issue reached after H hours all binary searches over the runs - memory
+and load time grow with the number of runs, not the number of issues
+
+Usage: python3 issue_effort.py [first last]   (hours of an ISSUE range)
+"""
+
+import sys
+from bisect import bisect_right
+from typing import List, Dict, Tuple, Iterator, Optional
+
+from backlog_spec import get_backlog, run_size
+from issue_ranges import RangeTable, MISSING
+
+EFFORT_SECTION = 'sprint-effort'
+
+class EffortTable(RangeTable):
+    """Hours per issue over sorted ISSUE runs, with cumulative hours per run"""
+
+    def __init__(self, rows):
+        super().__init__(rows)
+        if any(hours <= 0 for hours in self.values):
+            raise ValueError('effort runs need a positive number of hours per issue')
+        # starts[i] / counts[i]: hours and issue count of every run before run i
+        self.starts, self.counts = [0.0], [0]
+        for first, last, hours in self.rows():
+            count = int(last - first) + 1
+            self.starts.append(self.starts[-1] + hours * count)
+            self.counts.append(self.counts[-1] + count)
+
+    def __iter__(self) -> Iterator[int]:
+        """Every planned ISSUE number, in order"""
+        for first, last in zip(self.firsts, self.lasts):
+            yield from range(first, last + 1)
+
+    def efforts(self) -> List[float]:
+        """Hours of every planned issue, in the same order"""
+        return [hours for first, last, hours in self.rows() for _ in range(int(last - first) + 1)]
+
+    def count(self) -> int:
+        return self.counts[-1]
+
+    def total(self) -> float:
+        return self.starts[-1]
+
+    def effort(self, issue_num: int, default=MISSING) -> float:
+        """Hours of one issue; KeyError for unplanned issues unless a default is given"""
+        return self.lookup(issue_num, default)
+
+    def hours_before(self, issue_num: int) -> float:
+        """Hours of every planned issue numbered below `issue_num`"""
+        i = bisect_right(self.firsts, issue_num - 1) - 1
+        if i < 0:
+            return 0.0
+        covered = min(issue_num - 1, self.lasts[i]) - self.firsts[i] + 1
+        return self.starts[i] + self.values[i] * covered
+
+    def range_hours(self, first: int, last: int) -> float:
+        """Hours of the planned issues in ISSUE first..last (inclusive)"""
+        if last < first:
+            return 0.0
+        return self.hours_before(last + 1) - self.hours_before(first)
+
+    def issue_at(self, hours: float) -> Optional[int]:
+        """Last planned issue that is finished within `hours` of work from the
+        start of the plan (None if the first issue does not fit)"""
+        i = bisect_right(self.starts, hours) - 1
+        if i < 0:
+            return None
+        if i >= len(self):
+            return self.lasts[-1]
+        done = int((hours - self.starts[i]) // self.values[i])
+        if done:
+            return self.firsts[i] + done - 1
+        return self.lasts[i - 1] if i > 0 else None
+
+def spec_rows(runs: List[Dict]) -> Iterator[Tuple[int, int, float]]:
+    """(first, last, hours) per run; an "items" run yields one row per item,
+    each item's own "hours" overriding the run's"""
+    for run in runs:
+        first = run['first']
+        if 'items' not in run:
+            yield first, first + run_size(run) - 1, run['hours']
+            continue
+        for offset, item in enumerate(run['items']):
+            yield first + offset, first + offset, item.get('hours', run.get('hours'))
+
+def effort_table(section: str = EFFORT_SECTION) -> EffortTable:
+    """EffortTable built from a section of the backlog spec"""
+    return EffortTable(spec_rows(get_backlog().runs(section)))
+
+_issue_effort = None
+
+def get_issue_effort() -> EffortTable:
+    """The repository's effort table, built once per process"""
+    global _issue_effort
+    if _issue_effort is None:
+        _issue_effort = effort_table()
+    return _issue_effort
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Issue Effort")
+    print("=" * 60)
+
+    effort = get_issue_effort()
+    print(f"\n{effort.count()} issues in {len(effort)} runs: {effort.total():,.1f} hours")
+    if len(sys.argv) == 3:
+        first, last = int(sys.argv[1]), int(sys.argv[2])
+        print(f"ISSUE {first} to {last}: {effort.range_hours(first, last):,.1f} hours "
+              f"({effort.hours_before(first):,.1f} hours before)")
+
+if __name__ == "__main__":
+    main()
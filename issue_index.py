@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Which ISSUE-NNNN numbers already exist on GitHub
+Answered from the local issue mirror (issue_mirror.py), which is refreshed
+incrementally with `since=` and If-None-Match, so an unchanged repository
+costs a single 304 instead of re-listing every page of issues
+"""
+
+import re
+from typing import Optional, Set
+
+# Matches [ISSUE-0042] as well as the pre-sprint [ISSUE--100] titles
+ISSUE_TITLE = re.compile(r'\[ISSUE-(-?\d+)\]')
+
+def parse_issue_number(title: str) -> Optional[int]:
+    """ISSUE-NNNN number from an issue title, or None"""
+    match = ISSUE_TITLE.search(title or '')
+    return int(match.group(1)) if match else None
+
+def existing_issue_numbers(client=None) -> Set[int]:
+    """Sync the local mirror and return the known ISSUE-NNNN numbers"""
+    from issue_mirror import synced_mirror
+    return synced_mirror(client).issue_numbers()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Local SQLite mirror of the repository's issues
+Kept in sync incrementally with `since=` and If-None-Match, with the ISSUE
+number, XP, coins, epic and user story parsed out of titles, labels and bodies
+once, into indexed columns - so tooling queries in milliseconds instead of
+re-downloading and re-parsing the whole backlog
+"""
+
+import os
+import re
+import json
+import sqlite3
+import threading
+from typing import List, Dict, Optional, Set
+
+from github_client import GitHubClient, get_client
+from issue_index import parse_issue_number
+
+MIRROR_PATH = os.getenv('ISSUE_MIRROR_PATH', '.issue_mirror.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    github_number INTEGER PRIMARY KEY,
+    node_id TEXT,
+    title TEXT NOT NULL,
+    body TEXT,
+    state TEXT NOT NULL,
+    issue_num INTEGER,
+    xp INTEGER,
+    coins INTEGER,
+    epic TEXT,
+    user_story TEXT,
+    milestone TEXT,
+    labels TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    closed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_issue_num ON issues (issue_num);
+CREATE INDEX IF NOT EXISTS issues_state ON issues (state);
+CREATE INDEX IF NOT EXISTS issues_epic ON issues (epic);
+CREATE INDEX IF NOT EXISTS issues_user_story ON issues (user_story);
+CREATE INDEX IF NOT EXISTS issues_milestone ON issues (milestone);
+CREATE INDEX IF NOT EXISTS issues_closed_at ON issues (closed_at);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    github_number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (github_number, name)
+);
+CREATE INDEX IF NOT EXISTS issue_labels_name ON issue_labels (name);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+COLUMNS = ('github_number', 'node_id', 'title', 'body', 'state', 'issue_num', 'xp', 'coins',
+           'epic', 'user_story', 'milestone', 'labels', 'created_at', 'updated_at', 'closed_at')
+
+# xp-/coins- labels are authoritative; the body fields cover issues without them
+LABEL_VALUE = re.compile(r'^(xp|coins)-(\d+)$')
+BODY_XP = re.compile(r'\*\*XP (?:Reward|Value)\*\*:\s*(\d+)')
+BODY_COINS = re.compile(r'\*\*Coin (?:Reward|Value)\*\*:\s*(\d+)')
+BODY_EPIC = re.compile(r'\*\*Epic\*\*:\s*(EPIC-\d+)')
+BODY_USER_STORY = re.compile(r'\*\*User Story\*\*:\s*(US-\d+)')
+
+def parse_issue(issue: Dict) -> Dict:
+    """One REST issue as a mirror row"""
+    labels = [label['name'] for label in issue.get('labels', [])]
+    body = issue.get('body') or ''
+
+    values = {}
+    for name in labels:
+        match = LABEL_VALUE.match(name)
+        if match:
+            values.setdefault(match.group(1), int(match.group(2)))
+    if 'xp' not in values and BODY_XP.search(body):
+        values['xp'] = int(BODY_XP.search(body).group(1))
+    if 'coins' not in values and BODY_COINS.search(body):
+        values['coins'] = int(BODY_COINS.search(body).group(1))
+
+    epic = BODY_EPIC.search(body)
+    user_story = BODY_USER_STORY.search(body)
+    milestone = issue.get('milestone') or {}
+
+    return {
+        'github_number': issue['number'],
+        'node_id': issue.get('node_id'),
+        'title': issue['title'],
+        'body': body,
+        'state': issue['state'],
+        'issue_num': parse_issue_number(issue['title']),
+        'xp': values.get('xp'),
+        'coins': values.get('coins'),
+        'epic': epic.group(1) if epic else None,
+        'user_story': user_story.group(1) if user_story else None,
+        'milestone': milestone.get('title'),
+        'labels': json.dumps(labels),
+        'created_at': issue.get('created_at'),
+        'updated_at': issue.get('updated_at'),
+        'closed_at': issue.get('closed_at')
+    }
+
+class IssueMirror:
+    """Issues table plus sync checkpoint, kept on disk between runs"""
+
+    def __init__(self, path: str = MIRROR_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+
+    def get_meta(self, name: str) -> Optional[str]:
+        row = self.db.execute('SELECT value FROM meta WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: Optional[str]):
+        self.db.execute('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)', (name, value))
+
+    def listing_params(self) -> Dict:
+        params = {'state': 'all', 'per_page': 100, 'sort': 'updated', 'direction': 'asc'}
+        since = self.get_meta('since')
+        if since:
+            params['since'] = since
+        return params
+
+    def upsert(self, issues: List[Dict]):
+        """Write REST issues into the mirror in one transaction"""
+        rows = [parse_issue(issue) for issue in issues if 'pull_request' not in issue]
+        with self.lock:
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO issues ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                [tuple(row[column] for column in COLUMNS) for row in rows]
+            )
+            numbers = [(row['github_number'],) for row in rows]
+            self.db.executemany('DELETE FROM issue_labels WHERE github_number = ?', numbers)
+            self.db.executemany(
+                'INSERT INTO issue_labels (github_number, name) VALUES (?, ?)',
+                [(row['github_number'], name) for row in rows for name in json.loads(row['labels'])]
+            )
+            since = self.get_meta('since')
+            for row in rows:
+                if row['updated_at'] and (not since or row['updated_at'] > since):
+                    since = row['updated_at']
+            self.set_meta('since', since)
+            self.db.commit()
+
+    def sync(self, client: Optional[GitHubClient] = None) -> 'IssueMirror':
+        """Pull in every issue created or changed since the last sync"""
+        client = client or get_client()
+        repo = f'{client.owner}/{client.repo}'
+        # Scoped by API root too, so a fake_github.py run never passes for GitHub's
+        if self.get_meta('repo') != repo or self.get_meta('api_root') != client.api_root:
+            # Mirror belongs to another repository or API - start over
+            with self.lock:
+                self.db.execute('DELETE FROM issues')
+                self.db.execute('DELETE FROM issue_labels')
+                self.db.execute('DELETE FROM meta')
+                self.set_meta('repo', repo)
+                self.set_meta('api_root', client.api_root)
+                self.db.commit()
+
+        etag = self.get_meta('etag')
+        headers = {'If-None-Match': etag} if etag else {}
+        first = client.get('/issues', params=self.listing_params(), headers=headers)
+        if first.status_code == 304:
+            return self
+
+        self.upsert(client.paginate('/issues', first=first))
+
+        # `since` is inclusive, so the listing for the new checkpoint only holds
+        # the newest issue(s); its ETag makes the next unchanged sync a 304
+        checkpoint = client.get('/issues', params=self.listing_params())
+        with self.lock:
+            self.set_meta('etag', checkpoint.headers.get('ETag'))
+            self.db.commit()
+        return self
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        """Run a read-only query against the mirror and return dict rows"""
+        with self.lock:
+            return [dict(row) for row in self.db.execute(sql, params).fetchall()]
+
+    def issue_numbers(self) -> Set[int]:
+        """Every ISSUE-NNNN number that exists in the repository"""
+        return {row['issue_num'] for row in self.query('SELECT DISTINCT issue_num FROM issues WHERE issue_num IS NOT NULL')}
+
+    def issues(self, state: Optional[str] = None, epic: Optional[str] = None,
+               user_story: Optional[str] = None, label: Optional[str] = None,
+               milestone: Optional[str] = None) -> List[Dict]:
+        """Mirrored ISSUE-NNNN issues matching every given filter, in ISSUE order"""
+        conditions, params = ['issue_num IS NOT NULL'], []
+        for column, value in (('state', state), ('epic', epic), ('user_story', user_story),
+                              ('milestone', milestone)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        if label is not None:
+            conditions.append('github_number IN (SELECT github_number FROM issue_labels WHERE name = ?)')
+            params.append(label)
+        rows = self.query(f"SELECT * FROM issues WHERE {' AND '.join(conditions)} "
+                          f"ORDER BY issue_num, github_number", tuple(params))
+        for row in rows:
+            row['labels'] = json.loads(row['labels'])
+        return rows
+
+    def totals(self, group_by: Optional[str] = None) -> List[Dict]:
+        """Issue counts and XP / coin sums by state, optionally per epic or user story"""
+        if group_by not in (None, 'epic', 'user_story', 'milestone'):
+            raise ValueError(f'cannot group by {group_by}')
+        key = f'{group_by}, ' if group_by else ''
+        return self.query(
+            f"SELECT {key}COUNT(*) AS issues, "
+            f"SUM(state = 'open') AS open, SUM(state = 'closed') AS closed, "
+            f"COALESCE(SUM(xp), 0) AS xp, COALESCE(SUM(coins), 0) AS coins, "
+            f"COALESCE(SUM(CASE WHEN state = 'closed' THEN xp END), 0) AS xp_earned, "
+            f"COALESCE(SUM(CASE WHEN state = 'closed' THEN coins END), 0) AS coins_earned "
+            f"FROM issues WHERE issue_num IS NOT NULL"
+            + (f" GROUP BY {group_by} ORDER BY {group_by}" if group_by else '')
+        )
+
+def synced_mirror(client: Optional[GitHubClient] = None) -> IssueMirror:
+    """Open the local mirror and bring it up to date"""
+    return IssueMirror().sync(client)
+
+def main():
+    """Sync the mirror and print a summary"""
+    print("=" * 60)
+    print("SHADOWED REALMS - Issue Mirror")
+    print("=" * 60)
+
+    mirror = synced_mirror()
+    overall = mirror.totals()[0]
+    print(f"\nMirror: {mirror.path}")
+    print(f"Issues: {overall['issues']} ({overall['open'] or 0} open, {overall['closed'] or 0} closed)")
+    print(f"XP: {overall['xp_earned']:,} / {overall['xp']:,} earned")
+    print(f"Coins: {overall['coins_earned']:,} / {overall['coins']:,} earned")
+
+    print("\nBy epic:")
+    for row in mirror.totals('epic'):
+        print(f"  {row['epic'] or '(none)'}: {row['closed'] or 0}/{row['issues']} closed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Range tables for ISSUE-number lookups
+Sorted, non-overlapping [first, last] ranges mapped to values, looked up by
+binary search - one number at a time with bisect, or a whole array at once
+with numpy.searchsorted - instead of if/elif cascades in every script
+Bounds may be float('-inf') / float('inf') for open-ended ranges
+"""
+
+from bisect import bisect_right
+from typing import List, Tuple, Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MISSING = object()
+
+class RangeTable:
+    """Values for ISSUE-number ranges, found by binary search over the range starts"""
+
+    def __init__(self, rows: Iterable[Tuple[float, float, Any]]):
+        rows = sorted(rows, key=lambda row: row[0])
+        for (first, last, _), (next_first, _, _) in zip(rows, rows[1:]):
+            if next_first <= last:
+                raise ValueError(f'overlapping ranges {first}-{last} and {next_first}')
+        for first, last, _ in rows:
+            if last < first:
+                raise ValueError(f'empty range {first}-{last}')
+        self.firsts = [row[0] for row in rows]
+        self.lasts = [row[1] for row in rows]
+        self.values = [row[2] for row in rows]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def rows(self) -> List[Tuple[float, float, Any]]:
+        return list(zip(self.firsts, self.lasts, self.values))
+
+    def index(self, issue_num: float) -> int:
+        """Row holding `issue_num`, or -1"""
+        i = bisect_right(self.firsts, issue_num) - 1
+        return i if i >= 0 and issue_num <= self.lasts[i] else -1
+
+    def lookup(self, issue_num: float, default: Any = MISSING) -> Any:
+        """Value of the range holding `issue_num`; KeyError outside every range
+        unless a default is given"""
+        i = self.index(issue_num)
+        if i >= 0:
+            return self.values[i]
+        if default is MISSING:
+            raise KeyError(issue_num)
+        return default
+
+    def position(self, issue_num: float) -> int:
+        """1-based position of `issue_num` within its range"""
+        i = self.index(issue_num)
+        if i < 0:
+            raise KeyError(issue_num)
+        return int(issue_num - self.firsts[i]) + 1
+
+    def indexes(self, numbers: Sequence[float]):
+        """Row per number (-1 outside every range), as a NumPy array when available"""
+        if np is None:
+            return [self.index(issue_num) for issue_num in numbers]
+        numbers = np.asarray(numbers)
+        found = np.searchsorted(np.asarray(self.firsts), numbers, side='right') - 1
+        inside = (found >= 0) & (numbers <= np.asarray(self.lasts)[np.maximum(found, 0)])
+        return np.where(inside, found, -1)
+
+    def lookup_many(self, numbers: Sequence[float], default: Any = MISSING) -> List[Any]:
+        """lookup() over a whole array of issue numbers in one vectorized search"""
+        values = []
+        for issue_num, i in zip(numbers, self.indexes(numbers)):
+            if i >= 0:
+                values.append(self.values[i])
+            elif default is MISSING:
+                raise KeyError(issue_num)
+            else:
+                values.append(default)
+        return values
+
+# Sprint 1 base rewards by difficulty band: (xp, coins) before type multipliers
+BASE_REWARDS = RangeTable([
+    (float('-inf'), 80, (25, 10)),  # Setup tasks - Basic
+    (81, 160, (50, 20)),
+    (161, 250, (100, 40)),      # Character system - Intermediate
+    (251, 300, (200, 80)),
+    (301, 400, (200, 80)),      # Combat system - Advanced
+    (401, 480, (300, 120)),
+    (481, 560, (150, 60)),      # Environment - Intermediate/Advanced
+    (561, 640, (250, 100)),
+    (641, 720, (100, 50)),      # UI/UX - Intermediate
+    (721, 780, (150, 75)),
+    (781, 900, (200, 100)),     # Save System - Advanced
+    (901, float('inf'), (150, 75))  # Audio System - Intermediate
+])
+
+# Memory fragment progress shown on the complete Sprint 1 micro-tasks
+MICRO_TASK_FRAGMENTS = RangeTable([
+    (1, 160, 'Unlocks progress toward Fragments 1-7'),
+    (161, 300, 'Unlocks progress toward Fragments 8-14'),
+    (301, 500, 'Unlocks progress toward Fragments 15-21'),
+    (501, 700, 'Unlocks progress toward Fragments 22-28'),
+    (701, 850, 'Unlocks progress toward Fragments 29-35'),
+    (851, 1000, 'Unlocks progress toward Fragments 36-42')
+])
+
+# (memory fragments, epic) for the remaining Sprint 1 deliverable issues
+DELIVERABLE_EPICS = RangeTable([
+    (601, 640, ('Fragments 22-28: Environment System Done', 'EPIC-004: Environment System')),
+    (641, 780, ('Fragments 29-35: UI/UX Complete', 'EPIC-008: UI/UX Framework')),
+    (781, 900, ('Fragments 36-42: Save System Implemented', 'EPIC-007: Save System & Persistence')),
+    (901, 1000, ('Fragments 43-49: Audio System & Polish', 'EPIC-009: Audio & Polish'))
+])
+
+# Pre-Sprint 1 phases of the ideation issues
+IDEATION_PHASES = RangeTable([
+    (-100, -81, 'Phase 0: Project Ideation'),
+    (-80, -61, 'Phase 0.5: Comprehensive Documentation'),
+    (-60, -41, 'Phase 0.7: Concept Art & Prototypes'),
+    (-40, -21, 'Phase 0.8: Tools & Pipeline Setup'),
+    (-20, -1, 'Phase 0.9: Business & Legal')
+])
+
+# Epics and user stories of the time-based sprint plan
+SPRINT_EPICS = RangeTable([
+    (1, 100, 'EPIC-001: Ideation & Documentation'),
+    (101, 260, 'EPIC-002: Core Systems'),
+    (261, 420, 'EPIC-003: Combat Framework'),
+    (421, 580, 'EPIC-004: Environment System'),
+    (581, 640, 'EPIC-005: Character System'),
+    (641, 760, 'EPIC-006: UI/UX Framework'),
+    (761, 820, 'EPIC-005: Character System'),
+    (821, 900, 'EPIC-007: Save System'),
+    (901, 1000, 'EPIC-008: Audio & Polish')
+])
+SPRINT_USER_STORIES = RangeTable([
+    (1, 50, 'US-001: Documentation'),
+    (51, 100, 'US-002: Project Structure'),
+    (101, 180, 'US-003: Movement'),
+    (181, 260, 'US-004: Inventory'),
+    (261, 340, 'US-005: Melee Combat'),
+    (341, 420, 'US-006: Magic System'),
+    (421, 500, 'US-007: Environments'),
+    (501, 580, 'US-008: Weather'),
+    (581, 640, 'US-009: Customization'),
+    (641, 720, 'US-011: UI Design'),
+    (721, 760, 'US-012: HUD'),
+    (761, 820, 'US-010: Progression'),
+    (821, 880, 'US-013: Save/Load'),
+    (881, 900, 'US-014: Cloud Saves'),
+    (901, 960, 'US-015: Audio'),
+    (961, 1000, 'US-016: Polish')
+])
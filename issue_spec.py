@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Bulk executor for the issue definitions behind the gh-CLI setup scripts
+create_issues.sh and create_full_ecosystem.sh used to spawn one `gh issue
+create` per epic, user story and issue; their titles, bodies and labels now
+live in ecosystem_issues.json and are sent through the shared pooled client
+by the bulk engine - journaled, rate-governed and concurrent
+A spec entry with a "repeat" block ({"var", "from", "to"}) stands for one
+issue per number, with {var} substituted in its title, body and labels
+
+Usage: python3 issue_spec.py [section ...]   (default: every section)
+"""
+
+import os
+import sys
+import json
+from typing import List, Dict, Iterator, Optional
+
+from bulk_issue_engine import create_issues_bulk, summarize
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ecosystem_issues.json')
+
+def load_spec(path: str = SPEC_PATH) -> Dict:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def expand(entries: List[Dict]) -> Iterator[Dict]:
+    """Spec entries as bulk-engine jobs, in spec order"""
+    for entry in entries:
+        repeat = entry.get('repeat')
+        if not repeat:
+            yield {'title': entry['title'], 'body': entry['body'], 'labels': list(entry['labels'])}
+            continue
+
+        placeholder = '{' + repeat['var'] + '}'
+        for value in range(repeat['from'], repeat['to'] + 1):
+            yield {
+                'title': entry['title'].replace(placeholder, str(value)),
+                'body': entry['body'].replace(placeholder, str(value)),
+                'labels': [label.replace(placeholder, str(value)) for label in entry['labels']]
+            }
+
+def spec_jobs(sections: Optional[List[str]] = None, path: str = SPEC_PATH) -> List[Dict]:
+    """Jobs for the named spec sections (every section when None)"""
+    spec = load_spec(path)
+    unknown = [name for name in sections or [] if name not in spec]
+    if unknown:
+        raise ValueError(f"unknown spec section(s): {', '.join(unknown)} "
+                         f"(available: {', '.join(spec)})")
+
+    jobs = []
+    for name in sections or list(spec):
+        jobs.extend(expand(spec[name]['issues']))
+    return jobs
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Issue Spec")
+    print("=" * 60)
+
+    sections = sys.argv[1:] or None
+    try:
+        jobs = spec_jobs(sections)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+    print(f"\n{len(jobs)} issues from {', '.join(sections or load_spec())}")
+
+    # Journaled, so a rerun only sends the issues that were not confirmed
+    results = create_issues_bulk(jobs)
+    summary = summarize(results)
+
+    print("\n" + "=" * 60)
+    print(f"Created: {summary['created']} issues")
+    print(f"Failed: {summary['failed']} issues")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
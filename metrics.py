@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Throughput and latency metrics for GitHub runs
+Every request the shared client sends is recorded here: per-endpoint latency
+histograms, status codes, retries and the latest rate-limit headroom, plus job
+progress from the bulk runners for a projected time to completion
+A one-line summary is printed every METRICS_INTERVAL seconds while requests
+are flowing, and the totals are written to METRICS_PATH when the process exits
+(OpenMetrics text for .prom / .txt paths, JSON otherwise)
+"""
+
+import os
+import re
+import json
+import time
+import atexit
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+METRICS_PATH = os.getenv('METRICS_PATH', '.github_metrics.json')
+METRICS_INTERVAL = float(os.getenv('METRICS_INTERVAL', '10'))
+
+# Latency histogram upper bounds in seconds; the last bucket is +Inf
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def endpoint_for(method: str, url: str) -> str:
+    """Method plus URL path with the repository and IDs folded, e.g. 'PATCH /issues/:number'"""
+    path = urlparse(url).path
+    path = re.sub(r'^/repos/[^/]+/[^/]+', '', path) or '/'
+    path = re.sub(r'/labels/[^/]+', '/labels/:name', path)
+    path = re.sub(r'/\d+', '/:number', path)
+    return f'{method.upper()} {path}'
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    return f'{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}'
+
+class Metrics:
+    """Thread-safe counters for one process"""
+
+    def __init__(self, interval: float = METRICS_INTERVAL):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        # endpoint -> {'statuses', 'buckets', 'sum', 'count'}
+        self.endpoints: Dict[str, Dict] = {}
+        self.retries: Dict[str, int] = {}
+        # 'hit' (served from disk), 'revalidated' (304) or 'miss'
+        self.cache: Dict[str, int] = {}
+        # resource -> {'limit', 'remaining', 'reset'} from the latest response
+        self.headroom: Dict[str, Dict[str, int]] = {}
+        self.jobs_total = 0
+        self.jobs_done = 0
+        self.jobs_started = None
+        self.reporter = None
+        self.stopped = threading.Event()
+
+    def observe(self, method: str, url: str, seconds: float, response=None):
+        """Record one attempt; `response` is None when the connection failed"""
+        endpoint = endpoint_for(method, url)
+        status = str(response.status_code) if response is not None else 'error'
+        with self.lock:
+            self.requests += 1
+            stats = self.endpoints.setdefault(endpoint, {
+                'statuses': {}, 'buckets': [0] * (len(BUCKETS) + 1), 'sum': 0.0, 'count': 0
+            })
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+            stats['buckets'][self.bucket_index(seconds)] += 1
+            stats['sum'] += seconds
+            stats['count'] += 1
+
+            headers = response.headers if response is not None else {}
+            if headers.get('X-RateLimit-Remaining') is not None:
+                resource = headers.get('X-RateLimit-Resource', 'core')
+                self.headroom[resource] = {
+                    'limit': int(headers.get('X-RateLimit-Limit', 5000)),
+                    'remaining': int(headers['X-RateLimit-Remaining']),
+                    'reset': int(headers.get('X-RateLimit-Reset', 0))
+                }
+
+            if self.reporter is None and self.interval > 0:
+                self.reporter = threading.Thread(target=self.report_loop, daemon=True)
+                self.reporter.start()
+
+    def retried(self, reason: str):
+        with self.lock:
+            self.retries[reason] = self.retries.get(reason, 0) + 1
+
+    def cached(self, outcome: str):
+        with self.lock:
+            self.cache[outcome] = self.cache.get(outcome, 0) + 1
+
+    def add_jobs(self, count: int):
+        """Announce `count` more units of work for the completion estimate"""
+        with self.lock:
+            if self.jobs_started is None:
+                self.jobs_started = time.time()
+            self.jobs_total += count
+
+    def job_done(self, count: int = 1):
+        with self.lock:
+            self.jobs_done += count
+
+    @staticmethod
+    def bucket_index(seconds: float) -> int:
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                return index
+        return len(BUCKETS)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bucket bound holding the given fraction of all latencies"""
+        totals = [0] * (len(BUCKETS) + 1)
+        for stats in self.endpoints.values():
+            totals = [a + b for a, b in zip(totals, stats['buckets'])]
+        count = sum(totals)
+        if not count:
+            return None
+        seen = 0
+        for index, bucket in enumerate(totals):
+            seen += bucket
+            if seen >= fraction * count:
+                return BUCKETS[index] if index < len(BUCKETS) else float('inf')
+        return float('inf')
+
+    def eta(self) -> Optional[float]:
+        """Seconds until every announced job is done at the current rate"""
+        if not self.jobs_done or self.jobs_started is None:
+            return None
+        rate = self.jobs_done / max(time.time() - self.jobs_started, 1e-6)
+        return (self.jobs_total - self.jobs_done) / rate
+
+    def summary_line(self) -> str:
+        """One-line snapshot: rate, latency, retries, headroom and progress"""
+        with self.lock:
+            elapsed = max(time.time() - self.started, 1e-6)
+            parts = [f"{self.requests} req ({self.requests / elapsed:.1f}/s)"]
+
+            p50, p95 = self.percentile(0.5), self.percentile(0.95)
+            if p50 is not None:
+                parts.append(f"p50 ≤{p50 * 1000:.0f}ms p95 ≤{p95 * 1000:.0f}ms")
+            parts.append(f"retries {sum(self.retries.values())}")
+            if self.cache.get('hit') or self.cache.get('revalidated'):
+                parts.append(f"cache {self.cache.get('hit', 0)} hit/{self.cache.get('revalidated', 0)} 304")
+            for resource, budget in sorted(self.headroom.items()):
+                parts.append(f"{resource} {budget['remaining']}/{budget['limit']}")
+
+            if self.jobs_total:
+                progress = f"{self.jobs_done}/{self.jobs_total} done"
+                eta = self.eta()
+                if eta is not None and self.jobs_done < self.jobs_total:
+                    progress += f", ETA {format_duration(eta)}"
+                parts.append(progress)
+        return '[metrics] ' + ' | '.join(parts)
+
+    def report_loop(self):
+        last = 0
+        while not self.stopped.wait(self.interval):
+            # Stay quiet while nothing is being sent
+            if self.requests != last:
+                last = self.requests
+                print(self.summary_line())
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            return {
+                'elapsed_seconds': round(time.time() - self.started, 3),
+                'requests': self.requests,
+                'buckets': list(BUCKETS),
+                'endpoints': json.loads(json.dumps(self.endpoints)),
+                'retries': dict(self.retries),
+                'cache': dict(self.cache),
+                'rate_limit': json.loads(json.dumps(self.headroom)),
+                'jobs': {'total': self.jobs_total, 'done': self.jobs_done}
+            }
+
+    def openmetrics(self) -> str:
+        """The snapshot in OpenMetrics text exposition format"""
+        data = self.snapshot()
+        lines = ['# TYPE github_requests counter']
+        for endpoint, stats in sorted(data['endpoints'].items()):
+            for status, count in sorted(stats['statuses'].items()):
+                lines.append(f'github_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+
+        lines.append('# TYPE github_request_duration_seconds histogram')
+        lines.append('# UNIT github_request_duration_seconds seconds')
+        for endpoint, stats in sorted(data['endpoints'].items()):
+            cumulative = 0
+            for bound, count in zip(list(BUCKETS) + ['+Inf'], stats['buckets']):
+                cumulative += count
+                lines.append(f'github_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+            lines.append(f'github_request_duration_seconds_sum{{endpoint="{endpoint}"}} {stats["sum"]:.6f}')
+            lines.append(f'github_request_duration_seconds_count{{endpoint="{endpoint}"}} {stats["count"]}')
+
+        lines.append('# TYPE github_retries counter')
+        for reason, count in sorted(data['retries'].items()):
+            lines.append(f'github_retries_total{{reason="{reason}"}} {count}')
+
+        lines.append('# TYPE github_cache counter')
+        for outcome, count in sorted(data['cache'].items()):
+            lines.append(f'github_cache_total{{outcome="{outcome}"}} {count}')
+
+        lines.append('# TYPE github_rate_limit_remaining gauge')
+        for resource, budget in sorted(data['rate_limit'].items()):
+            lines.append(f'github_rate_limit_remaining{{resource="{resource}"}} {budget["remaining"]}')
+        lines.append('# TYPE github_rate_limit_limit gauge')
+        for resource, budget in sorted(data['rate_limit'].items()):
+            lines.append(f'github_rate_limit_limit{{resource="{resource}"}} {budget["limit"]}')
+
+        lines.append('# TYPE github_jobs gauge')
+        lines.append(f'github_jobs{{state="total"}} {data["jobs"]["total"]}')
+        lines.append(f'github_jobs{{state="done"}} {data["jobs"]["done"]}')
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str = METRICS_PATH):
+        """Write the totals as OpenMetrics text (.prom / .txt) or JSON"""
+        if path.endswith(('.prom', '.txt')):
+            content = self.openmetrics()
+        else:
+            content = json.dumps(self.snapshot(), indent=2)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def finish(self, path: Optional[str] = METRICS_PATH):
+        """Stop the periodic summary, print a final one and dump the totals"""
+        self.stopped.set()
+        if not self.requests:
+            return
+        print(self.summary_line())
+        if path:
+            self.dump(path)
+            print(f"[metrics] written to {path}")
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_metrics() -> Metrics:
+    """Process-wide metrics, finished and dumped automatically at exit"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = Metrics()
+            atexit.register(_metrics.finish)
+    return _metrics
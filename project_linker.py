@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Batched ProjectV2 linker for the Shadowed Realms sprint board
+Pages through every repository issue, reads the board's current items once,
+and adds only the missing issues with batched addProjectV2ItemById mutations
+"""
+
+from typing import List, Dict, Optional, Tuple
+
+from github_client import GitHubClient, get_client
+from graphql_batch import run_batched
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $states: [IssueState!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: $states, orderBy: {field: CREATED_AT, direction: ASC}) {
+      nodes { id number title }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+PROJECT_ITEMS_QUERY = """
+query($project: ID!, $cursor: String) {
+  node(id: $project) {
+    ... on ProjectV2 {
+      items(first: 100, after: $cursor) {
+        nodes {
+          id
+          content {
+            ... on Issue { id }
+            ... on PullRequest { id }
+          }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+def list_repository_issues(client: Optional[GitHubClient] = None,
+                           states: Tuple[str, ...] = ('OPEN', 'CLOSED')) -> List[Dict]:
+    """Every issue in the repository as {'id', 'number', 'title'}, oldest first"""
+    client = client or get_client()
+    issues = []
+    cursor = None
+    while True:
+        response = client.graphql(ISSUES_QUERY, {
+            'owner': client.owner,
+            'name': client.repo,
+            'states': list(states),
+            'cursor': cursor
+        })
+        page = response.json()['data']['repository']['issues']
+        issues.extend(page['nodes'])
+        if not page['pageInfo']['hasNextPage']:
+            return issues
+        cursor = page['pageInfo']['endCursor']
+
+def list_project_items(project_id: str, client: Optional[GitHubClient] = None) -> Dict[str, str]:
+    """Project item ID per node ID of every issue or pull request on the project"""
+    client = client or get_client()
+    items = {}
+    cursor = None
+    while True:
+        response = client.graphql(PROJECT_ITEMS_QUERY, {'project': project_id, 'cursor': cursor})
+        page = response.json()['data']['node']['items']
+        for node in page['nodes']:
+            content = node.get('content') or {}
+            if content.get('id'):
+                items[content['id']] = node.get('id')
+        if not page['pageInfo']['hasNextPage']:
+            return items
+        cursor = page['pageInfo']['endCursor']
+
+def list_project_content_ids(project_id: str, client: Optional[GitHubClient] = None) -> set:
+    """Node IDs of every issue or pull request already on the project"""
+    return set(list_project_items(project_id, client))
+
+def landed_items(project_id: str, issues: List[Dict],
+                 client: Optional[GitHubClient] = None) -> List[Optional[Dict]]:
+    """addProjectV2ItemById results for the issues that are on the board after all"""
+    on_board = list_project_items(project_id, client)
+    return [{'item': {'id': on_board[issue['id']]}} if issue['id'] in on_board else None
+            for issue in issues]
+
+def link_all_issues(project_id: str, client: Optional[GitHubClient] = None,
+                    states: Tuple[str, ...] = ('OPEN', 'CLOSED')) -> Dict[str, int]:
+    """Add every repository issue that is not yet on the board
+
+    Returns counts of issues found, already linked, newly linked and failed.
+    """
+    client = client or get_client()
+    issues = list_repository_issues(client, states)
+    on_board = list_project_content_ids(project_id, client)
+    missing = [issue for issue in issues if issue['id'] not in on_board]
+
+    print(f"Found {len(issues)} issues, {len(issues) - len(missing)} already on the board")
+
+    results = run_batched(
+        missing, 'addProjectV2ItemById', 'AddProjectV2ItemByIdInput', 'item { id }',
+        lambda issue: {'projectId': project_id, 'contentId': issue['id']},
+        client=client,
+        reconcile=lambda items, since: landed_items(project_id, items, client)
+    )
+
+    failed = [r for r in results if r['error']]
+    for result in failed:
+        print(f"  ✗ Issue #{result['item']['number']}: {result['error']}")
+
+    return {
+        'found': len(issues),
+        'already_linked': len(issues) - len(missing),
+        'linked': len(results) - len(failed),
+        'failed': len(failed)
+    }
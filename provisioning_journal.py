@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Crash-safe journal for long provisioning runs
+Every create is recorded as 'intended' before it is sent and 'confirmed' (or
+'failed') after, in an append-only SQLite log in WAL mode. A rerun skips what
+is already confirmed, and issues that were created but never recorded are
+found with one listing of recently updated issues matched by title
+Events are scoped by API root and repository, so a run against fake_github.py
+or another repository never marks this one's issues as done
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+
+from github_client import GitHubClient, get_client
+
+JOURNAL_PATH = os.getenv('JOURNAL_PATH', '.provisioning_journal.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    scope TEXT NOT NULL DEFAULT '',
+    key TEXT NOT NULL,
+    event TEXT NOT NULL,
+    github_number INTEGER,
+    detail TEXT,
+    created_at REAL NOT NULL
+);
+"""
+
+# Created after the scope column is ensured, so older journals can migrate
+INDEXES = """
+CREATE INDEX IF NOT EXISTS events_scope_key ON events (scope, key, id);
+"""
+
+def job_key(job: Dict) -> str:
+    """Journal key for a job - its title unless the job sets one"""
+    return job.get('key') or job['title']
+
+class ProvisioningJournal:
+    """Append-only intended/confirmed/failed log keyed by job, for one repository"""
+
+    def __init__(self, path: str = JOURNAL_PATH, scope: Optional[str] = None):
+        self.path = path
+        # API root + owner/repo of the repository the jobs are created in
+        self.scope = scope or get_client().repo_url
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(events)')]
+        if 'scope' not in columns:
+            # Events from before scoping belong to no repository and are ignored
+            self.db.execute("ALTER TABLE events ADD COLUMN scope TEXT NOT NULL DEFAULT ''")
+        self.db.executescript(INDEXES)
+
+    def record(self, key: str, event: str, github_number: Optional[int] = None,
+               detail: Optional[str] = None):
+        """Append one event and commit it before returning"""
+        with self.lock:
+            self.db.execute(
+                'INSERT INTO events (scope, key, event, github_number, detail, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (self.scope, key, event, github_number, detail, time.time())
+            )
+            self.db.commit()
+
+    def intend(self, key: str, title: str):
+        self.record(key, 'intended', detail=title)
+
+    def confirm(self, key: str, github_number: int):
+        self.record(key, 'confirmed', github_number=github_number)
+
+    def fail(self, key: str, error: str):
+        self.record(key, 'failed', detail=error)
+
+    def latest(self) -> Dict[str, Dict]:
+        """Latest event per key in this journal's scope"""
+        with self.lock:
+            rows = self.db.execute("""
+                SELECT e.key, e.event, e.github_number, e.detail, e.created_at
+                FROM events e
+                JOIN (SELECT key, MAX(id) AS id FROM events WHERE scope = ? GROUP BY key) last ON last.id = e.id
+            """, (self.scope,)).fetchall()
+        return {row[0]: {'event': row[1], 'github_number': row[2],
+                         'detail': row[3], 'created_at': row[4]} for row in rows}
+
+    def confirmed(self) -> Dict[str, int]:
+        """Key -> GitHub issue number for every confirmed job"""
+        return {key: entry['github_number'] for key, entry in self.latest().items()
+                if entry['event'] == 'confirmed'}
+
+    def reconcile(self, client: Optional[GitHubClient] = None) -> int:
+        """Confirm jobs whose create landed on GitHub but was never recorded
+
+        Looks only at keys whose last event is 'intended' (the process died
+        mid-request) and matches them by title against a single listing of
+        issues updated since the oldest such intent. Returns how many were
+        confirmed.
+        """
+        unconfirmed = {entry['detail']: key for key, entry in self.latest().items()
+                       if entry['event'] == 'intended'}
+        if not unconfirmed:
+            return 0
+
+        oldest = min(entry['created_at'] for entry in self.latest().values()
+                     if entry['event'] == 'intended')
+        since = datetime.fromtimestamp(oldest - 60, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        client = client or get_client()
+        issues = client.paginate('/issues', params={'state': 'all', 'per_page': 100, 'since': since})
+
+        found = 0
+        for issue in issues:
+            key = unconfirmed.pop(issue['title'], None)
+            if key is not None:
+                self.confirm(key, issue['number'])
+                found += 1
+        return found
+
+    def pending_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Jobs that still need to run"""
+        done = self.confirmed()
+        return [job for job in jobs if job_key(job) not in done]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Adaptive rate-limit governor for the GitHub API
+Paces requests from the X-RateLimit-Remaining / X-RateLimit-Reset / Retry-After
+headers GitHub returns, instead of fixed sleeps in every script
+Also keeps content-creating requests under GitHub's secondary limits
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+# Secondary (abuse) limits for content-creating requests - POST/PATCH/PUT/DELETE
+# GitHub documents 80 per minute and 500 per hour
+WRITES_PER_MINUTE = 80
+WRITES_PER_HOUR = 500
+
+# Requests held back from the primary budget so other scripts are never starved
+RESERVE = 50
+
+# Start spreading the remaining budget over the reset window below this fraction
+PACE_BELOW = 0.2
+
+# Wait used when a secondary-limit 403 arrives without a Retry-After header
+SECONDARY_BACKOFF = 60
+
+WRITE_METHODS = {'POST', 'PATCH', 'PUT', 'DELETE'}
+
+def resource_for(url: str) -> str:
+    """Map a request URL to the GitHub rate-limit resource it is billed against"""
+    if url.rstrip('/').endswith('/graphql'):
+        return 'graphql'
+    if '/search/' in url:
+        return 'search'
+    return 'core'
+
+def is_secondary_limit(response) -> bool:
+    """True if a 403/429 is GitHub's secondary (abuse) limit rather than the hourly budget"""
+    if response.status_code not in (403, 429):
+        return False
+    if response.headers.get('Retry-After'):
+        return True
+    try:
+        message = response.json().get('message', '')
+    except ValueError:
+        return False
+    return 'secondary rate limit' in message.lower() or 'abuse' in message.lower()
+
+class RateLimitGovernor:
+    """Thread-safe pacing of GitHub requests driven by response headers"""
+
+    def __init__(self, reserve: int = RESERVE, pace_below: float = PACE_BELOW,
+                 writes_per_minute: int = WRITES_PER_MINUTE,
+                 writes_per_hour: int = WRITES_PER_HOUR,
+                 secondary_backoff: float = SECONDARY_BACKOFF):
+        self.reserve = reserve
+        self.pace_below = pace_below
+        self.writes_per_minute = writes_per_minute
+        self.writes_per_hour = writes_per_hour
+        self.secondary_backoff = secondary_backoff
+
+        self.lock = threading.Lock()
+        # resource -> {'limit', 'remaining', 'reset'} from the latest response
+        self.budgets: Dict[str, Dict[str, int]] = {}
+        # resource -> earliest wall-clock time the next request may start
+        self.next_slot: Dict[str, float] = {}
+        # Wall-clock time before which nothing may be sent (Retry-After / exhausted budget)
+        self.paused_until = 0.0
+        self.write_times = deque()
+
+    def wait(self, method: str, url: str, writes: Optional[int] = None):
+        """Block until a request of this kind may be sent, then reserve its slot
+
+        `writes` is how many content-creating operations the request carries
+        (a batched GraphQL mutation carries many); it defaults to one for
+        write methods and zero otherwise.
+        """
+        resource = resource_for(url)
+        if writes is None:
+            writes = 1 if method.upper() in WRITE_METHODS else 0
+
+        with self.lock:
+            now = time.time()
+            start = max(now, self.paused_until, self.next_slot.get(resource, 0.0))
+
+            if writes:
+                start = max(start, self._write_window_start(start, writes))
+                self.write_times.extend([start] * writes)
+
+            interval = self._pace_interval(resource, start)
+            self.next_slot[resource] = start + interval
+
+            budget = self.budgets.get(resource)
+            if budget and budget['remaining'] > 0:
+                budget['remaining'] -= 1
+
+        delay = start - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def observe(self, method: str, url: str, response):
+        """Update budgets from a response's rate-limit headers"""
+        headers = response.headers
+        resource = headers.get('X-RateLimit-Resource') or resource_for(url)
+        now = time.time()
+
+        with self.lock:
+            remaining = headers.get('X-RateLimit-Remaining')
+            reset = headers.get('X-RateLimit-Reset')
+            if remaining is not None and reset is not None:
+                self.budgets[resource] = {
+                    'limit': int(headers.get('X-RateLimit-Limit', 5000)),
+                    'remaining': int(remaining),
+                    'reset': int(reset)
+                }
+
+            if response.status_code not in (403, 429):
+                return
+
+            retry_after = headers.get('Retry-After')
+            if retry_after is not None:
+                pause = now + float(retry_after)
+            elif remaining == '0' and reset is not None:
+                # Primary budget exhausted - nothing goes out until the window resets
+                pause = int(reset) + 1
+            elif is_secondary_limit(response):
+                pause = now + self.secondary_backoff
+            else:
+                return
+
+            if pause > self.paused_until:
+                self.paused_until = pause
+                print(f"  Rate limited on {resource}, pausing {pause - now:.0f}s")
+
+    def headroom(self, resource: str = 'core') -> Optional[Dict[str, int]]:
+        """Latest known budget for a resource, or None before the first response"""
+        with self.lock:
+            budget = self.budgets.get(resource)
+            return dict(budget) if budget else None
+
+    def _pace_interval(self, resource: str, now: float) -> float:
+        """Seconds to leave between requests so the budget lasts until reset"""
+        budget = self.budgets.get(resource)
+        if not budget:
+            return 0.0
+
+        seconds_left = max(budget['reset'] - now, 0.0)
+        usable = budget['remaining'] - self.reserve
+        if usable <= 0:
+            # Only the reserve is left - stop until the window resets
+            return seconds_left
+        if budget['remaining'] > budget['limit'] * self.pace_below:
+            return 0.0
+        return seconds_left / usable
+
+    def _write_window_start(self, start: float, writes: int) -> float:
+        """Earliest start time that keeps `writes` more writes inside both windows"""
+        while self.write_times and self.write_times[0] <= start - 3600:
+            self.write_times.popleft()
+
+        earliest = start
+        for window, limit in ((3600, self.writes_per_hour), (60, self.writes_per_minute)):
+            recent = [t for t in self.write_times if t > start - window]
+            # A batch larger than the whole window can at best start once the window is empty
+            excess = len(recent) + min(writes, limit) - limit
+            if excess > 0:
+                # Wait until enough earlier writes have aged out of the window
+                earliest = max(earliest, recent[excess - 1] + window)
+
+        return earliest
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Reconcile the whole Shadowed Realms ecosystem against GitHub
+Collects every label, milestone and ISSUE-NNNN issue the setup scripts define -
+the ideation issues plus the sprint1-complete backlog that
+create_complete_sprint1.py provisions - prints the plan against the live
+repository and applies only what is missing
+Set PLAN_ONLY=1 to print the plan without writing anything
+"""
+
+import os
+
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO, get_client
+from reconciler import reconcile
+from backlog_spec import issue_records, section_size
+from create_agile_hierarchy import HIERARCHY_LABELS, hierarchy_milestones
+from create_sprint_milestones import sprint_milestones
+import create_ideation_documentation_issues as ideation
+import create_complete_sprint1 as sprint1
+
+if not GITHUB_TOKEN:
+    print("Error: GITHUB_TOKEN environment variable not set")
+    exit(1)
+
+PLAN_ONLY = os.getenv('PLAN_ONLY') == '1'
+
+def desired_issues():
+    """Every issue job the creator scripts would send, in ISSUE order"""
+    ideation_total = section_size('ideation')
+    jobs = [ideation.build_job(issue_data, ideation_total)
+            for issue_data in ideation.generate_ideation_documentation_issues()]
+    # One canonical Sprint 1 section: the older safe / missing / remaining
+    # creators name and reward the same ISSUE numbers differently
+    jobs += [sprint1.build_job(issue_data) for issue_data in issue_records('sprint1-complete')]
+    return jobs
+
+def desired_state():
+    """Labels, milestones and issues the repository should have"""
+    issues = desired_issues()
+    labels = list(HIERARCHY_LABELS)
+    named = {label['name'] for label in labels}
+    for job in issues:
+        for name in job['labels']:
+            if name not in named:
+                named.add(name)
+                labels.append({'name': name})
+
+    return {
+        'labels': labels,
+        'milestones': hierarchy_milestones() + sprint_milestones(),
+        'issues': issues
+    }
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Ecosystem Reconcile")
+    print("=" * 60)
+
+    desired = desired_state()
+    print(f"\nDesired: {len(desired['labels'])} labels, {len(desired['milestones'])} milestones, "
+          f"{len(desired['issues'])} issues\n")
+
+    counts = reconcile(desired, get_client(), dry_run=PLAN_ONLY)
+
+    print("\n" + "=" * 60)
+    if PLAN_ONLY:
+        print("Plan only - nothing was written")
+    else:
+        print(f"Created: {counts['created']}")
+        print(f"Updated: {counts['updated']}")
+        print(f"Failed: {counts['failed']}")
+    print(f"\nView at: https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Desired-state reconciler for labels, milestones and issues
+Reads the live repository once, diffs it against the full desired state and
+prints a plan, then applies only the creates and updates that are needed, so
+re-running an unchanged setup costs a few listing reads and no writes
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+from urllib.parse import quote
+
+from github_client import GitHubClient, get_client
+from issue_index import parse_issue_number
+from bulk_issue_engine import CONCURRENCY, create_issues_bulk
+
+# Object kinds, in the order a plan is applied
+KINDS = ('label', 'milestone', 'issue')
+SYMBOLS = {'create': '+', 'update': '~'}
+
+# Issue labels that carry one value each: a desired label with one of these
+# prefixes replaces the live label with the same prefix instead of joining it
+MANAGED_LABEL_PREFIXES = ('xp-', 'coins-', 'sprint-')
+
+# Listing read for each kind of object
+LISTINGS = {
+    'label': ('/labels', {'per_page': 100}),
+    'milestone': ('/milestones', {'state': 'all', 'per_page': 100}),
+    'issue': ('/issues', {'state': 'all', 'per_page': 100})
+}
+
+def read_live_state(client: Optional[GitHubClient] = None, kinds=KINDS) -> Dict:
+    """Every label, milestone and issue in the repository, one listing each
+
+    Only the listings for `kinds` are read; the others come back empty.
+    """
+    client = client or get_client()
+    live = {}
+    for kind in KINDS:
+        path, params = LISTINGS[kind]
+        items = client.paginate(path, params=params) if kind in kinds else []
+        live[f'{kind}s'] = [item for item in items if 'pull_request' not in item]
+    return live
+
+def issue_key(title: str) -> str:
+    """Issues are matched by ISSUE-NNNN number when the title has one, else by title"""
+    number = parse_issue_number(title)
+    return f'ISSUE-{number}' if number is not None else title
+
+def label_changes(desired: Dict, live: Dict) -> Dict:
+    changes = {}
+    if desired.get('color') and desired['color'].lower() != (live.get('color') or '').lower():
+        changes['color'] = (live.get('color'), desired['color'])
+    if desired.get('description') is not None and desired['description'] != (live.get('description') or ''):
+        changes['description'] = (live.get('description'), desired['description'])
+    return changes
+
+def milestone_changes(desired: Dict, live: Dict) -> Dict:
+    changes = {}
+    if desired.get('description') is not None and desired['description'] != (live.get('description') or ''):
+        changes['description'] = (live.get('description'), desired['description'])
+    # GitHub stores due dates at a fixed time of day, so only the date is compared
+    if desired.get('due_on') and desired['due_on'][:10] != (live.get('due_on') or '')[:10]:
+        changes['due_on'] = (live.get('due_on'), desired['due_on'])
+    return changes
+
+def issue_changes(desired: Dict, live: Dict) -> Dict:
+    # Bodies are only written on create - hierarchy_annotator owns part of them
+    # afterwards - and labels added by hand are kept, except stale values of
+    # the managed xp- / coins- / sprint- labels
+    changes = {}
+    if desired['title'] != live['title']:
+        changes['title'] = (live['title'], desired['title'])
+    live_labels = [label['name'] for label in live.get('labels', [])]
+    replaced = tuple(prefix for prefix in MANAGED_LABEL_PREFIXES
+                     if any(name.startswith(prefix) for name in desired['labels']))
+    kept = [name for name in live_labels
+            if name in desired['labels'] or not name.startswith(replaced)]
+    labels = kept + [name for name in desired['labels'] if name not in kept]
+    if set(labels) != set(live_labels):
+        changes['labels'] = (live_labels, labels)
+    return changes
+
+def plan(desired: Dict, live: Dict) -> List[Dict]:
+    """Actions that bring `live` to `desired`
+
+    `desired` holds 'labels' ({'name', optional 'color' / 'description'}),
+    'milestones' ({'title', 'description', optional 'due_on'}) and 'issues'
+    (bulk engine jobs). Each action is {'kind', 'op', 'key', 'spec', 'live',
+    'changes'}; fields a spec leaves out are never compared.
+    """
+    actions = []
+    sources = (
+        ('label', desired.get('labels', []), live['labels'], lambda item: item['name'], label_changes),
+        ('milestone', desired.get('milestones', []), live['milestones'], lambda item: item['title'], milestone_changes),
+        ('issue', desired.get('issues', []), live['issues'], lambda item: issue_key(item['title']), issue_changes)
+    )
+
+    for kind, specs, live_items, key_of, compare in sources:
+        existing = {}
+        for item in sorted(live_items, key=lambda item: item.get('number', 0)):
+            existing.setdefault(key_of(item), item)
+
+        seen = set()
+        for spec in specs:
+            key = key_of(spec)
+            if key in seen:
+                continue
+            seen.add(key)
+            if key not in existing:
+                actions.append({'kind': kind, 'op': 'create', 'key': key, 'spec': spec,
+                                'live': None, 'changes': {}})
+                continue
+            changes = compare(spec, existing[key])
+            if changes:
+                actions.append({'kind': kind, 'op': 'update', 'key': key, 'spec': spec,
+                                'live': existing[key], 'changes': changes})
+    return actions
+
+def print_plan(actions: List[Dict], desired: Dict):
+    """Print every pending action and a one-line summary"""
+    total = sum(len(desired.get(f'{kind}s', [])) for kind in KINDS)
+    creates = sum(1 for action in actions if action['op'] == 'create')
+    updates = len(actions) - creates
+
+    for action in actions:
+        line = f"  {SYMBOLS[action['op']]} {action['kind']} {action['key']}"
+        if action['changes']:
+            line += f" ({', '.join(sorted(action['changes']))})"
+        print(line)
+    print(f"Plan: {creates} to create, {updates} to update, {total - len(actions)} unchanged")
+
+def apply(actions: List[Dict], client: Optional[GitHubClient] = None,
+          concurrency: int = CONCURRENCY) -> Dict[str, int]:
+    """Carry out a plan; labels and milestones go first so issues can use them
+
+    Returns counts of created, updated and failed actions.
+    """
+    client = client or get_client()
+    counts = {'created': 0, 'updated': 0, 'failed': 0}
+
+    def send(action: Dict) -> bool:
+        spec, changes = action['spec'], action['changes']
+        try:
+            if action['kind'] == 'label':
+                if action['op'] == 'create':
+                    response = client.post('/labels', json={key: spec[key] for key in ('name', 'color', 'description')
+                                                            if spec.get(key) is not None})
+                else:
+                    response = client.patch(f"/labels/{quote(action['live']['name'], safe='')}",
+                                            json={field: new for field, (old, new) in changes.items()})
+            elif action['kind'] == 'milestone':
+                if action['op'] == 'create':
+                    response = client.post('/milestones', json=dict(spec, state='open'))
+                else:
+                    response = client.patch(f"/milestones/{action['live']['number']}",
+                                            json={field: new for field, (old, new) in changes.items()})
+            else:
+                response = client.patch(f"/issues/{action['live']['number']}",
+                                        json={field: new for field, (old, new) in changes.items()})
+            return response.status_code in (200, 201)
+        except Exception as e:
+            print(f"  Error applying {action['kind']} {action['key']}: {e}")
+            return False
+
+    for kind in KINDS:
+        batch = [action for action in actions if action['kind'] == kind]
+        direct = [action for action in batch if not (kind == 'issue' and action['op'] == 'create')]
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            for action, ok in zip(direct, pool.map(send, direct)):
+                symbol = SYMBOLS[action['op']]
+                if ok:
+                    counts['created' if action['op'] == 'create' else 'updated'] += 1
+                    print(f"  ✓ {symbol} {kind} {action['key']}")
+                else:
+                    counts['failed'] += 1
+                    print(f"  ✗ {symbol} {kind} {action['key']}")
+
+        # New issues go through the journaled bulk engine
+        jobs = [action['spec'] for action in batch if action['op'] == 'create' and kind == 'issue']
+        if jobs:
+            for result in create_issues_bulk(jobs, concurrency=concurrency, client=client):
+                counts['created' if result['issue'] else 'failed'] += 1
+
+    return counts
+
+def reconcile(desired: Dict, client: Optional[GitHubClient] = None,
+              dry_run: bool = False) -> Dict[str, int]:
+    """Read, plan, print and (unless dry_run) apply in one call"""
+    client = client or get_client()
+    kinds = [kind for kind in KINDS if desired.get(f'{kind}s')]
+    actions = plan(desired, read_live_state(client, kinds))
+    print_plan(actions, desired)
+    if dry_run or not actions:
+        return {'created': 0, 'updated': 0, 'failed': 0}
+    return apply(actions, client)
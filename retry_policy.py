@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Retry classification, backoff and budget for GitHub requests
+Decides which failures are worth another attempt (5xx, 429, secondary-limit
+403s, dropped connections), how long to back off with full jitter, and caps
+retries with a budget refilled by successful requests so an outage cannot
+turn into a retry storm
+"""
+
+import random
+import threading
+from typing import Optional
+
+import requests
+
+from rate_governor import is_secondary_limit
+
+# Attempts after the first one for a single request
+MAX_RETRIES = 5
+
+# Backoff before retry n is uniform in [0, min(BACKOFF_CAP, BACKOFF_BASE * 2**n)]
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+
+# Every success earns BUDGET_RATIO retries, up to BUDGET_MAX banked; a run
+# starts with BUDGET_MAX so early blips are still retried
+BUDGET_RATIO = 0.1
+BUDGET_MAX = 20.0
+
+SERVER_ERRORS = {500, 502, 503, 504}
+
+CONNECTION_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+# Failures GitHub rejects before doing any work - safe to retry even for writes
+REJECTED = {'rate-limited', 'secondary-limit'}
+
+def classify(response: Optional[requests.Response],
+             error: Optional[Exception] = None) -> Optional[str]:
+    """Why a request is worth retrying, or None if it is not"""
+    if error is not None:
+        return 'connection' if isinstance(error, CONNECTION_ERRORS) else None
+    if response.status_code == 429:
+        return 'rate-limited'
+    if response.status_code == 403:
+        if is_secondary_limit(response):
+            return 'secondary-limit'
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            return 'rate-limited'
+        return None
+    if response.status_code in SERVER_ERRORS:
+        return 'server-error'
+    return None
+
+class RetryPolicy:
+    """Thread-safe backoff and retry budget shared by every request on a client"""
+
+    def __init__(self, max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE,
+                 backoff_cap: float = BACKOFF_CAP, budget_ratio: float = BUDGET_RATIO,
+                 budget_max: float = BUDGET_MAX):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+
+        self.lock = threading.Lock()
+        self.budget = budget_max
+        self.retries = 0
+        self.exhausted = 0
+
+    def succeeded(self):
+        """Credit the budget for a request that needed no (more) retries"""
+        with self.lock:
+            self.budget = min(self.budget_max, self.budget + self.budget_ratio)
+
+    def allow(self, attempt: int) -> bool:
+        """Spend one retry from the budget if this request has attempts left"""
+        with self.lock:
+            if attempt >= self.max_retries or self.budget < 1:
+                self.exhausted += 1
+                return False
+            self.budget -= 1
+            self.retries += 1
+            return True
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to sleep before retry number `attempt` (0-based)
+
+        Limit rejections also wait out Retry-After or the budget reset in the
+        rate-limit governor before they are sent again.
+        """
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+NumPy reward ledger for the Shadowed Realms backlog
+Per-issue XP, coins and project value columns computed once for a whole
+backlog - base rewards from the issue_ranges tables, type multipliers applied
+in one vectorized pass - with prefix sums, so totals for any ISSUE range,
+epic or sprint are a difference of two cumulative sums instead of a loop
+over calculate_xp_coins
+Scales to million-issue what-if runs: every step is an array operation
+
+Usage: python3 reward_ledger.py [section]   (default: sprint1-complete)
+"""
+
+import sys
+from typing import List, Dict, Tuple, Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+from backlog_spec import issue_records
+from issue_ranges import RangeTable, BASE_REWARDS, SPRINT_EPICS
+
+# Project value of one coin, in dollars
+COIN_VALUE = 10
+
+# Coin multipliers by task type: the first rule whose keywords appear in the
+# type applies (assets are worth more than scripts, scripts more than the rest)
+TYPE_MULTIPLIERS: Tuple[Tuple[Tuple[str, ...], float], ...] = (
+    (('model', 'asset'), 1.5),
+    (('script', 'system'), 1.3)
+)
+
+def type_multiplier(task_type: str) -> float:
+    task_type = task_type.lower()
+    for keywords, multiplier in TYPE_MULTIPLIERS:
+        if any(keyword in task_type for keyword in keywords):
+            return multiplier
+    return 1.0
+
+def table_rewards(issue_nums: Sequence[int], types: Optional[Sequence[str]] = None,
+                  table: RangeTable = BASE_REWARDS) -> Tuple[np.ndarray, np.ndarray]:
+    """(xp, coins) arrays for issue numbers, in the order given"""
+    issue_nums = np.asarray(issue_nums, dtype=np.int64)
+    rows = np.asarray(table.indexes(issue_nums), dtype=np.int64)
+    if np.any(rows < 0):
+        missing = issue_nums[rows < 0]
+        raise ValueError(f'{len(missing)} issues outside the reward table, e.g. ISSUE {missing[0]}')
+    base = np.array(table.values, dtype=np.int64).reshape(-1, 2)[rows]
+    xp, coins = base[:, 0], base[:, 1]
+
+    if types is not None:
+        # One multiplier per distinct type, then a single gather
+        names, inverse = np.unique(np.asarray(types, dtype=str), return_inverse=True)
+        multipliers = np.array([type_multiplier(name) for name in names])[inverse]
+        coins = np.where(multipliers != 1.0, (coins * multipliers).astype(np.int64), coins)
+    return xp, coins
+
+class RewardLedger:
+    """Reward columns in ISSUE order plus their prefix sums"""
+
+    def __init__(self, issue_nums: Sequence[int], xp: Sequence[int], coins: Sequence[int]):
+        issue_nums = np.asarray(issue_nums, dtype=np.int64)
+        order = np.argsort(issue_nums, kind='stable')
+        self.issue_nums = issue_nums[order]
+        if np.any(np.diff(self.issue_nums) == 0):
+            raise ValueError('duplicate issue numbers in ledger')
+        xp = np.asarray(xp, dtype=np.int64)[order]
+        coins = np.asarray(coins, dtype=np.int64)[order]
+        self.columns = {'xp': xp, 'coins': coins, 'value': coins * COIN_VALUE}
+        # prefix[column][i] is the total of the first i issues
+        self.prefix = {name: np.concatenate(([0], np.cumsum(column)))
+                       for name, column in self.columns.items()}
+        # Contiguous numbering turns position lookups into plain arithmetic
+        self.first = int(self.issue_nums[0]) if len(self.issue_nums) else 0
+        self.dense = len(self.issue_nums) == 0 or \
+            int(self.issue_nums[-1]) - self.first + 1 == len(self.issue_nums)
+
+    @classmethod
+    def from_table(cls, issue_nums: Sequence[int], types: Optional[Sequence[str]] = None,
+                   table: RangeTable = BASE_REWARDS) -> 'RewardLedger':
+        """Base (xp, coins) per issue from `table`, coins scaled by type multiplier
+
+        Matches calculate_xp_coins issue for issue; without `types` no
+        multiplier applies (its 'average' type).
+        """
+        return cls(issue_nums, *table_rewards(issue_nums, types, table))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'RewardLedger':
+        """Ledger for backlog records: their own 'xp' / 'coins' when they carry
+        them, BASE_REWARDS and their 'type' otherwise"""
+        nums, types, xp, coins = [], [], [], []
+        for record in records:
+            nums.append(record['num'])
+            types.append(record.get('type', ''))
+            xp.append(record.get('xp', -1))
+            coins.append(record.get('coins', -1))
+        nums, types = np.array(nums, dtype=np.int64), np.array(types, dtype=str)
+        xp, coins = np.array(xp, dtype=np.int64), np.array(coins, dtype=np.int64)
+        derived = xp < 0
+        if np.any(derived):
+            xp[derived], coins[derived] = table_rewards(nums[derived], types[derived])
+        return cls(nums, xp, coins)
+
+    def __len__(self) -> int:
+        return len(self.issue_nums)
+
+    def positions(self, bounds, right: bool = False) -> np.ndarray:
+        """Number of ledger issues below each bound (at or below with right=True)"""
+        bounds = np.asarray(bounds)
+        if bounds.dtype.kind == 'f':
+            # Open-ended table bounds (float('-inf') / float('inf'))
+            bounds = np.clip(bounds, -2**62, 2**62)
+        bounds = bounds.astype(np.int64)
+        if self.dense:
+            return np.clip(bounds - self.first + (1 if right else 0), 0, len(self))
+        return np.searchsorted(self.issue_nums, bounds, side='right' if right else 'left')
+
+    def rewards(self, issue_num: int) -> Dict[str, int]:
+        i = int(self.positions(issue_num))
+        if i >= len(self) or self.issue_nums[i] != issue_num:
+            raise KeyError(issue_num)
+        return {name: int(column[i]) for name, column in self.columns.items()}
+
+    def total(self, column: str = 'xp') -> int:
+        return int(self.prefix[column][-1])
+
+    def range_total(self, first: int, last: int, column: str = 'xp') -> int:
+        """Total over ISSUE first..last (inclusive)"""
+        return int(self.range_totals([first], [last], column)[0])
+
+    def range_totals(self, firsts: Sequence[int], lasts: Sequence[int], column: str = 'xp') -> np.ndarray:
+        """range_total for many ranges at once"""
+        prefix = self.prefix[column]
+        return prefix[self.positions(lasts, right=True)] - prefix[self.positions(firsts)]
+
+    def table_totals(self, table: RangeTable, column: str = 'xp') -> Dict[Any, int]:
+        """Totals per value of a range table, e.g. per epic"""
+        totals = dict.fromkeys(table.values, 0)
+        for value, total in zip(table.values, self.range_totals(table.firsts, table.lasts, column)):
+            totals[value] += int(total)
+        return totals
+
+    def by_epic(self, column: str = 'xp') -> Dict[str, int]:
+        return self.table_totals(SPRINT_EPICS, column)
+
+    def sprint_prefix(self, sprints: Sequence[Sequence[int]], column: str = 'xp') -> np.ndarray:
+        """Running total through each sprint of a plan (lists of issue numbers),
+        so the reward earned by the end of sprint k - or between two sprints -
+        is one lookup"""
+        if not len(sprints):
+            return np.zeros(0, dtype=np.int64)
+        issues = np.concatenate([np.asarray(sprint, dtype=np.int64) for sprint in sprints])
+        positions = self.positions(issues)
+        if np.any(positions >= len(self)) or np.any(self.issue_nums[np.minimum(positions, len(self) - 1)] != issues):
+            raise ValueError('sprint plan holds issues that are not in the ledger')
+        running = np.concatenate(([0], np.cumsum(self.columns[column][positions])))
+        return running[np.cumsum([len(sprint) for sprint in sprints])]
+
+    def by_sprint(self, sprints: Sequence[Sequence[int]], column: str = 'xp') -> List[int]:
+        return np.diff(self.sprint_prefix(sprints, column), prepend=0).tolist()
+
+def backlog_ledger(*sections: str) -> RewardLedger:
+    """Ledger for sections of backlog_spec.json (default: sprint1-complete)"""
+    return RewardLedger.from_records(issue_records(*(sections or ('sprint1-complete',))))
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Reward Ledger")
+    print("=" * 60)
+
+    section = sys.argv[1] if len(sys.argv) > 1 else 'sprint1-complete'
+    try:
+        ledger = backlog_ledger(section)
+    except ValueError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    print(f"\n{section}: {len(ledger)} issues")
+    print(f"Total XP Pool: {ledger.total('xp'):,}")
+    print(f"Total Coins: {ledger.total('coins'):,}")
+    print(f"Total Financial Value: ${ledger.total('value'):,}")
+
+    epics = ledger.by_epic('xp')
+    coins = ledger.by_epic('coins')
+    if any(epics.values()):
+        print("\nBy epic:")
+        for epic, xp in epics.items():
+            if xp:
+                print(f"  {epic}: {xp:,} XP, {coins[epic]:,} coins")
+
+if __name__ == "__main__":
+    main()
@@ -6,29 +6,17 @@ Links repository, organization, milestones, and issues
 
 import os
 import json
-import requests
-import time
 
-# GitHub configuration
-GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+from github_client import GITHUB_TOKEN, GITHUB_OWNER, GITHUB_REPO, get_client
+from project_linker import link_all_issues
+
+# GitHub configuration - token is read by the shared pooled client
 if not GITHUB_TOKEN:
     print("Error: GITHUB_TOKEN environment variable not set")
     exit(1)
 
-GITHUB_OWNER = 'michael-placeholder'
-GITHUB_REPO = 'shadowed-realms'
-GITHUB_API_URL = f'https://api.github.com'
-
-headers = {
-    'Authorization': f'token {GITHUB_TOKEN}',
-    'Accept': 'application/vnd.github.v3+json'
-}
-
-# GraphQL headers for project board operations
-graphql_headers = {
-    'Authorization': f'Bearer {GITHUB_TOKEN}',
-    'Content-Type': 'application/json'
-}
+# REST and GraphQL operations share one pooled session
+client = get_client()
 
 def get_repository_id():
     """Get repository node ID for GraphQL operations"""
@@ -40,11 +28,7 @@ def get_repository_id():
     }
     """ % (GITHUB_OWNER, GITHUB_REPO)
     
-    response = requests.post(
-        f'{GITHUB_API_URL}/graphql',
-        json={'query': query},
-        headers=graphql_headers
-    )
+    response = client.graphql(query)
     
     if response.status_code == 200:
         data = response.json()
@@ -74,11 +58,7 @@ def create_project_board():
     }
     """ % repo_id
     
-    response = requests.post(
-        f'{GITHUB_API_URL}/graphql',
-        json={'query': mutation},
-        headers=graphql_headers
-    )
+    response = client.graphql(mutation)
     
     if response.status_code == 200:
         data = response.json()
@@ -105,11 +85,7 @@ def get_existing_project():
     }
     """ % (GITHUB_OWNER, GITHUB_REPO)
     
-    response = requests.post(
-        f'{GITHUB_API_URL}/graphql',
-        json={'query': query},
-        headers=graphql_headers
-    )
+    response = client.graphql(query)
     
     if response.status_code == 200:
         data = response.json()
@@ -182,55 +158,15 @@ def add_project_fields(project_id):
     return True
 
 def link_issues_to_project(project_id):
-    """Link repository issues to the project board"""
-    # Get first 100 issues
-    issues_response = requests.get(
-        f'{GITHUB_API_URL}/repos/{GITHUB_OWNER}/{GITHUB_REPO}/issues?per_page=100&state=open',
-        headers=headers
-    )
-    
-    if issues_response.status_code != 200:
-        print("Failed to get issues")
-        return False
+    """Link every repository issue to the project board"""
+    # Pages through all issues, skips items already on the board and sends
+    # the add-item mutations in batches
+    counts = link_all_issues(project_id, client)
     
-    issues = issues_response.json()
-    print(f"Found {len(issues)} issues to link...")
-    
-    linked_count = 0
-    for issue in issues[:10]:  # Link first 10 to avoid rate limits
-        # Get issue node ID
-        issue_id = issue.get('node_id')
-        if not issue_id:
-            continue
-        
-        # Add issue to project
-        mutation = """
-        mutation {
-          addProjectV2ItemById(input: {
-            projectId: "%s",
-            contentId: "%s"
-          }) {
-            item {
-              id
-            }
-          }
-        }
-        """ % (project_id, issue_id)
-        
-        response = requests.post(
-            f'{GITHUB_API_URL}/graphql',
-            json={'query': mutation},
-            headers=graphql_headers
-        )
-        
-        if response.status_code == 200:
-            linked_count += 1
-            print(f"  ✓ Linked issue #{issue['number']}")
-        
-        time.sleep(0.5)  # Rate limiting
-    
-    print(f"Successfully linked {linked_count} issues to project board")
-    return True
+    print(f"Successfully linked {counts['linked']} issues to project board")
+    if counts['failed']:
+        print(f"Failed to link {counts['failed']} issues")
+    return counts['failed'] == 0
 
 def create_project_views(project_id):
     """Create different views for the project board"""
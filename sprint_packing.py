@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Sprint packing engine for the time-based sprint plan
+Packs issues, given in plan order with their hours of effort, into sprints of
+a fixed capacity with a selectable strategy:
+  next-fit  - plan order kept; a sprint closes when the next issue doesn't fit
+  lookahead - each sprint's slack is filled with the earliest issues that fit
+              among the next SPRINT_LOOKAHEAD ones, prerequisites first
+  balanced  - next-fit's sprint count, which is already the fewest possible
+              without reordering, with the slack spread evenly over the
+              sprints by a dynamic program instead of piling up at the
+              sprint boundaries; only lookahead can save sprints
+Every plan reports its wasted capacity (sprint hours left unused) and the
+lower bound on its sprint count
+Set SPRINT_STRATEGY / SPRINT_LOOKAHEAD to change what the sprint plan uses
+
+Usage: python3 sprint_packing.py [strategy ...]   (default: every strategy)
+"""
+
+import os
+import sys
+import math
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate
+from typing import List, Dict, Iterable, Optional, Sequence
+
+from issue_effort import get_issue_effort
+
+SPRINT_STRATEGY = os.getenv('SPRINT_STRATEGY', 'next-fit')
+SPRINT_LOOKAHEAD = int(os.getenv('SPRINT_LOOKAHEAD', '100'))
+
+# Tolerance for comparing sums of hours against a sprint's capacity
+EPSILON = 1e-9
+
+def next_fit(hours: Sequence[float], capacity: float) -> List[List[int]]:
+    """Positions per sprint, in plan order; each sprint boundary is found by
+    binary search over the running hours instead of issue by issue"""
+    prefix = list(accumulate(hours, initial=0.0))
+    sprints, start = [], 0
+    while start < len(hours):
+        # An issue larger than a whole sprint still gets a sprint of its own
+        end = max(start + 1, bisect_right(prefix, prefix[start] + capacity + EPSILON) - 1)
+        sprints.append(list(range(start, end)))
+        start = end
+    return sprints
+
+def lookahead_fill(hours: Sequence[float], capacity: float, lookahead: int = SPRINT_LOOKAHEAD,
+                   prerequisites: Optional[Dict[int, List[int]]] = None) -> List[List[int]]:
+    """Positions per sprint, filling each sprint with the earliest issue that
+    fits, at most `lookahead` places past the earliest unplanned one
+
+    An issue is only taken once its prerequisites (positions) are planned in
+    the same or an earlier sprint. Issues wait in one queue per distinct
+    number of hours, so a pick costs the number of distinct estimates.
+    """
+    prerequisites = prerequisites or {}
+    n = len(hours)
+    sizes = sorted(set(hours))
+    queues = {size: deque() for size in sizes}
+    sprint_of = [0] * n
+    sprints, head, admitted = [], 0, 0
+
+    while head < n:
+        number = len(sprints) + 1
+        sprint, room = [], capacity
+        while True:
+            # Admit the issues that entered the window
+            while admitted < n and admitted <= head + lookahead:
+                queues[hours[admitted]].append(admitted)
+                admitted += 1
+
+            pick = None
+            for size in sizes[:bisect_right(sizes, room + EPSILON)]:
+                for k, position in enumerate(queues[size]):
+                    if pick is not None and position > pick[1]:
+                        break
+                    if all(0 < sprint_of[p] <= number for p in prerequisites.get(position, ())):
+                        pick = (size, position, k)
+                        break
+            if pick is None:
+                if sprint:
+                    break
+                # Nothing fits or is ready: the earliest issue goes in alone
+                pick = (hours[head], head, queues[hours[head]].index(head))
+
+            size, position, k = pick
+            del queues[size][k]
+            sprint_of[position] = number
+            sprint.append(position)
+            room -= size
+            while head < n and sprint_of[head]:
+                head += 1
+        sprints.append(sorted(sprint))
+    return sprints
+
+def balanced(hours: Sequence[float], capacity: float) -> List[List[int]]:
+    """Positions per sprint of an order-preserving plan with next-fit's sprint
+    count and, among those, the smallest sum of squared slack over all but the
+    last - it rebalances slack, it does not save sprints
+
+    dp over plan prefixes: the sprint counts never decrease along the plan, so
+    only the last sprint's possible starts within one capacity are tried.
+    """
+    n = len(hours)
+    prefix = list(accumulate(hours, initial=0.0))
+    count, cost, parent = [0] * (n + 1), [0.0] * (n + 1), [0] * (n + 1)
+    starts = [0]  # starts[c]: first prefix length planned in c sprints
+    lo = 0
+    for i in range(1, n + 1):
+        while lo < i - 1 and prefix[i] - prefix[lo] > capacity + EPSILON:
+            lo += 1
+        fewest = count[lo] + 1
+        # Starts that keep the count minimal: every j whose count equals count[lo]
+        end = starts[fewest] if fewest < len(starts) else i
+        best, best_j = math.inf, lo
+        for j in range(lo, end):
+            slack = capacity - (prefix[i] - prefix[j])
+            total = cost[j] + (slack * slack if i < n else 0.0)
+            if total < best:
+                best, best_j = total, j
+        count[i], cost[i], parent[i] = fewest, best, best_j
+        if fewest == len(starts):
+            starts.append(i)
+
+    sprints, i = [], n
+    while i:
+        sprints.append(list(range(parent[i], i)))
+        i = parent[i]
+    return sprints[::-1]
+
+STRATEGIES = {
+    'next-fit': next_fit,
+    'lookahead': lookahead_fill,
+    'balanced': balanced
+}
+
+def prerequisite_positions(issues: Sequence[int],
+                           requires: Dict[int, Iterable[int]]) -> Dict[int, List[int]]:
+    """requires (issue -> prerequisite issues) as plan positions; prerequisites
+    outside the plan are ignored"""
+    position = {issue_num: i for i, issue_num in enumerate(issues)}
+    return {position[issue_num]: [position[p] for p in prereqs if p in position]
+            for issue_num, prereqs in requires.items() if issue_num in position}
+
+def pack(issues: Sequence[int], hours: Sequence[float], capacity: float = 20,
+         strategy: str = SPRINT_STRATEGY, lookahead: int = SPRINT_LOOKAHEAD,
+         requires: Optional[Dict[int, Iterable[int]]] = None) -> Dict:
+    """Sprint plan for issues in plan order with their hours of effort
+
+    The order-preserving strategies assume prerequisites come earlier in plan
+    order; `requires` (issue -> prerequisite issues) constrains the lookahead.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"unknown packing strategy {strategy!r} (available: {', '.join(STRATEGIES)})")
+    if strategy == 'lookahead':
+        positions = lookahead_fill(hours, capacity, lookahead,
+                                   prerequisite_positions(issues, requires) if requires else None)
+    else:
+        positions = STRATEGIES[strategy](hours, capacity)
+
+    sprints = []
+    for number, sprint in enumerate(positions, 1):
+        total_hours = 0
+        for i in sprint:
+            total_hours += hours[i]
+        sprints.append({
+            'number': number,
+            'issues': [issues[i] for i in sprint],
+            'total_hours': total_hours,
+            'week': number
+        })
+
+    total_hours = sum(hours)
+    return {
+        'strategy': strategy,
+        'capacity': capacity,
+        'sprints': sprints,
+        'total_hours': total_hours,
+        'wasted_hours': sum(max(0, capacity - sprint['total_hours']) for sprint in sprints),
+        'lower_bound': math.ceil(total_hours / capacity - EPSILON)
+    }
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Sprint Packing")
+    print("=" * 60)
+
+    strategies = sys.argv[1:] or list(STRATEGIES)
+    unknown = [name for name in strategies if name not in STRATEGIES]
+    if unknown:
+        print(f"✗ unknown packing strategy: {', '.join(unknown)} (available: {', '.join(STRATEGIES)})")
+        sys.exit(1)
+
+    effort = get_issue_effort()
+    issues, hours = list(effort), effort.efforts()
+    print(f"\n{len(issues)} issues, {sum(hours):,.1f} hours, 20-hour sprints")
+    for strategy in strategies:
+        plan = pack(issues, hours, 20, strategy)
+        print(f"  {strategy}: {len(plan['sprints'])} sprints "
+              f"(lower bound {plan['lower_bound']}), {plan['wasted_hours']:,.1f} hours wasted")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Multi-developer scheduler for the time-based sprint plan
+team.json lists each developer's weekly hours and skill tags - the issue
+types (3d-modeling, setup, ...) they take on. Issues are scheduled in plan
+order, and each one depends on the one before it (issue bodies list
+"Requires: Issues N-10 to N-1"), so no issue starts in an earlier week than
+its predecessor: each week takes the next issues of the plan, each going to
+the skilled developer with the most hours left that week, and the week
+closes once the next issue fits nobody who can take it
+Issues whose type nobody lists can go to anyone
+
+Usage: python3 team_scheduler.py
+"""
+
+import os
+import json
+import math
+from typing import List, Dict, Tuple, Optional, Sequence
+
+from backlog_spec import issue_records
+from issue_effort import get_issue_effort
+from sprint_packing import EPSILON
+
+TEAM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'team.json')
+
+# Backlog section whose records carry the type label of each planned issue
+TYPE_SECTION = 'sprint1-complete'
+
+def load_team(path: str = TEAM_PATH) -> List[Dict]:
+    with open(path, encoding='utf-8') as f:
+        team = json.load(f)['members']
+    for member in team:
+        if member['weekly_hours'] <= 0:
+            raise ValueError(f"{member['name']} needs positive weekly_hours")
+    return team
+
+def issue_types(section: str = TYPE_SECTION) -> Dict[int, str]:
+    """Type label per ISSUE number, from a section of the backlog spec"""
+    return {record['num']: record.get('type', '') for record in issue_records(section)}
+
+def eligible_members(team: List[Dict]) -> Dict[str, Tuple[int, ...]]:
+    """Team positions per skill tag"""
+    eligible: Dict[str, Tuple[int, ...]] = {}
+    for k, member in enumerate(team):
+        for skill in member['skills']:
+            eligible[skill] = eligible.get(skill, ()) + (k,)
+    return eligible
+
+def assign_weeks(issues: Sequence[int], hours: Sequence[float], types: Dict[int, str],
+                 team: List[Dict]) -> Tuple[List[Tuple[int, int]], List[str]]:
+    """(week, developer) per plan position, plus the types nobody lists
+
+    Weeks never decrease along the plan. Within a week an issue goes to the
+    eligible developer with the most hours left, ties to the first listed; an
+    issue larger than a whole week still goes to a developer with an empty
+    week. When it fits nobody eligible, the next week starts.
+    """
+    everyone = tuple(range(len(team)))
+    eligible = eligible_members(team)
+    weekly = [member['weekly_hours'] for member in team]
+
+    placed = []
+    unmatched = set()
+    week = 1
+    room = list(weekly)
+    for i, issue_num in enumerate(issues):
+        issue_type = types.get(issue_num, '')
+        candidates = eligible.get(issue_type)
+        if candidates is None:
+            candidates = everyone
+            unmatched.add(issue_type)
+        while True:
+            k = max(candidates, key=lambda k: (room[k], -k))
+            if hours[i] <= room[k] + EPSILON:
+                break
+            idle = [k for k in candidates if room[k] == weekly[k]]
+            if idle:
+                k = idle[0]
+                break
+            week += 1
+            room = list(weekly)
+        room[k] -= hours[i]
+        placed.append((week, k))
+    return placed, sorted(unmatched)
+
+def schedule(issues: Sequence[int], hours: Sequence[float], types: Dict[int, str],
+             team: List[Dict]) -> Dict:
+    """Per-developer sprints and the combined weekly plan"""
+    placed, unmatched = assign_weeks(issues, hours, types, team)
+    completion_week = placed[-1][0] if placed else 0
+
+    # sprints[k][week]: issues and hours of developer k in that week
+    sprints: List[Dict[int, Dict]] = [{} for _ in team]
+    for i, (week, k) in enumerate(placed):
+        sprint = sprints[k].setdefault(week, {'issues': [], 'total_hours': 0})
+        sprint['issues'].append(issues[i])
+        sprint['total_hours'] += hours[i]
+
+    members = []
+    for member, lane in zip(team, sprints):
+        lane_hours = sum(sprint['total_hours'] for sprint in lane.values())
+        members.append({**member, 'plan': {
+            'capacity': member['weekly_hours'],
+            'sprints': [{'number': number, 'issues': lane[week]['issues'],
+                         'total_hours': lane[week]['total_hours'], 'week': week}
+                        for number, week in enumerate(sorted(lane), 1)],
+            'total_hours': lane_hours,
+            # Weeks a developer waits on the plan count as unused capacity
+            'wasted_hours': member['weekly_hours'] * completion_week - lane_hours
+        }})
+
+    weeks = []
+    for week in range(1, completion_week + 1):
+        active = {member['name']: lane[week] for member, lane in zip(team, sprints) if week in lane}
+        weeks.append({
+            'number': week,
+            'issues': sorted(issue_num for sprint in active.values() for issue_num in sprint['issues']),
+            'total_hours': sum(sprint['total_hours'] for sprint in active.values()),
+            'week': week,
+            'members': {name: sprint['total_hours'] for name, sprint in active.items()}
+        })
+
+    total_hours = sum(hours)
+    capacity = sum(member['weekly_hours'] for member in team)
+    return {
+        'members': members,
+        'weeks': weeks,
+        'completion_week': completion_week,
+        'total_hours': total_hours,
+        'wasted_hours': capacity * completion_week - total_hours,
+        'lower_bound': math.ceil(total_hours / capacity - EPSILON) if capacity else 0,
+        'unmatched_types': unmatched
+    }
+
+def out_of_order(issues: Sequence[int], weeks: List[Dict]) -> List[int]:
+    """Issues scheduled in an earlier week than the issue before them in plan order"""
+    week_of = {issue_num: week['week'] for week in weeks for issue_num in week['issues']}
+    return [issue_num for previous, issue_num in zip(issues, issues[1:])
+            if week_of[issue_num] < week_of[previous]]
+
+def plan_team(team: Optional[List[Dict]] = None) -> Dict:
+    """schedule() for the planned issues (backlog_spec.json, "sprint-effort")"""
+    effort = get_issue_effort()
+    return schedule(list(effort), effort.efforts(), issue_types(), team or load_team())
+
+def main():
+    print("=" * 60)
+    print("SHADOWED REALMS - Team Scheduler")
+    print("=" * 60)
+
+    plan = plan_team()
+    print(f"\n{plan['total_hours']:,.1f} hours")
+    for member in plan['members']:
+        lane = member['plan']
+        print(f"  {member['name']}: {len(lane['sprints'])} weeks at {member['weekly_hours']}h, "
+              f"{lane['total_hours']:,.1f} hours, {lane['wasted_hours']:,.1f} wasted")
+    print(f"Completion: week {plan['completion_week']} (lower bound {plan['lower_bound']})")
+    if plan['unmatched_types']:
+        print(f"Types nobody lists (shared): {', '.join(plan['unmatched_types'])}")
+
+if __name__ == "__main__":
+    main()
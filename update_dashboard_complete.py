@@ -221,64 +221,9 @@ html = re.sub(
 
 # 5. Add Epic Rewards update function
 epic_rewards_js = """
-        function updateEpicRewards(closedIssues) {
-            // Epic 1: Issues 1-100
-            const epic1Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 1 && num <= 100;
-            }).length;
-            
-            // Epic 2: Issues 101-260
-            const epic2Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 101 && num <= 260;
-            }).length;
-            
-            // Epic 3: Issues 261-420
-            const epic3Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 261 && num <= 420;
-            }).length;
-            
-            // Epic 4: Issues 421-580
-            const epic4Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 421 && num <= 580;
-            }).length;
-            
-            // Epic 5: Issues 581-640 + 761-820
-            const epic5Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return (num >= 581 && num <= 640) || (num >= 761 && num <= 820);
-            }).length;
-            
-            // Epic 6: Issues 641-760
-            const epic6Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 641 && num <= 760;
-            }).length;
-            
-            // Epic 7: Issues 821-900
-            const epic7Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 821 && num <= 900;
-            }).length;
-            
-            // Epic 8: Issues 901-1000
-            const epic8Closed = closedIssues.filter(i => {
-                const num = parseInt(i.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return num >= 901 && num <= 1000;
-            }).length;
-            
-            // Update reward statuses
-            updateEpicRewardStatus(1, epic1Closed, 100);
-            updateEpicRewardStatus(2, epic2Closed, 160);
-            updateEpicRewardStatus(3, epic3Closed, 160);
-            updateEpicRewardStatus(4, epic4Closed, 160);
-            updateEpicRewardStatus(5, epic5Closed, 120);
-            updateEpicRewardStatus(6, epic6Closed, 120);
-            updateEpicRewardStatus(7, epic7Closed, 80);
-            updateEpicRewardStatus(8, epic8Closed, 100);
+        function updateEpicRewards(epics) {
+            // Closed counts per epic come precomputed in the dashboard snapshot
+            epics.forEach(epic => updateEpicRewardStatus(epic.epic, epic.closed, epic.total));
         }
         
         function updateEpicRewardStatus(epicNum, closed, total) {
@@ -303,23 +248,16 @@ html = re.sub(
     html
 )
 
-# 6. Update processIssues to sort in ascending order and call updateEpicRewards
+# 6. Update processIssues to show the task hierarchy and call updateEpicRewards
 process_issues_update = """
-            // Sort issues in ascending order by issue number
-            openIssues.sort((a, b) => {
-                const numA = parseInt(a.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                const numB = parseInt(b.title.match(/\\[ISSUE-(\\d+)\\]/)?.[1] || 0);
-                return numA - numB;
-            });
-            
-            // Display tasks with enhanced information (show first 10 in ascending order)
-            displayTasksWithHierarchy(openIssues.slice(0, 10));
+            // Display tasks with enhanced information (snapshot issues are already in ascending order)
+            displayTasksWithHierarchy(shownIssues);
             
             // Update epic rewards
-            updateEpicRewards(closedIssues);"""
+            updateEpicRewards(snapshot.epics);"""
 
 html = re.sub(
-    r'            // Display tasks with enhanced information\n            displayEnhancedTasks\(openIssues\.slice\(0, 10\)\);',
+    r'            // Display tasks with enhanced information\n            displayEnhancedTasks\(shownIssues\);',
     process_issues_update,
     html
 )